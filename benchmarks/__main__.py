@@ -0,0 +1,70 @@
+"""
+    python -m benchmarks run [--suite single batch ...] [--quick] [--output FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.10]
+
+compare exits with status 1 when any benchmark got slower than the threshold.
+"""
+
+import argparse
+import sys
+
+from benchmarks.harness import save, load, compare
+from benchmarks.suites import SUITES
+
+
+def _run(args) -> int:
+
+    results = []
+    for name in args.suite or list(SUITES):
+        for result in SUITES[name](quick=args.quick):
+            results.append(result)
+
+            error = '' if result.error is None else f'  error={result.error:.2e}'
+            print(f'{result.name:<36}{result.seconds * 1e6:>14.2f} us'
+                  f'{result.throughput:>16.0f} /s{error}')
+
+    if args.output:
+        save(results, args.output)
+        print(f'saved {len(results)} results to {args.output}')
+
+    return 0
+
+
+def _compare(args) -> int:
+
+    regressions = compare(load(args.baseline), load(args.current), args.threshold)
+
+    for r in regressions:
+        print(f'REGRESSION {r.name:<36}{r.baseline * 1e6:>12.2f} us -> '
+              f'{r.current * 1e6:>12.2f} us  ({r.ratio:.2f}x)')
+
+    if not regressions:
+        print(f'no regression above {args.threshold:.0%}')
+
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run benchmark suites')
+    run.add_argument('--suite', nargs='*', choices=sorted(SUITES))
+    run.add_argument('--quick', action='store_true', help='smaller sizes and grids')
+    run.add_argument('--output', help='JSON file to write results to')
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser('compare', help='flag regressions between two runs')
+    cmp.add_argument('baseline')
+    cmp.add_argument('current')
+    cmp.add_argument('--threshold', type=float, default=0.10,
+                     help='relative slowdown tolerated, default 0.10')
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Per-call cost of the normal cdf / pdf kernels, each result carrying its speedup
+against scipy.stats.norm on the same input. Registered as the 'kernels' suite:
+
+    python -m benchmarks run --suite kernels
+    python -m benchmarks.bench_math_kernels
+"""
+
+import numpy as np
+from scipy.stats import norm
+
+from src.pricers.math_kernels import norm_cdf, norm_pdf, norm_cdf_scalar, norm_pdf_scalar
+
+from benchmarks.harness import BenchmarkResult, measure
+
+
+def _against_scipy(name: str, kernel, reference, items: int = 1,
+                   **params) -> BenchmarkResult:
+
+    # the scipy call is timed for the ratio only, it is not a result of its own
+    baseline = measure(name, reference, items=items, min_time=.05, repeat=3)
+    result = measure(name, kernel, items=items, **params)
+
+    return BenchmarkResult(result.name, result.seconds, result.median, items, None,
+                           {**result.params, 'speedup': baseline.seconds / result.seconds})
+
+
+def math_kernels(quick: bool = False) -> list[BenchmarkResult]:
+
+    x = 0.3
+    results = [_against_scipy('kernels.cdf.scalar', lambda: norm_cdf_scalar(x),
+                              lambda: norm.cdf(x)),
+               _against_scipy('kernels.pdf.scalar', lambda: norm_pdf_scalar(x),
+                              lambda: norm.pdf(x))]
+
+    for n in ((1_000,) if quick else (1_000, 100_000)):
+        xs = np.random.default_rng(0).standard_normal(n)
+
+        results.append(_against_scipy(f'kernels.cdf.n={n}', lambda: norm_cdf(xs),
+                                      lambda: norm.cdf(xs), items=n, n=n))
+        results.append(_against_scipy(f'kernels.pdf.n={n}', lambda: norm_pdf(xs),
+                                      lambda: norm.pdf(xs), items=n, n=n))
+
+    return results
+
+
+if __name__ == '__main__':
+
+    print(f'{"case":<24}{"kernel (us)":>14}{"speedup":>10}')
+    for result in math_kernels():
+        print(f'{result.name:<24}{result.seconds * 1e6:>14.3f}'
+              f'{result.params["speedup"]:>9.1f}x')
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Callable
+import json
+import platform
+import statistics
+import time
+
+import numpy as np
+import scipy
+
+
+@dataclass(frozen = True, slots = True)
+class BenchmarkResult:
+    name: str
+    # seconds per call: best and median over the repeats
+    seconds: float
+    median: float
+    # work items per call (options priced, quotes inverted...), for throughput
+    items: int = 1
+    # accuracy of the measured configuration, e.g. |price - reference|
+    error: float | None = None
+    params: dict = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.items / self.seconds
+
+
+@dataclass(frozen = True, slots = True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def measure(name: str, fn: Callable[[], object], *, items: int = 1,
+            min_time: float = 0.2, repeat: int = 5, error: float | None = None,
+            **params) -> BenchmarkResult:
+
+    """
+    Times fn, calling it enough times per repeat to last about min_time seconds
+    (calibrated on one warm-up call), and keeps the best and median per-call times.
+    """
+
+    start = time.perf_counter()
+    fn()
+    once = max(time.perf_counter() - start, 1e-9)
+
+    number = max(1, int(min_time / once))
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+
+    return BenchmarkResult(name, min(timings), statistics.median(timings), items,
+                           error, params)
+
+
+def environment() -> dict:
+    return {'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor()}
+
+
+def save(results: list[BenchmarkResult], path: str) -> None:
+
+    payload = {'environment': environment(),
+               'results': {r.name: asdict(r) for r in results}}
+
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict[str, dict]:
+
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(baseline: dict[str, dict], current: dict[str, dict],
+            threshold: float = 0.10) -> list[Regression]:
+
+    """
+    Benchmarks present in both runs whose best time grew by more than threshold
+    (0.10 = 10% slower). Benchmarks only in one of the runs are ignored.
+    """
+
+    regressions = []
+
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name]['seconds'], current[name]['seconds']
+
+        if after > before * (1.0 + threshold):
+            regressions.append(Regression(name, before, after))
+
+    return regressions
@@ -0,0 +1,160 @@
+"""
+Benchmark cases, grouped by suite. Each suite returns BenchmarkResults; quick runs
+shrink batch sizes and convergence grids so the whole set takes a few seconds.
+"""
+
+from datetime import date
+import numpy as np
+
+from src import option, exercise, payoff
+from src.pricers.types import Market
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
+from src.pricers.binary_tree import BinaryTreePricer, TreeMethod
+from src.pricers.monte_carlo import MonteCarloPricer
+from src.pricers.characteristic import HestonCF
+from src.pricers.heston import HestonPricer
+
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.bench_math_kernels import math_kernels
+
+
+MARKET = Market(100.0, .05, date(2025, 1, 1), .02, .25)
+EXPIRY = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+CALL = option.Option(100.0, EXPIRY, payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+AMERICAN_PUT = option.Option(100.0,
+                             exercise.AmericanExercise(start=date(2025, 1, 1),
+                                                       expiry=date(2026, 1, 1)),
+                             payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+
+
+def _batch(n: int, seed: int = 0) -> BSBatchParameters:
+
+    rng = np.random.default_rng(seed)
+    return BSBatchParameters.from_arrays(strikes=rng.uniform(50.0, 150.0, n),
+                                         taus=rng.uniform(.05, 2.0, n),
+                                         directions=rng.choice([1, -1], n),
+                                         spots=100.0, vols=rng.uniform(.1, .6, n),
+                                         rates=.05, divs=.02)
+
+
+def single_option(quick: bool = False) -> list[BenchmarkResult]:
+
+    pricer = BlackScholesPricer()
+    target = pricer.price(CALL, MARKET)
+
+    return [measure('bs.price', lambda: pricer.price(CALL, MARKET)),
+            measure('bs.greeks', lambda: pricer.greeks(CALL, MARKET)),
+            measure('bs.implied_vol', lambda: pricer.implied_vol(CALL, MARKET, target))]
+
+
+def batch_throughput(quick: bool = False) -> list[BenchmarkResult]:
+
+    pricer = BlackScholesPricer()
+    sizes = (1_000, 10_000, 100_000) if quick else (1_000, 10_000, 100_000, 1_000_000)
+
+    results = []
+    for n in sizes:
+        params = _batch(n)
+        results.append(measure(f'bs.price_batch.n={n}',
+                               lambda: pricer.price_batch(params), items=n, n=n))
+        results.append(measure(f'bs.greeks_batch.n={n}',
+                               lambda: pricer.greeks_batch(params), items=n, n=n))
+
+    return results
+
+
+def implied_vol(quick: bool = False) -> list[BenchmarkResult]:
+
+    pricer = BlackScholesPricer()
+
+    results = []
+    for n in ((1_000, 10_000) if quick else (1_000, 10_000, 100_000)):
+        params = _batch(n, seed=1)
+        quotes = pricer.price_batch(params)
+
+        # repricing error: far out-of-the-money rows pin down prices, not vols
+        solved = pricer.implied_vol_batch(params, target_prices=quotes)
+        repriced = pricer.price_batch(BSBatchParameters(params.S, params.K, params.r,
+                                                        params.q, params.tau,
+                                                        params.is_call, solved.vols))
+        error = float(np.nanmax(np.abs(repriced - quotes)))
+
+        results.append(measure(f'bs.implied_vol_batch.n={n}',
+                               lambda: pricer.implied_vol_batch(params, target_prices=quotes),
+                               items=n, error=error, n=n))
+
+    return results
+
+
+def tree_convergence(quick: bool = False) -> list[BenchmarkResult]:
+
+    # american put error against a fine leisen-reimer tree
+    reference = BinaryTreePricer(steps=4001, method=TreeMethod.LEISEN_REIMER,
+                                 richardson=True).price(AMERICAN_PUT, MARKET)
+
+    steps = (50, 200) if quick else (50, 100, 200, 400, 800, 1600)
+
+    results = []
+    for method in TreeMethod:
+        for n in steps:
+            pricer = BinaryTreePricer(steps=n, method=method)
+            error = abs(pricer.price(AMERICAN_PUT, MARKET) - reference)
+
+            results.append(measure(f'tree.{method.name.lower()}.steps={n}',
+                                   lambda: pricer.price(AMERICAN_PUT, MARKET),
+                                   error=error, repeat=3, steps=n))
+
+    return results
+
+
+def mc_convergence(quick: bool = False) -> list[BenchmarkResult]:
+
+    # european call error against the closed form, plain and antithetic sampling
+    reference = BlackScholesPricer().price(CALL, MARKET)
+    paths = (10_000, 40_000) if quick else (10_000, 40_000, 160_000, 640_000)
+
+    results = []
+    for antithetic in (False, True):
+        for n in paths:
+            pricer = MonteCarloPricer(n_paths=n, seed=7, antithetic=antithetic)
+            estimate = pricer.simulate(CALL, MARKET)
+
+            name = f'mc.{"antithetic" if antithetic else "plain"}.paths={n}'
+            results.append(measure(name, lambda: pricer.price(CALL, MARKET),
+                                   error=abs(estimate.estimate - reference),
+                                   repeat=3, paths=n, std_error=estimate.std_error))
+
+    return results
+
+
+def heston_calibration(quick: bool = False) -> list[BenchmarkResult]:
+
+    # full surface fit from a distant starting point, error on the recovered v0
+    model = HestonCF(v0=.04, kappa=1.5, theta=.06, xi=.6, rho=-.65)
+    strikes, taus = np.meshgrid(np.linspace(70.0, 140.0, 15 if quick else 41),
+                                [.1, .25, .5, 1.0, 2.0, 3.0])
+    strikes, taus = strikes.ravel(), taus.ravel()
+
+    prices = np.empty(strikes.size)
+    for tau in np.unique(taus):
+        prices[taus == tau] = HestonPricer(model).price_strikes(strikes[taus == tau],
+                                                                tau, MARKET)
+
+    guess = HestonPricer(HestonCF(v0=.09, kappa=3.0, theta=.03, xi=.3, rho=-.2))
+    fit = guess.calibrate(strikes, taus, prices, MARKET)
+
+    return [measure(f'heston.calibrate.quotes={strikes.size}',
+                    lambda: guess.calibrate(strikes, taus, prices, MARKET),
+                    error=abs(fit.model.v0 - model.v0), repeat=3, quotes=strikes.size,
+                    evaluations=fit.evaluations)]
+
+
+SUITES = {
+    'single': single_option,
+    'batch': batch_throughput,
+    'iv': implied_vol,
+    'tree': tree_convergence,
+    'mc': mc_convergence,
+    'heston': heston_calibration,
+    'kernels': math_kernels,
+}
@@ -0,0 +1,203 @@
+import dataclasses
+from typing import Iterator, Sequence
+import numpy as np
+
+from src.option import Option
+from src.direction import Direction
+from src.exercise import (Exercise, ExerciseType, EuropeanExercise, AmericanExercise,
+                          BermudanExercise)
+from src.payoff import (Payoff, PayoffType, VanillaPayoff, AsianArithmeticPayoff,
+                        AsianGeometricPayoff, LookbackPayoff, DigitalPayoff, BarrierPayoff)
+from src.pricers.time_utils import year_fractions
+
+
+_PAYOFF_TYPES: dict[type, PayoffType] = {
+    VanillaPayoff: PayoffType.VANILLA,
+    AsianArithmeticPayoff: PayoffType.ASIAN_ARITHMETIC,
+    AsianGeometricPayoff: PayoffType.ASIAN_GEOMETRIC,
+    LookbackPayoff: PayoffType.LOOKBACK,
+    DigitalPayoff: PayoffType.DIGITAL,
+    BarrierPayoff: PayoffType.BARRIER,
+}
+
+_EXERCISE_TYPES: dict[type, ExerciseType] = {
+    EuropeanExercise: ExerciseType.EUROPEAN,
+    AmericanExercise: ExerciseType.AMERICAN,
+    BermudanExercise: ExerciseType.BERMUDAN,
+}
+
+
+def _first_exercise(exercise: Exercise):
+    # american windows open at start, other rules on their earliest date
+    if isinstance(exercise, AmericanExercise):
+        return exercise.start
+    return min(exercise.exercise_dates())
+
+
+@dataclasses.dataclass(frozen = True, slots = True, eq = False)
+class OptionBook:
+
+    """
+    Columnar book of options: one read-only numpy column per term, row i being the
+    i-th position. Payoff and exercise objects are interned: each distinct one is kept
+    once in payoffs / exercises and rows point at it through payoff_ids / exercise_ids,
+    so a book of many lines on few contract templates stays a handful of arrays.
+
+    Slicing with a slice gives zero-copy views; grouped() sorts once so that every
+    group is such a slice. Option objects are only built by to_options() / option(i).
+    """
+
+    strikes: np.ndarray          # float64
+    expiries: np.ndarray         # int64 date ordinals
+    starts: np.ndarray           # int64 ordinal of the first exercise date
+    directions: np.ndarray       # int8 Direction values
+    payoff_types: np.ndarray     # int8 PayoffType values
+    exercise_types: np.ndarray   # int8 ExerciseType values
+    payoff_ids: np.ndarray       # int32 rows of payoffs
+    exercise_ids: np.ndarray     # int32 rows of exercises
+    payoffs: tuple[Payoff, ...] = ()
+    exercises: tuple[Exercise, ...] = ()
+
+    def __post_init__(self):
+
+        n = len(self.strikes)
+
+        for field in dataclasses.fields(self)[:8]:
+            column = getattr(self, field.name)
+
+            if column.ndim != 1 or column.shape[0] != n:
+                raise ValueError(f'{field.name} must be a 1-D column of length {n}, '
+                                 f'got shape {column.shape}.')
+
+            if column.flags.writeable:
+                column = column.view()
+                column.flags.writeable = False
+                object.__setattr__(self, field.name, column)
+
+    @classmethod
+    def from_options(cls, options: Sequence[Option]) -> 'OptionBook':
+
+        n = len(options)
+        payoff_index: dict[Payoff, int] = {}
+        exercise_index: dict[Exercise, int] = {}
+
+        strikes = np.empty(n)
+        payoff_ids, exercise_ids = np.empty(n, dtype=np.int32), np.empty(n, dtype=np.int32)
+
+        for i, option in enumerate(options):
+
+            if type(option.payoff) not in _PAYOFF_TYPES:
+                raise ValueError(f'Unsupported payoff for OptionBook: '
+                                 f'{option.payoff.__class__.__name__}.')
+
+            if type(option.exercise) not in _EXERCISE_TYPES:
+                raise ValueError(f'Unsupported exercise for OptionBook: '
+                                 f'{option.exercise.__class__.__name__}.')
+
+            strikes[i] = option.strike
+            payoff_ids[i] = payoff_index.setdefault(option.payoff, len(payoff_index))
+            exercise_ids[i] = exercise_index.setdefault(option.exercise,
+                                                        len(exercise_index))
+
+        payoffs, exercises = tuple(payoff_index), tuple(exercise_index)
+
+        # per-template attributes, spread to rows with one gather each
+        expiry = np.array([e.expiry.toordinal() for e in exercises], dtype=np.int64)
+        start = np.array([_first_exercise(e).toordinal() for e in exercises],
+                         dtype=np.int64)
+        exercise_type = np.array([_EXERCISE_TYPES[type(e)].value for e in exercises],
+                                 dtype=np.int8)
+        direction = np.array([p.direction.value for p in payoffs], dtype=np.int8)
+        payoff_type = np.array([_PAYOFF_TYPES[type(p)].value for p in payoffs],
+                               dtype=np.int8)
+
+        return cls(strikes = strikes,
+                   expiries = expiry[exercise_ids],
+                   starts = start[exercise_ids],
+                   directions = direction[payoff_ids],
+                   payoff_types = payoff_type[payoff_ids],
+                   exercise_types = exercise_type[exercise_ids],
+                   payoff_ids = payoff_ids,
+                   exercise_ids = exercise_ids,
+                   payoffs = payoffs,
+                   exercises = exercises)
+
+    def __len__(self) -> int:
+        return self.strikes.shape[0]
+
+    def __getitem__(self, rows) -> 'OptionBook':
+
+        # slices are views, index arrays / masks gather copies. templates are shared
+        if isinstance(rows, (int, np.integer)):
+            raise TypeError('use option(i) to get a single Option from the book.')
+
+        return OptionBook(*(getattr(self, f.name)[rows]
+                            for f in dataclasses.fields(self)[:8]),
+                          payoffs = self.payoffs, exercises = self.exercises)
+
+    def option(self, i: int) -> Option:
+        return Option(float(self.strikes[i]), self.exercises[self.exercise_ids[i]],
+                      self.payoffs[self.payoff_ids[i]])
+
+    def to_options(self) -> list[Option]:
+        return [self.option(i) for i in range(len(self))]
+
+    def __iter__(self) -> Iterator[Option]:
+        return (self.option(i) for i in range(len(self)))
+
+    def supported_mask(self, pricer, market) -> np.ndarray:
+
+        """
+        Rows pricer.is_supported accepts against market. is_supported only looks at
+        the contract templates, so it runs once per distinct (payoff, exercise) pair.
+        """
+
+        pairs = self.payoff_ids.astype(np.int64) * len(self.exercises) + self.exercise_ids
+        unique, inverse = np.unique(pairs, return_inverse=True)
+
+        accepted = np.array([
+            pricer.is_supported(
+                Option(1.0, self.exercises[p % len(self.exercises)],
+                       self.payoffs[p // len(self.exercises)]),
+                market)
+            for p in unique], dtype=bool)
+
+        return accepted[inverse].reshape(-1)
+
+    def grouped(self, *columns: str) -> tuple['OptionBook', np.ndarray,
+                                             list[tuple[tuple, slice]]]:
+
+        """
+        Stable sort on the given columns (e.g. 'payoff_types', 'exercise_types').
+        Returns the sorted book, the permutation order such that
+        sorted_book = book[order], and (key, slice) per group: sorted_book[slice] is a
+        zero-copy view on the group.
+        """
+
+        if not columns:
+            raise ValueError('grouped needs at least one column name.')
+
+        keys = [getattr(self, name) for name in columns]
+        order = np.lexsort(keys[::-1])
+        book = self[order]
+
+        if len(book) == 0:
+            return book, order, []
+
+        sorted_keys = np.stack([getattr(book, name) for name in columns], axis=1)
+        breaks = np.flatnonzero((sorted_keys[1:] != sorted_keys[:-1]).any(axis=1)) + 1
+        bounds = np.concatenate(([0], breaks, [len(book)]))
+
+        groups = [(tuple(sorted_keys[lo].tolist()), slice(lo, hi))
+                  for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+        return book, order, groups
+
+    def taus(self, market) -> np.ndarray:
+
+        # year fractions to expiry under the market's day count, expired rows at 0
+        return np.maximum(0.0, year_fractions(market.today, self.expiries, market.basis))
+
+    @property
+    def is_call(self) -> np.ndarray:
+        return self.directions == Direction.CALL.value
@@ -0,0 +1,143 @@
+"""
+Business day calendars and the date ordinal helpers they run on. Kept outside the
+pricers package: contract terms (exercise schedules) roll their dates on them.
+"""
+
+from datetime import date
+from typing import Iterable
+import numpy as np
+
+# civil date arithmetic below counts days from the unix epoch, python from 0001-01-01
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def as_ordinals(dates) -> np.ndarray:
+
+    # dates, iterables of dates or ordinals already, to an int64 array
+    if isinstance(dates, date):
+        return np.array(dates.toordinal(), dtype=np.int64)
+
+    values = np.asarray(dates)
+    if values.dtype == object:
+        values = np.array([d.toordinal() for d in values.ravel()],
+                          dtype=np.int64).reshape(values.shape)
+
+    return values.astype(np.int64, copy=False)
+
+
+def ymd(ordinals: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    # proleptic gregorian civil date from a day count in integer arithmetic only
+    # (H. Hinnant's days_from_civil inverse), days shifted to eras starting March 1st
+    z = np.asarray(ordinals, dtype=np.int64) - _EPOCH_ORDINAL + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
+class BusinessCalendar:
+
+    """
+    Business days are weekmask days (Monday first) that are not holidays. A
+    cumulative count of business days is precomputed over an ordinal window and grown
+    on demand, so counts and adjustments are O(1) lookups per element.
+    """
+
+    def __init__(self, holidays: Iterable[date] = (),
+                 weekmask: tuple[bool, ...] = (True,) * 5 + (False,) * 2):
+
+        if len(weekmask) != 7 or not any(weekmask):
+            raise ValueError(f'weekmask must flag 7 weekdays, at least one open.')
+
+        self.holidays = np.unique(as_ordinals(list(holidays))).astype(np.int64)
+        self.weekmask = np.asarray(weekmask, dtype=bool)
+
+        # (start, end, cumulative, business) swapped as one tuple so readers on other
+        # threads never mix two windows. cumulative[i]: business days in
+        # [start, start + i); business[cumulative[i]]: first business day on or after
+        # start + i
+        self._window = (0, 0, np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def _ensure(self, lo: int, hi: int) -> tuple:
+
+        # window must cover [lo, hi] plus enough room to find neighbouring business days
+        window = self._window
+        start, end = window[0], window[1]
+
+        lo, hi = lo - 31, hi + 31
+        if end > start and start <= lo and hi <= end:
+            return window
+
+        if end > start:
+            lo, hi = min(lo, start), max(hi, end)
+
+        # grow by whole years to amortize rebuilds
+        lo, hi = lo - 366, hi + 366
+        ordinals = np.arange(lo, hi, dtype=np.int64)
+
+        # date.weekday() of ordinal o is (o - 1) % 7 with Monday = 0
+        open_days = self.weekmask[(ordinals - 1) % 7]
+        open_days &= ~np.isin(ordinals, self.holidays)
+
+        self._window = (lo, hi, np.concatenate(([0], np.cumsum(open_days))),
+                        ordinals[open_days])
+        return self._window
+
+    def _index(self, *dates) -> tuple:
+
+        ordinals = [as_ordinals(d) for d in dates]
+        lo = min((int(o.min()) for o in ordinals if o.size), default=None)
+
+        if lo is None:
+            window = self._window
+        else:
+            window = self._ensure(lo, max(int(o.max()) for o in ordinals if o.size))
+
+        return (window, *(o - window[0] for o in ordinals))
+
+    def is_business_day(self, dates) -> np.ndarray:
+        (_, _, cumulative, _), i = self._index(dates)
+        return cumulative[i + 1] > cumulative[i]
+
+    def business_days(self, start, end) -> np.ndarray:
+
+        # business days in [start, end), negative when end < start
+        (_, _, cumulative, _), i, j = self._index(start, end)
+        return cumulative[j] - cumulative[i]
+
+    def adjust(self, dates, convention: str = 'following') -> np.ndarray:
+
+        """
+        Rolls non-business days: 'following', 'preceding' or 'modified_following'
+        (following unless it changes month, then preceding). Returns ordinals.
+        """
+
+        (start, _, cumulative, business), i = self._index(dates)
+
+        following = business[cumulative[i]]
+        preceding = business[cumulative[i + 1] - 1]
+
+        if convention == 'following':
+            return following
+
+        if convention == 'preceding':
+            return preceding
+
+        if convention == 'modified_following':
+            _, month, _ = ymd(following)
+            _, original, _ = ymd(i + start)
+            return np.where(month == original, following, preceding)
+
+        raise ValueError(f'Unsupported business day convention: {convention}')
+
+
+# weekends only, used by BUS/252 when no calendar is given
+WEEKDAYS = BusinessCalendar()
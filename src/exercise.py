@@ -2,10 +2,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import datetime as dt
 from typing import Protocol
+import numpy as np
 import enum
 
-# TODO
-# make business days adjustments
+from src.calendars import BusinessCalendar
 
 class ExerciseType(enum.Enum):
     EUROPEAN = enum.auto()
@@ -21,7 +21,12 @@ class Exercise(ABC):
     @abstractmethod
     def exercise_dates(self) -> tuple[dt.date, ...]: ...
 
-    pass
+    def adjusted_exercise_dates(self, calendar: BusinessCalendar, 
+                                convention: str = 'following') -> tuple[dt.date, ...]:
+        
+        # contractual dates rolled onto business days, duplicates merged
+        rolled = calendar.adjust(self.exercise_dates(), convention)
+        return tuple(dt.date.fromordinal(int(o)) for o in sorted(set(rolled.tolist())))
 
 @dataclass(frozen=True, slots = True)
 class EuropeanExercise(Exercise):
@@ -47,6 +52,14 @@ class AmericanExercise(Exercise):
         return tuple(dt.date.fromordinal(o) for o in range(self.start.toordinal(), 
                                                            self.expiry.toordinal()+1))
     
+    # the window stays fixed, only its business days remain exercisable
+    def adjusted_exercise_dates(self, calendar: BusinessCalendar, 
+                                convention: str = 'following') -> tuple[dt.date, ...]:
+        
+        ordinals = np.arange(self.start.toordinal(), self.expiry.toordinal() + 1)
+        return tuple(dt.date.fromordinal(int(o)) 
+                     for o in ordinals[calendar.is_business_day(ordinals)])
+    
 @dataclass(frozen=True, slots=True)
 class BermudanExercise(Exercise):
     
@@ -56,6 +69,10 @@ class BermudanExercise(Exercise):
     
     def exercise_dates(self) -> tuple[dt.date, ...]:
         return self.dates
+    
+    # last exercise date, gives bermudans the same expiry interface as other rules
+    @property
+    def expiry(self) -> dt.date: return max(self.dates)
 
 
 """
@@ -1,4 +1,8 @@
 import dataclasses
+import datetime as dt
+import enum
+import hashlib
+import numbers
 
 from src.exercise import Exercise
 from src.payoff import Payoff, PayoffContext
@@ -8,8 +12,9 @@ from src.direction import Direction
 @dataclasses.dataclass(frozen = True, slots = True)
 class Option:
 
-    #TODO 
-    # add hashable id to identify unique options?
+    # frozen dataclass of frozen fields: hashable and equal by terms, so options can
+    # key dicts and caches directly. uid is a stable digest of the same terms for use
+    # outside the process (hash() of strings and enums is salted per interpreter)
     
     strike: float
     exercise: Exercise
@@ -20,4 +25,34 @@ class Option:
     
     @property
     def direction(self) -> Direction:
-        return self.payoff.direction
\ No newline at end of file
+        return self.payoff.direction
+    
+    @property
+    def uid(self) -> str:
+        # digest of normalized terms, so options comparing equal share their uid
+        terms = repr((float(self.strike), _terms(self.exercise), _terms(self.payoff)))
+        return hashlib.blake2b(terms.encode(), digest_size=8).hexdigest()
+
+
+def _terms(value):
+
+    # contract terms as plain values: type names, floats, enum names and iso dates,
+    # independent of how equal values were spelled (100 vs 100.0, numpy scalars)
+    if dataclasses.is_dataclass(value):
+        return (type(value).__name__,
+                tuple((f.name, _terms(getattr(value, f.name)))
+                      for f in dataclasses.fields(value)))
+
+    if isinstance(value, enum.Enum):
+        return f'{type(value).__name__}.{value.name}'
+
+    if isinstance(value, dt.date):
+        return value.isoformat()
+
+    if isinstance(value, (tuple, list)):
+        return tuple(_terms(v) for v in value)
+
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return float(value)
+
+    return value
@@ -1,7 +1,8 @@
 import dataclasses
 from abc import ABC, abstractmethod
 import enum
-from typing import Protocol
+from typing import ClassVar, Protocol
+import numpy as np
 from src.direction import Direction
 
 @dataclasses.dataclass(frozen=True)
@@ -26,27 +27,173 @@ class PayoffContext:
         if self.path is not None and not all(x >= 0 for x in self.path):
             raise ValueError(f'all values in path must be positive')
 
+def as_fixings(spots_or_paths) -> np.ndarray:
+
+    """
+    Array counterpart of PayoffContext checks, run once per array rather than once per 
+    element. 1-D inputs are terminal spots (one scenario per entry), 2-D inputs are 
+    paths of shape (n_scenarios, n_fixings) whose last column is the spot at expiry.
+    Always returns a 2-D float array.
+    """
+
+    fixings = np.asarray(spots_or_paths, dtype=float)
+
+    if fixings.ndim == 1:
+        fixings = fixings[:, None]
+
+    if fixings.ndim != 2:
+        raise ValueError(f'spots_or_paths must be 1-D or 2-D, got {fixings.ndim} dimensions')
+    
+    # NaN fails both comparisons
+    if not np.all((fixings >= 0) & (fixings < np.inf)):
+        raise ValueError(f'all values in spots_or_paths must be finite and positive')
+    
+    return fixings
+
+
 @dataclasses.dataclass(frozen=True)
 class Payoff(ABC):
     direction: Direction  # CALL or PUT
 
+    # path-dependent payoffs need the whole path of fixings, not just the terminal spot
+    path_dependent: ClassVar[bool] = False
+
     @abstractmethod
     def value(self, strike: float, ctx: PayoffContext) -> float:
         ...
 
+    def values(self, strikes, spots_or_paths) -> np.ndarray:
+        
+        fixings = as_fixings(spots_or_paths)
+        strikes = np.broadcast_to(np.asarray(strikes, dtype=float), fixings.shape[:1])
+        
+        return self._values(strikes, fixings)
+
+    @abstractmethod
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+        ...
+
+    def _ctx_fixings(self, ctx: PayoffContext) -> np.ndarray:
+
+        if not self.path_dependent:
+            return np.array([[ctx.spot]])
+        
+        if not ctx.path:
+            raise ValueError(f'{self.__class__.__name__} requires a path of fixings.')
+        
+        return np.array([ctx.path])
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class VanillaPayoff(Payoff):
 
     def value(self, strike: float, ctx: PayoffContext) -> float: 
         return max(0.0, self.direction.value * (ctx.spot - strike))
     
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+        return np.maximum(0.0, self.direction.value * (fixings[:, -1] - strikes))
+    
 @dataclasses.dataclass(frozen=True, slots=True)
 class AsianArithmeticPayoff(Payoff):
 
     # can now implement independently more payoffs at wills
 
+    path_dependent: ClassVar[bool] = True
+
+    # arithmetic average over the fixings in ctx.path
     def value(self, strike: float, ctx: PayoffContext) -> float: 
-        pass
+        
+        if not ctx.path:
+            raise ValueError(f'{self.__class__.__name__} requires a path of fixings.')
+        
+        average = sum(ctx.path) / len(ctx.path)
+        return max(0.0, self.direction.value * (average - strike))
+    
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+        return np.maximum(0.0, self.direction.value * (fixings.mean(axis=1) - strikes))
+    
+@dataclasses.dataclass(frozen=True, slots=True)
+class AsianGeometricPayoff(Payoff):
+
+    path_dependent: ClassVar[bool] = True
+
+    def value(self, strike: float, ctx: PayoffContext) -> float:
+        return float(self._values(np.array([strike]), self._ctx_fixings(ctx))[0])
+
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+
+        with np.errstate(divide='ignore'):
+            average = np.exp(np.log(fixings).mean(axis=1))
+
+        return np.maximum(0.0, self.direction.value * (average - strikes))
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LookbackPayoff(Payoff):
+
+    # fixed strike: calls pay on the running max, puts on the running min
+    path_dependent: ClassVar[bool] = True
+
+    def value(self, strike: float, ctx: PayoffContext) -> float:
+        return float(self._values(np.array([strike]), self._ctx_fixings(ctx))[0])
+
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+
+        if self.direction is Direction.CALL:
+            return np.maximum(0.0, fixings.max(axis=1) - strikes)
+        
+        return np.maximum(0.0, strikes - fixings.min(axis=1))
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DigitalPayoff(Payoff):
+
+    # cash-or-nothing, pays cash when the option expires in the money
+    cash: float = 1.0
+
+    def value(self, strike: float, ctx: PayoffContext) -> float:
+        return self.cash if self.direction.value * (ctx.spot - strike) > 0 else 0.0
+    
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+        return np.where(self.direction.value * (fixings[:, -1] - strikes) > 0, 
+                        self.cash, 0.0)
+
+class BarrierType(enum.Enum):
+    UP_AND_OUT = enum.auto()
+    UP_AND_IN = enum.auto()
+    DOWN_AND_OUT = enum.auto()
+    DOWN_AND_IN = enum.auto()
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BarrierPayoff(Payoff):
+
+    # wrapper around another payoff, knocked in/out when a fixing touches the barrier
+    # (discrete monitoring on the fixings provided). defaults to a vanilla underlying
+    barrier: float
+    barrier_type: BarrierType
+    underlying: Payoff | None = None
+
+    path_dependent: ClassVar[bool] = True
+
+    def __post_init__(self):
+
+        if not self.barrier > 0:
+            raise ValueError(f'barrier must be a positive level, got {self.barrier}')
+        
+        if self.underlying is None:
+            object.__setattr__(self, 'underlying', VanillaPayoff(direction=self.direction))
+
+    def value(self, strike: float, ctx: PayoffContext) -> float:
+        return float(self._values(np.array([strike]), self._ctx_fixings(ctx))[0])
+
+    def _values(self, strikes: np.ndarray, fixings: np.ndarray) -> np.ndarray:
+
+        if self.barrier_type in (BarrierType.UP_AND_OUT, BarrierType.UP_AND_IN):
+            touched = (fixings >= self.barrier).any(axis=1)
+        else:
+            touched = (fixings <= self.barrier).any(axis=1)
+
+        knock_in = self.barrier_type in (BarrierType.UP_AND_IN, BarrierType.DOWN_AND_IN)
+        alive = touched if knock_in else ~touched
+
+        return np.where(alive, self.underlying._values(strikes, fixings), 0.0)
 
 """
 ***************************************************************************************
@@ -58,11 +205,10 @@ Factory
 class PayoffType(enum.Enum):
     VANILLA = enum.auto()
     ASIAN_ARITHMETIC = enum.auto()
-    #TODO 
-    #BARRIER = enum.auto() -> wrapper around another payoff 
-    #ASIAN_GEOMETRIC = enum.auto()
-    #LOOKBACK = enum.auto()
-    #DIGITAL = enum.auto()
+    BARRIER = enum.auto()
+    ASIAN_GEOMETRIC = enum.auto()
+    LOOKBACK = enum.auto()
+    DIGITAL = enum.auto()
 
 class _PayoffCtor(Protocol):
     def __call__(self, **kwds)-> Payoff: ...
@@ -92,4 +238,27 @@ class PayoffFactory:
        
 @PayoffFactory.register(PayoffType.VANILLA)
 def _make_vanilla(*, direction: Direction, **kwargs) -> Payoff:
-    return VanillaPayoff(direction=direction)
\ No newline at end of file
+    return VanillaPayoff(direction=direction)
+
+@PayoffFactory.register(PayoffType.ASIAN_ARITHMETIC)
+def _make_asian_arithmetic(*, direction: Direction, **kwargs) -> Payoff:
+    return AsianArithmeticPayoff(direction=direction)
+
+@PayoffFactory.register(PayoffType.ASIAN_GEOMETRIC)
+def _make_asian_geometric(*, direction: Direction, **kwargs) -> Payoff:
+    return AsianGeometricPayoff(direction=direction)
+
+@PayoffFactory.register(PayoffType.LOOKBACK)
+def _make_lookback(*, direction: Direction, **kwargs) -> Payoff:
+    return LookbackPayoff(direction=direction)
+
+@PayoffFactory.register(PayoffType.DIGITAL)
+def _make_digital(*, direction: Direction, cash: float = 1.0, **kwargs) -> Payoff:
+    return DigitalPayoff(direction=direction, cash=cash)
+
+@PayoffFactory.register(PayoffType.BARRIER)
+def _make_barrier(*, direction: Direction, barrier: float, 
+                  barrier_type: BarrierType = BarrierType.UP_AND_OUT, 
+                  underlying: Payoff | None = None, **kwargs) -> Payoff:
+    return BarrierPayoff(direction=direction, barrier=barrier, barrier_type=barrier_type, 
+                         underlying=underlying)
\ No newline at end of file
@@ -1,13 +1,40 @@
 import dataclasses
+import datetime as dt
 from abc import ABC, abstractmethod
 from typing import final
+from typing import Any, Callable, Sequence
+import numpy as np
 from scipy.optimize import brentq
 
 from src.option import Option
-from src.pricers.types import Market
+from src.pricers.types import Market, Greeks, Bumps, BumpScheme
+from src.pricers.cache import LRUCache
+from src.pricers.instrumentation import METRICS
+from src.pricers.time_utils import year_fraction
 
 class Pricer(ABC):
 
+    # optional memo of results keyed on (what, option, market), see enable_cache.
+    # entries assume the pricer's own settings do not change while cached
+    cache: LRUCache | None = None
+
+    def enable_cache(self, maxsize: int = 1024, ttl: float | None = None) -> LRUCache:
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        METRICS.track_cache(self, self.cache)
+        return self.cache
+    
+    def disable_cache(self) -> None:
+        self.cache = None
+        METRICS.track_cache(self, None)
+
+    def _memoize(self, what: str, option: Option, market: Market, 
+                 compute: Callable[[], Any]) -> Any:
+        
+        if self.cache is None:
+            return compute()
+        
+        return self.cache.get_or_compute((what, option, market), compute)
+
     @abstractmethod
     def is_supported(self, option: Option, market: Market) -> bool: ...
 
@@ -25,18 +52,170 @@ class Pricer(ABC):
 
     @final
     def price(self, option: Option, market: Market) -> float:
-        self.validate_option_priceable(option, market)
-        return self._price_impl(option, market)
+
+        if not METRICS.enabled:
+            return self._memoize('price', option, market, 
+                                 lambda: self._validated_price(option, market))
+        
+        METRICS.count(self, 'price')
+        with METRICS.stage(self, 'price'):
+            return self._memoize('price', option, market, 
+                                 lambda: self._validated_price(option, market))
+    
+    def _validated_price(self, option: Option, market: Market) -> float:
+
+        if not METRICS.enabled:
+            self.validate_option_priceable(option, market)
+            return self._price_impl(option, market)
+        
+        with METRICS.stage(self, 'validate'):
+            self.validate_option_priceable(option, market)
+        
+        with METRICS.stage(self, 'evaluate'):
+            return self._price_impl(option, market)
     
     @abstractmethod
     def _price_impl(option, market) -> float: ...
 
+    def price_batch(self, options: Sequence[Option], 
+                    markets: Market | Sequence[Market]) -> np.ndarray:
+        
+        # generic fallback, one price() per option. closed-form pricers override it
+        if isinstance(markets, Market):
+            markets = (markets,) * len(options)
+
+        if len(markets) != len(options):
+            raise ValueError(f'Got {len(options)} options but {len(markets)} markets.')
+        
+        if METRICS.enabled:
+            METRICS.count(self, 'price_batch')
+            METRICS.count(self, 'price_batch_items', len(options))
+
+        return np.array([self.price(option, market) 
+                         for option, market in zip(options, markets)], dtype=float)
+
     def implied_vol(self, option: Option, market: Market, target_price: float, *,
                     vol_min = 1e-6, vol_max = 10.0, tol: float = 1e-7, 
                     max_iter = 100) -> float: 
         
+        self.validate_option_priceable(option, market)
+
+        # trial vols are throwaway markets: bypass the result cache. a surface would
+        # take precedence over the trial vol, drop it
         def objective(vol: float) -> float:
-            m = dataclasses.replace(market, vol=vol)
-            return self.price(option, m) - target_price
+            m = dataclasses.replace(market, vol=vol, surface=None)
+            return self._price_impl(option, m) - target_price
+        
+        root, info = brentq(objective, vol_min, vol_max, xtol=tol, maxiter=max_iter, 
+                            full_output=True)
         
-        return brentq(objective, vol_min, vol_max, xtol=tol, maxiter=max_iter)
\ No newline at end of file
+        if METRICS.enabled:
+            METRICS.count(self, 'implied_vol')
+            METRICS.record_iterations(self, 'implied_vol', info.iterations)
+
+        return root
+
+    def greeks(self, option: Option, market: Market) -> Greeks:
+        # pricers with analytic, grid or pathwise greeks override this. the fallback
+        # skips the cross bumps of vanna / volga, ask bump_greeks for those
+        return self.bump_greeks(option, market, Bumps(second_order=False))
+
+    def _common_random_numbers(self) -> 'Pricer':
+        # pricer valuing the base and every bumped market, see MonteCarloPricer
+        return self
+
+    def bump_greeks(self, option: Option, market: Market, 
+                    bumps: Bumps = Bumps()) -> Greeks:
+        
+        """
+        Finite difference greeks. The base market and every bumped one go through a
+        single price_batch call, the base value being shared by all differences.
+        Units follow the analytic greeks: vega and rho per 1% move, theta per day
+        rolled; vanna is the delta change per vol point and volga the vega change
+        per vol point.
+
+        Only closed-form pricers value the markets in one vectorized pass. Others
+        go through the generic price_batch, one full valuation per market: 8 with
+        central bumps, 12 with the cross bumps, and Monte Carlo regenerates its
+        draws for each. Prefer their own greeks where they have them (PDE grid,
+        Monte Carlo pathwise estimators).
+        """
+
+        self.validate_option_priceable(option, market)
+        self.is_valid_market_data(market)
+
+        h, k, dr = bumps.spot, bumps.vol, bumps.rate
+        central = bumps.scheme is BumpScheme.CENTRAL
+
+        # shocked vols are floored at zero, a down bump must not cross it: central vol
+        # bumps shrink to half the vol, and go forward at zero vol
+        tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+        sigma = float(market.vols(option.strike, tau))
+        vol_central = central and sigma > 0.0
+        if vol_central:
+            k = min(k, 0.5 * sigma)
+
+        # forward differences take their second point two bumps away
+        s1, s2 = (h, -h) if central else (h, 2 * h)
+        v1, v2 = (k, -k) if vol_central else (k, 2 * k)
+
+        markets = {'base': market,
+                   's1': market.shocked(spot=s1), 's2': market.shocked(spot=s2),
+                   'v1': market.shocked(vol=v1), 'v2': market.shocked(vol=v2),
+                   'r1': market.shocked(rate=dr),
+                   't': dataclasses.replace(market, 
+                                            today=market.today + dt.timedelta(bumps.days))}
+        
+        if central:
+            markets['r2'] = market.shocked(rate=-dr)
+
+        if bumps.second_order:
+            markets['s1v1'] = market.shocked(spot=s1, vol=k)
+            if central:
+                markets['s2v1'] = market.shocked(spot=-h, vol=k)
+            if vol_central:
+                markets['s1v2'] = market.shocked(spot=h, vol=-k)
+                markets['s2v2'] = market.shocked(spot=-h, vol=-k)
+
+        pricer = self._common_random_numbers()
+        values = dict(zip(markets, pricer.price_batch([option] * len(markets), 
+                                                      list(markets.values()))))
+        
+        V = values['base']
+        dS = market.spot * h
+
+        if central:
+            delta = (values['s1'] - values['s2']) / (2 * dS)
+            gamma = (values['s1'] - 2 * V + values['s2']) / dS**2
+            rho = (values['r1'] - values['r2']) / (2 * dr)
+        else:
+            delta = (values['s1'] - V) / dS
+            gamma = (values['s2'] - 2 * values['s1'] + V) / dS**2
+            rho = (values['r1'] - V) / dr
+
+        if vol_central:
+            vega = (values['v1'] - values['v2']) / (2 * k)
+            volga = (values['v1'] - 2 * V + values['v2']) / k**2
+        else:
+            vega = (values['v1'] - V) / k
+            volga = (values['v2'] - 2 * values['v1'] + V) / k**2
+
+        vanna = None
+        if bumps.second_order:
+            if vol_central:
+                vanna = (values['s1v1'] - values['s1v2'] - values['s2v1'] 
+                         + values['s2v2']) / (4 * dS * k)
+            elif central:
+                # central in spot, forward in vol
+                vanna = (values['s1v1'] - values['s2v1'] - values['s1'] 
+                         + values['s2']) / (2 * dS * k)
+            else:
+                vanna = (values['s1v1'] - values['s1'] - values['v1'] + V) / (dS * k)
+            vanna, volga = float(vanna) / 100, float(volga) / 100**2
+        else:
+            volga = None
+
+        theta = (values['t'] - V) / bumps.days
+
+        return Greeks(float(delta), float(gamma), float(vega) / 100, float(theta), 
+                      float(rho) / 100, vanna, volga)
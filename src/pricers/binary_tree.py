@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+import enum
+import numpy as np
+
+from src.exercise import Exercise, EuropeanExercise, AmericanExercise, BermudanExercise
+from src.option import Option
+from src.payoff import Payoff, PayoffContext
+from src.pricers.base import Pricer
+from src.pricers.types import Market
+from src.pricers.factory import PricerFactory, PricerType
+from src.pricers.time_utils import year_fraction, year_fractions
+
+
+class TreeMethod(enum.Enum):
+    CRR = enum.auto()
+    LEISEN_REIMER = enum.auto()
+    TRINOMIAL = enum.auto()
+
+
+@dataclass(frozen = True, slots = True)
+class TreeParameters:
+    S: float
+    K: float
+    r: float
+    q: float
+    tau: float
+    sigma: float
+    # year fractions from today at which early exercise is allowed
+    exercise_times: np.ndarray
+    # for american rules: exercise allowed on the whole [exercise_start, tau] window
+    exercise_start: float | None = None
+
+
+def _peizer_pratt(z: float, n: int) -> float:
+    # Peizer-Pratt method 2 inversion, maps a normal quantile to a binomial probability
+    x = z / (n + 1.0 / 3.0 + 0.1 / (n + 1))
+    return 0.5 + np.copysign(0.5, z) * np.sqrt(1.0 - np.exp(-x * x * (n + 1.0 / 6.0)))
+
+
+class BinaryTreePricer(Pricer):
+
+    """
+    Recombining lattice pricer (CRR / Leisen-Reimer binomial, or trinomial).
+
+    Backward induction runs over one numpy vector per time slice, overwritten in place,
+    so memory stays O(steps). Early exercise is applied only on the slices matching
+    the option's exercise rule.
+    """
+
+    def __init__(self, steps: int = 500, method: TreeMethod = TreeMethod.CRR,
+                 richardson: bool = False):
+
+        if steps < 2:
+            raise ValueError(f'Tree needs at least 2 steps, got {steps}.')
+
+        self.steps = steps
+        self.method = method
+        self.richardson = richardson
+
+    def is_supported(self, option: Option, market: Market) -> bool:
+
+        # lattice nodes only carry the spot: payoffs must not depend on the path
+        return ( not option.payoff.path_dependent
+                and isinstance(option.exercise, (EuropeanExercise, AmericanExercise,
+                                                 BermudanExercise))
+                )
+
+    def is_valid_market_data(self, market: Market) -> bool:
+
+        if not market.has_vol:
+            raise ValueError(f'Must provide a volatility value for tree pricing.')
+
+        return True
+
+    def get_tree_inputs(self, option: Option, market: Market) -> TreeParameters:
+
+        self.is_valid_market_data(market)
+
+        tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+        exercise_times, exercise_start = self._exercise_schedule(option.exercise, market)
+
+        S, r, q = market.carry(tau)
+
+        return TreeParameters(S = S,
+                              K = float(option.strike),
+                              r = r,
+                              q = q,
+                              tau = tau,
+                              sigma = float(market.vols(option.strike, tau)),
+                              exercise_times = exercise_times,
+                              exercise_start = exercise_start)
+
+    def _exercise_schedule(self, exercise: Exercise,
+                           market: Market) -> tuple[np.ndarray, float | None]:
+
+        # american rules list every calendar day, which would only be exercisable on the
+        # slices closest to midnight: treat them as a continuous window instead
+        if isinstance(exercise, AmericanExercise):
+            start = max(0.0, year_fraction(market.today, exercise.start, market.basis))
+            return np.empty(0), start
+
+        times = year_fractions(market.today, exercise.exercise_dates(), market.basis)
+
+        return times[times >= 0.0], None
+
+    def _price_impl(self, option: Option, market: Market) -> float:
+
+        params = self.get_tree_inputs(option, market)
+
+        # "immediate" exercise
+        if params.tau == 0.0 or params.sigma == 0.0:
+            return option.payoff.value(params.K, PayoffContext(spot=params.S))
+
+        value = self._induce(params, option.payoff, self.steps)
+
+        if not self.richardson:
+            return value
+
+        # LR converges as O(1/n^2) on european payoffs, CRR and trinomial as O(1/n)
+        order = 2 if self.method is TreeMethod.LEISEN_REIMER else 1
+
+        n_fine, n_coarse = self._steps(self.steps), self._steps(self.steps // 2)
+        coarse = self._induce(params, option.payoff, self.steps // 2)
+
+        w_fine, w_coarse = float(n_fine)**order, float(n_coarse)**order
+        return (w_fine * value - w_coarse * coarse) / (w_fine - w_coarse)
+
+    def _steps(self, n: int) -> int:
+        # LR needs an odd number of steps
+        if self.method is TreeMethod.LEISEN_REIMER and n % 2 == 0:
+            return n + 1
+        return n
+
+    def _exercise_mask(self, params: TreeParameters, n: int, dt: float) -> np.ndarray:
+
+        mask = np.zeros(n + 1, dtype=bool)
+
+        if params.exercise_start is not None:
+            mask[int(np.ceil(params.exercise_start / dt - 1e-9)):] = True
+        else:
+            steps = np.rint(params.exercise_times / dt).astype(int)
+            mask[steps[steps <= n]] = True
+
+        return mask
+
+    def _induce(self, params: TreeParameters, payoff: Payoff, n: int) -> float:
+
+        n = self._steps(n)
+
+        if self.method is TreeMethod.TRINOMIAL:
+            return self._induce_trinomial(params, payoff, n)
+
+        return self._induce_binomial(params, payoff, n)
+
+    def _induce_binomial(self, params: TreeParameters, payoff: Payoff, n: int) -> float:
+
+        dt = params.tau / n
+        growth = np.exp((params.r - params.q) * dt)
+
+        if self.method is TreeMethod.LEISEN_REIMER:
+            sig_sqrt_t = params.sigma * np.sqrt(params.tau)
+            d1 = ( np.log(params.S / params.K)
+                  + (params.r - params.q + 0.5 * params.sigma**2) * params.tau
+                  ) / sig_sqrt_t
+            d2 = d1 - sig_sqrt_t
+
+            p, p_bar = _peizer_pratt(d2, n), _peizer_pratt(d1, n)
+            u = growth * p_bar / p
+            d = (growth - p * u) / (1.0 - p)
+        else:
+            u = np.exp(params.sigma * np.sqrt(dt))
+            d = 1.0 / u
+            p = (growth - d) / (u - d)
+
+        disc = np.exp(-params.r * dt)
+        disc_up, disc_down = disc * p, disc * (1.0 - p)
+
+        exercise = self._exercise_mask(params, n, dt)
+
+        # node j of slice i has j up moves: log-spot = log S + j log u + (i - j) log d
+        log_u, log_d = np.log(u), np.log(d)
+        j = np.arange(n + 1)
+
+        spots = params.S * np.exp(j * log_u + (n - j) * log_d)
+        values = payoff.values(params.K, spots)
+
+        for i in range(n - 1, -1, -1):
+
+            values[:i + 1] = disc_up * values[1:i + 2] + disc_down * values[:i + 1]
+
+            if exercise[i]:
+                spots = params.S * np.exp(j[:i + 1] * log_u + (i - j[:i + 1]) * log_d)
+                np.maximum(values[:i + 1], payoff.values(params.K, spots),
+                           out=values[:i + 1])
+
+        return float(values[0])
+
+    def _induce_trinomial(self, params: TreeParameters, payoff: Payoff, n: int) -> float:
+
+        dt = params.tau / n
+        dx = params.sigma * np.sqrt(3.0 * dt)
+        nu = params.r - params.q - 0.5 * params.sigma**2
+
+        spread = (params.sigma**2 * dt + nu**2 * dt**2) / dx**2
+        drift = nu * dt / dx
+
+        disc = np.exp(-params.r * dt)
+        p_up, p_down = disc * 0.5 * (spread + drift), disc * 0.5 * (spread - drift)
+        p_mid = disc - p_up - p_down
+
+        exercise = self._exercise_mask(params, n, dt)
+
+        # terminal slice has 2n+1 nodes, node j sits at log-spot (j - n) dx
+        spots = params.S * np.exp((np.arange(2 * n + 1) - n) * dx)
+        values = payoff.values(params.K, spots)
+
+        for i in range(n - 1, -1, -1):
+
+            m = 2 * i + 1
+            values[:m] = p_up * values[2:m + 2] + p_mid * values[1:m + 1] + p_down * values[:m]
+
+            if exercise[i]:
+                # slice i nodes are the inner nodes of slice i + 1, spots at offset n - i
+                offset = n - i
+                np.maximum(values[:m], payoff.values(params.K, spots[offset:offset + m]),
+                           out=values[:m])
+
+        return float(values[0])
+
+
+@PricerFactory.register(PricerType.BINARY_TREE)
+def _make_binary_tree(**kw) -> Pricer:
+    return BinaryTreePricer(**kw)
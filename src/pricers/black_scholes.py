@@ -1,16 +1,21 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Sequence
 import numpy as np
-from scipy.stats import norm
+from scipy.optimize import brentq
 
 from src.exercise import EuropeanExercise, AmericanExercise
 from src.option import Option
+from src.book import OptionBook
 from src.direction import Direction
 from src.payoff import VanillaPayoff, Direction, PayoffContext
 from src.pricers.base import Pricer
-from src.pricers.types import Market, Greeks
+from src.pricers.types import Market, Greeks, GreeksBatch, ImpliedVolResult, IVStatus
 from src.pricers.factory import PricerFactory, PricerType
-from src.pricers.time_utils import year_fraction, basis_mapping
+from src.pricers.time_utils import year_fraction, year_fractions, basis_mapping
+from src.pricers.instrumentation import METRICS
+from src.pricers.math_kernels import (norm_cdf, norm_pdf, norm_cdf_scalar, 
+                                      norm_pdf_scalar)
 
 
 @dataclass(frozen = True, slots = True)
@@ -53,6 +58,234 @@ class BSParameters:
         object.__setattr__(self, 'disc_q', disc_q)
         object.__setattr__(self, 'disc_r', disc_r)
 
+
+@dataclass(frozen = True, slots = True)
+class BSBatchParameters:
+
+    """
+    Array counterpart of BSParameters: one row per option, every derived quantity is
+    computed in a single numpy pass. Inputs are broadcast against each other.
+    """
+
+    S: np.ndarray
+    K: np.ndarray
+    r: np.ndarray
+    q: np.ndarray
+    tau: np.ndarray
+    is_call: np.ndarray
+    sigma: np.ndarray
+    # day-count divisor used to express theta per day, see basis_mapping
+    year_days: np.ndarray = 365.0
+
+    sig_sqrt_t: np.ndarray = field(init=False)
+    d1: np.ndarray = field(init=False)
+    d2: np.ndarray = field(init=False)
+    disc_q: np.ndarray = field(init=False)
+    disc_r: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+
+        S, K, r, q, tau, sigma, year_days = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (self.S, self.K, self.r, self.q, 
+                                                   self.tau, self.sigma, self.year_days))
+            )
+        is_call = np.broadcast_to(np.asarray(self.is_call, dtype=bool), S.shape)
+
+        sig_sqrt_t = sigma * np.sqrt(tau)
+
+        # same guard as the scalar path: rows failing it get d1 = d2 = 0, except NaN
+        # inputs (e.g. unsolved implied vols) which stay NaN
+        valid = (tau >= 0) & (sig_sqrt_t > 0) & (K > 0)
+        fill = np.where(np.isnan(sig_sqrt_t), np.nan, 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d1 = np.where(valid, 
+                          (np.log(S / K) + (r - q + 0.5 * sigma**2) * tau) / sig_sqrt_t,
+                          fill)
+        d2 = np.where(valid, d1 - sig_sqrt_t, fill)
+
+        disc_q, disc_r = np.exp(-q * tau), np.exp(-r * tau)
+
+        for name, value in (('S', S), ('K', K), ('r', r), ('q', q), ('tau', tau), 
+                            ('is_call', is_call), ('sigma', sigma), 
+                            ('year_days', year_days), ('sig_sqrt_t', sig_sqrt_t), ('d1', d1), ('d2', d2), 
+                            ('disc_q', disc_q), ('disc_r', disc_r)):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_arrays(cls, *, strikes, taus, directions, spots, vols, rates = 0.0, 
+                    divs = 0.0, year_days = 365.0) -> 'BSBatchParameters':
+
+        # taus are year fractions to expiry, negative values are treated as expired
+        is_call = np.asarray(directions, dtype=int) == Direction.CALL.value
+
+        return cls(S = spots, K = strikes, r = rates, q = divs, 
+                   tau = np.maximum(np.asarray(taus, dtype=float), 0.0), 
+                   is_call = is_call, sigma = vols, year_days = year_days)
+    
+    def __len__(self) -> int:
+        return self.S.shape[0] if self.S.ndim else 1
+    
+
+def bs_price_arrays(params: BSBatchParameters) -> np.ndarray:
+
+    call = (params.S * params.disc_q * norm_cdf(params.d1) 
+            - params.K * params.disc_r * norm_cdf(params.d2))
+    
+    value = np.where(params.is_call, 
+                     call, 
+                     call - params.S * params.disc_q + params.K * params.disc_r)
+
+    # "immediate" exercise rows fall back on the intrinsic payoff, as in the scalar path
+    sign = np.where(params.is_call, 1.0, -1.0)
+    intrinsic = np.maximum(0.0, sign * (params.S - params.K))
+    immediate = (params.tau == 0.0) | (params.sigma == 0.0)
+
+    return np.where(immediate, intrinsic, value)
+
+
+def bs_greeks_arrays(params: BSBatchParameters) -> GreeksBatch:
+
+    # each normal cdf/pdf evaluated once per row
+    cdf_d1, pdf_d1, cdf_d2 = norm_cdf(params.d1), norm_pdf(params.d1), norm_cdf(params.d2)
+
+    # puts use N(-x) = 1 - N(x), so signed terms are N(x) for calls and N(x) - 1 for puts
+    n_d1 = np.where(params.is_call, cdf_d1, cdf_d1 - 1.0)
+    n_d2 = np.where(params.is_call, cdf_d2, cdf_d2 - 1.0)
+
+    degenerate = (params.tau == 0.0) | (params.sigma == 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        delta = params.disc_q * n_d1
+
+        gamma = (params.disc_q * pdf_d1) / (params.S * params.sig_sqrt_t)
+
+        vega = params.disc_q * params.S * pdf_d1 * np.sqrt(params.tau) / 100
+
+        theta = ( -(params.S * params.sigma 
+                    * params.disc_q * pdf_d1) / (2 * np.sqrt(params.tau))
+                    - params.r * params.K * params.disc_r * n_d2
+                    + params.q * params.S * params.disc_q * n_d1
+                ) / params.year_days
+        
+        rho = params.K * params.tau * params.disc_r * n_d2 / 100
+
+    return GreeksBatch(*(np.where(degenerate, np.nan, g) 
+                         for g in (delta, gamma, vega, theta, rho)))
+
+
+def _implied_vol_guess(params: BSBatchParameters, target: np.ndarray) -> np.ndarray:
+
+    # Corrado-Miller closed-form approximation on the call price (puts mapped through 
+    # parity), in the spirit of the rational initial guesses of Li / Jaeckel
+    fwd_spot, pv_strike = params.S * params.disc_q, params.K * params.disc_r
+    call = np.where(params.is_call, target, target + fwd_spot - pv_strike)
+    
+    half_moneyness = 0.5 * (fwd_spot - pv_strike)
+    radicand = np.maximum((call - half_moneyness)**2 - 4 * half_moneyness**2 / np.pi, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sig_sqrt_t = (np.sqrt(2 * np.pi) / (fwd_spot + pv_strike) 
+                      * (call - half_moneyness + np.sqrt(radicand)))
+        
+        return sig_sqrt_t / np.sqrt(params.tau)
+
+
+def bs_implied_vol_arrays(params: BSBatchParameters, target_prices, *, vol_min = 1e-6, 
+                          vol_max = 10.0, tol: float = 1e-7, 
+                          max_iter = 100) -> ImpliedVolResult:
+    
+    target = np.broadcast_to(np.asarray(target_prices, dtype=float), params.S.shape)
+    n = target.size
+
+    vols = np.full(n, np.nan)
+    status = np.full(n, IVStatus.FAILED, dtype=np.int8)
+    iterations = np.zeros(n, dtype=np.int64)
+
+    flat = BSBatchParameters(*(np.ravel(getattr(params, name)) for name in 
+                               ('S', 'K', 'r', 'q', 'tau', 'is_call', 'sigma', 'year_days')))
+    target = np.ravel(target)
+
+    # no-arbitrage bounds at vol_min / vol_max, quotes outside them have no solution.
+    # quotes at the lower bound (zero prices included) do not pin down a vol either
+    lower = bs_price_arrays(_with_sigma(flat, vol_min))
+    upper = bs_price_arrays(_with_sigma(flat, vol_max))
+    
+    solvable = (flat.tau > 0) & (flat.K > 0) & (target > lower) & (target <= upper)
+    status[~solvable] = IVStatus.OUT_OF_BOUNDS
+
+    idx = np.flatnonzero(solvable)
+    lo, hi = np.full(idx.size, vol_min), np.full(idx.size, vol_max)
+    
+    sigma = _implied_vol_guess(_take(flat, idx), target[idx])
+    sigma = np.where(np.isfinite(sigma), np.clip(sigma, vol_min, vol_max), 0.2)
+
+    for _ in range(max_iter):
+        
+        if idx.size == 0:
+            break
+
+        rows = _with_sigma(_take(flat, idx), sigma)
+        diff = bs_price_arrays(rows) - target[idx]
+        vega = rows.disc_q * rows.S * norm_pdf(rows.d1) * np.sqrt(rows.tau)
+
+        iterations[idx] += 1
+
+        # price is increasing in vol: keep a bracket around the root for safeguarding
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff <= 0, sigma, lo)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = sigma - diff / vega
+
+        # newton updates are only taken inside the bracket: converged rows otherwise
+        # keep the current vol (zero vega gives no usable step), others bisect
+        done = (np.abs(newton - sigma) < tol) | (diff == 0.0) | (hi - lo < tol)
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        step = np.where(inside, newton, np.where(done, sigma, 0.5 * (lo + hi)))
+        
+        vols[idx[done]] = step[done]
+        status[idx[done]] = IVStatus.CONVERGED
+
+        idx, sigma, lo, hi = idx[~done], step[~done], lo[~done], hi[~done]
+
+    # whatever newton did not settle is handed to a bracketing solver, quote by quote
+    for i in idx:
+        row = _take(flat, np.array([i]))
+
+        def objective(vol: float) -> float:
+            return bs_price_arrays(_with_sigma(row, vol))[0] - target[i]
+        
+        try:
+            root, info = brentq(objective, vol_min, vol_max, xtol=tol, maxiter=max_iter,
+                                full_output=True, disp=False)
+        except ValueError:
+            continue
+
+        # brentq returns before iterating on an endpoint root, leaving the count unset
+        if vol_min < root < vol_max:
+            iterations[i] += min(max(info.iterations, 0), max_iter)
+        
+        if info.converged:
+            vols[i], status[i] = root, IVStatus.FALLBACK
+
+    shape = params.S.shape
+    return ImpliedVolResult(vols.reshape(shape), status.reshape(shape), 
+                            iterations.reshape(shape))
+
+
+def _take(params: BSBatchParameters, idx: np.ndarray) -> BSBatchParameters:
+    return BSBatchParameters(params.S[idx], params.K[idx], params.r[idx], params.q[idx], 
+                             params.tau[idx], params.is_call[idx], params.sigma[idx], 
+                             params.year_days[idx])
+
+
+def _with_sigma(params: BSBatchParameters, sigma) -> BSBatchParameters:
+    return BSBatchParameters(params.S, params.K, params.r, params.q, params.tau, 
+                             params.is_call, sigma, params.year_days)
+
+
 class BlackScholesPricer(Pricer):
 
     def is_supported(self, option: Option, market: Market) -> bool:
@@ -64,7 +297,7 @@ class BlackScholesPricer(Pricer):
         is_vanilla_american_call_no_div = ( isinstance(option.exercise, AmericanExercise) 
                                     and isinstance(option.payoff, VanillaPayoff) 
                                     and option.direction == Direction.CALL
-                                    and market.div == 0.0
+                                    and not market.has_dividends
                                     )
 
         return (
@@ -73,7 +306,7 @@ class BlackScholesPricer(Pricer):
     
     def is_valid_market_data(self, market) -> bool:
         
-        if market.vol is None:
+        if not market.has_vol:
             raise ValueError(f'Must provide a volatility value for ' + 
                              'Black-Scholes model.')
 
@@ -88,27 +321,92 @@ class BlackScholesPricer(Pricer):
 
         """
         
-        S = float(market.spot)
         K = float(option.strike)
-        r = float(market.rate)
-        q = float(market.div)
         tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+        S, r, q = market.carry(tau)
         is_call = (option.direction is Direction.CALL)
-        sigma = float(market.vol)
+        sigma = float(market.vols(K, tau))
 
         return BSParameters(S, K, r, q, tau, is_call, sigma)
+    
+    def get_bs_batch_inputs(self, options: Sequence[Option] | OptionBook, 
+                            markets: Market | Sequence[Market]) -> BSBatchParameters:
+        
+        if isinstance(options, OptionBook) and isinstance(markets, Market):
+            return self._get_book_inputs(options, markets)
+
+        # a single market is shared by the whole book, otherwise options[i] is priced
+        # against markets[i]
+        if isinstance(markets, Market):
+            markets = (markets,) * len(options)
+
+        if len(markets) != len(options):
+            raise ValueError(f'Got {len(options)} options but {len(markets)} markets.')
+
+        n = len(options)
+        S, K, r, q, sigma, year_days = (np.empty(n) for _ in range(6))
+        is_call = np.empty(n, dtype=bool)
+        today, expiry = np.empty(n, dtype=np.int64), np.empty(n, dtype=np.int64)
+        bases = []
+
+        for i, (option, market) in enumerate(zip(options, markets)):
+            self.validate_option_priceable(option, market)
+            self.is_valid_market_data(market)
+
+            K[i] = option.strike
+            today[i], expiry[i] = market.today.toordinal(), option.exercise.expiry.toordinal()
+            is_call[i] = option.direction is Direction.CALL
+            year_days[i] = basis_mapping[market.basis]
+            bases.append(market.basis)
+
+        # one vectorized day count per basis in the batch
+        tau = np.empty(n)
+        bases = np.array(bases)
+        for basis in np.unique(bases):
+            rows = bases == basis
+            tau[rows] = np.maximum(0.0, year_fractions(today[rows], expiry[rows], basis))
+
+        # one curve and vol lookup per distinct market, covering all of its rows
+        market_ids = np.array([id(market) for market in markets])
+        for market in {id(market): market for market in markets}.values():
+            rows = market_ids == id(market)
+            S[rows], r[rows], q[rows] = market.carry(tau[rows])
+            sigma[rows] = market.vols(K[rows], tau[rows])
+
+        return BSBatchParameters(S, K, r, q, tau, is_call, sigma, year_days)
+
+    def _get_book_inputs(self, book: OptionBook, market: Market) -> BSBatchParameters:
+
+        # columns go straight to arrays, no per-row Option is built
+        self.is_valid_market_data(market)
+
+        supported = book.supported_mask(self, market)
+        if not supported.all():
+            raise NotImplementedError(
+                f"{self.__class__.__name__} cannot price book row "
+                f"{int(np.argmin(supported))}: {book.option(int(np.argmin(supported)))}."
+            )
+        
+        tau = book.taus(market)
+        S, r, q = market.carry(tau)
+
+        return BSBatchParameters(S = S, K = book.strikes, r = r, q = q, tau = tau, 
+                                 is_call = book.is_call, 
+                                 sigma = market.vols(book.strikes, tau), 
+                                 year_days = basis_mapping[market.basis])
 
     def _price_impl(self, option: Option, market: Market) -> float:
         
-        bs_params = self.get_bs_inputs(option, market)
+        with METRICS.stage(self, 'inputs'):
+            bs_params = self.get_bs_inputs(option, market)
 
         # "immediate" exercise
         if bs_params.tau == 0.0 or bs_params.sigma == 0.0: 
             return option.payoff.value(bs_params.K, 
                                        PayoffContext(spot=bs_params.S))
 
-        value = (bs_params.S * bs_params.disc_q * norm.cdf(bs_params.d1)
-                     - bs_params.K * bs_params.disc_r * norm.cdf(bs_params.d2)
+        value = (bs_params.S * bs_params.disc_q * norm_cdf_scalar(bs_params.d1)
+                     - bs_params.K * bs_params.disc_r * norm_cdf_scalar(bs_params.d2)
                     )
 
         if bs_params.is_call:
@@ -116,44 +414,96 @@ class BlackScholesPricer(Pricer):
         
         return value - bs_params.S * bs_params.disc_q + bs_params.K * bs_params.disc_r
         
+    def price_batch(self, options: Sequence[Option] | OptionBook | BSBatchParameters, 
+                    markets: Market | Sequence[Market] | None = None) -> np.ndarray:
+        
+        if METRICS.enabled:
+            METRICS.count(self, 'price_batch')
+            METRICS.count(self, 'price_batch_items', len(options))
+
+        # either pre-built array inputs (see BSBatchParameters.from_arrays) or
+        # options with one shared market / one market per option
+        if isinstance(options, BSBatchParameters):
+            return bs_price_arrays(options)
+        
+        if markets is None:
+            raise ValueError('markets must be provided when pricing a sequence of options.')
+
+        with METRICS.stage(self, 'batch_inputs'):
+            params = self.get_bs_batch_inputs(options, markets)
+
+        return bs_price_arrays(params)
+
     def greeks(self, option: Option, market: Market) -> Greeks:
 
+        if METRICS.enabled:
+            METRICS.count(self, 'greeks')
+
+        return self._memoize('greeks', option, market, 
+                             lambda: self._greeks_impl(option, market))
+
+    def _greeks_impl(self, option: Option, market: Market) -> Greeks:
+
         bs_params = self.get_bs_inputs(option, market)
 
         if bs_params.tau == 0.0 or bs_params.sigma == 0.0:
             return Greeks(delta = None, gamma = None, vega = None, theta = None, rho = None)
         
-        if bs_params.is_call:
+        cdf_d1, pdf_d1, cdf_d2 = (norm_cdf_scalar(bs_params.d1), 
+                                  norm_pdf_scalar(bs_params.d1), 
+                                  norm_cdf_scalar(bs_params.d2))
+        
+        # puts use N(-x) = 1 - N(x)
+        n_d1, n_d2 = (cdf_d1, cdf_d2) if bs_params.is_call else (cdf_d1 - 1.0, cdf_d2 - 1.0)
 
-            delta = bs_params.disc_q * norm.cdf(bs_params.d1)
-            
-            theta = ( -(bs_params.S * bs_params.sigma 
-                        * bs_params.disc_q * norm.pdf(bs_params.d1)) / (2 * np.sqrt(bs_params.tau))
-                        - bs_params.r * bs_params.K * bs_params.disc_r * norm.cdf(bs_params.d2)
-                        + bs_params.q * bs_params.S * bs_params.disc_q * norm.cdf(bs_params.d1)
-                     ) / basis_mapping[market.basis]
-            
-            rho   =  bs_params.K * bs_params.tau * bs_params.disc_r * norm.cdf(bs_params.d2) / 100
+        delta = bs_params.disc_q * n_d1
         
-        else:
-            
-            delta = bs_params.disc_q * (norm.cdf(bs_params.d1) - 1.0)
-            
-            theta = ( -(bs_params.S * bs_params.sigma 
-                        * bs_params.disc_q * norm.pdf(bs_params.d1)) / (2 * np.sqrt(bs_params.tau))
-                        + bs_params.r * bs_params.K * bs_params.disc_r * norm.cdf(bs_params.d2)
-                        - bs_params.q * bs_params.S * bs_params.disc_q * norm.cdf(bs_params.d1)
-                     ) / basis_mapping[market.basis]
-            
-            rho = -bs_params.K * bs_params.tau * bs_params.disc_r * norm.cdf(bs_params.d2) / 100
+        theta = ( -(bs_params.S * bs_params.sigma 
+                    * bs_params.disc_q * pdf_d1) / (2 * np.sqrt(bs_params.tau))
+                    - bs_params.r * bs_params.K * bs_params.disc_r * n_d2
+                    + bs_params.q * bs_params.S * bs_params.disc_q * n_d1
+                 ) / basis_mapping[market.basis]
+        
+        rho = bs_params.K * bs_params.tau * bs_params.disc_r * n_d2 / 100
 
-        gamma = (bs_params.disc_q * norm.pdf(bs_params.d1)) / (bs_params.S * bs_params.sig_sqrt_t)
-        vega  = bs_params.disc_q * bs_params.S * norm.pdf(bs_params.d1) * np.sqrt(bs_params.tau) / 100
+        gamma = (bs_params.disc_q * pdf_d1) / (bs_params.S * bs_params.sig_sqrt_t)
+        vega  = bs_params.disc_q * bs_params.S * pdf_d1 * np.sqrt(bs_params.tau) / 100
 
         return Greeks(delta, gamma, vega, theta, rho)
+    
+    def greeks_batch(self, options: Sequence[Option] | OptionBook | BSBatchParameters, 
+                     markets: Market | Sequence[Market] | None = None) -> GreeksBatch:
+        
+        if isinstance(options, BSBatchParameters):
+            return bs_greeks_arrays(options)
+        
+        if markets is None:
+            raise ValueError('markets must be provided when pricing a sequence of options.')
+
+        return bs_greeks_arrays(self.get_bs_batch_inputs(options, markets))
+
+    def implied_vol_batch(self, options: Sequence[Option] | OptionBook | BSBatchParameters, 
+                          markets: Market | Sequence[Market] | None = None, *, 
+                          target_prices, vol_min = 1e-6, vol_max = 10.0, 
+                          tol: float = 1e-7, max_iter = 100) -> ImpliedVolResult:
+        
+        if not isinstance(options, BSBatchParameters):
+            if markets is None:
+                raise ValueError('markets must be provided when pricing a sequence of options.')
+            
+            options = self.get_bs_batch_inputs(options, markets)
+
+        result = bs_implied_vol_arrays(options, target_prices, vol_min=vol_min, 
+                                       vol_max=vol_max, tol=tol, max_iter=max_iter)
+        
+        if METRICS.enabled:
+            METRICS.count(self, 'implied_vol_batch')
+            METRICS.record_iterations(self, 'implied_vol_batch', result.iterations)
+
+        return result
 
     def price_and_greeks(self, option: Option, market: Market) -> tuple[float, Greeks]:
-        return self._price_impl(option, market), self.greeks(option, market)
+        return self.price(option, market), self.greeks(option, market)
     
 @PricerFactory.register(PricerType.BLACK_SCHOLES)
 def _make_black_scholes(**kw) -> Pricer:
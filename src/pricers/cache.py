@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+import threading
+import time
+
+
+@dataclass(frozen = True, slots = True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+
+    """
+    Size-bounded least-recently-used map with optional time-to-live. Entries older
+    than ttl seconds (measured with clock) count as misses and are replaced on lookup.
+    Lookups and inserts hold a lock, computing a missing value does not: two threads
+    missing the same key both compute it.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be at least 1, got {maxsize}.')
+
+        if ttl is not None and not ttl > 0:
+            raise ValueError(f'ttl must be positive, got {ttl}.')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (value, insertion time), most recently used last
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and (self.ttl is None
+                                      or self._clock() - entry[1] < self.ttl):
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            self._misses += 1
+
+        value = compute()
+        self.put(key, value)
+
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
@@ -0,0 +1,147 @@
+"""
+Rate and dividend term structures. Curves interpolate log discount factors linearly
+in time (piecewise flat forward rates), with D(0) = 1 as the first node and the last
+forward rate held beyond the last pillar.
+
+Lookups take arrays of year fractions. A book usually has far fewer expiries than
+rows, so every lookup evaluates the curve once per unique maturity and scatters
+the values back to the rows.
+"""
+
+from dataclasses import dataclass, field
+import numpy as np
+
+
+def _unique(taus) -> tuple[np.ndarray, np.ndarray, tuple]:
+    taus = np.asarray(taus, dtype=float)
+    unique, inverse = np.unique(taus, return_inverse=True)
+    return unique, inverse.reshape(taus.shape), taus.shape
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class YieldCurve:
+
+    # pillar year fractions (positive, increasing) and log discount factors there
+    times: np.ndarray
+    log_discounts: np.ndarray
+
+    def __post_init__(self):
+
+        times = np.array(self.times, dtype=float)
+        log_discounts = np.array(self.log_discounts, dtype=float)
+
+        if times.ndim != 1 or times.size == 0 or times.shape != log_discounts.shape:
+            raise ValueError(f'Need one discount factor per pillar, got {times.size} '
+                             f'pillars and {log_discounts.size} values.')
+
+        if times[0] <= 0 or np.any(np.diff(times) <= 0):
+            raise ValueError(f'Curve pillars must be positive and increasing: {times}.')
+
+        if not np.all(np.isfinite(log_discounts)):
+            raise ValueError(f'Invalid discount factors: {np.exp(log_discounts)}.')
+
+        # the curve starts at D(0) = 1
+        times, log_discounts = np.append(0.0, times), np.append(0.0, log_discounts)
+        times.flags.writeable = log_discounts.flags.writeable = False
+
+        object.__setattr__(self, 'times', times)
+        object.__setattr__(self, 'log_discounts', log_discounts)
+
+    @classmethod
+    def from_zero_rates(cls, times, rates) -> 'YieldCurve':
+        # continuously compounded zero rates
+        times = np.asarray(times, dtype=float)
+        return cls(times, -np.asarray(rates, dtype=float) * times)
+
+    @classmethod
+    def from_discount_factors(cls, times, discount_factors) -> 'YieldCurve':
+
+        discount_factors = np.asarray(discount_factors, dtype=float)
+        if np.any(discount_factors <= 0):
+            raise ValueError(f'Discount factors must be positive: {discount_factors}.')
+
+        return cls(times, np.log(discount_factors))
+
+    def shifted(self, shift: float) -> 'YieldCurve':
+        # parallel move of the zero rates
+        times = self.times[1:]
+        return YieldCurve(times, self.log_discounts[1:] - shift * times)
+
+    def _log_discount(self, taus: np.ndarray) -> np.ndarray:
+
+        t, y = self.times, self.log_discounts
+
+        # flat forward after the last pillar, np.interp would hold the level instead
+        slope = (y[-1] - y[-2]) / (t[-1] - t[-2])
+        return np.where(taus <= t[-1], np.interp(taus, t, y),
+                        y[-1] + slope * (taus - t[-1]))
+
+    def discount(self, taus) -> np.ndarray:
+        unique, inverse, shape = _unique(taus)
+        return np.exp(self._log_discount(unique))[inverse].reshape(shape)
+
+    def zero_rates(self, taus) -> np.ndarray:
+
+        # continuously compounded, the first forward rate at tau = 0
+        unique, inverse, shape = _unique(taus)
+
+        short = -self.log_discounts[1] / self.times[1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = np.where(unique > 0, -self._log_discount(unique) / unique, short)
+
+        return rates[inverse].reshape(shape)
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class DividendCurve:
+
+    """
+    Continuous dividend yield term structure and / or discrete cash dividends.
+    Cash dividends are handled as escrowed: pricers see the spot net of the present
+    value of the dividends paid before the expiry.
+    """
+
+    yields: YieldCurve | None = None
+    # year fractions of the ex-dates and the cash amounts paid
+    cash_times: np.ndarray = field(default_factory=lambda: np.empty(0))
+    cash_amounts: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def __post_init__(self):
+
+        times = np.array(self.cash_times, dtype=float).reshape(-1)
+        amounts = np.array(self.cash_amounts, dtype=float).reshape(-1)
+
+        if times.shape != amounts.shape:
+            raise ValueError(f'Need one amount per dividend date, got {times.size} dates '
+                             f'and {amounts.size} amounts.')
+
+        if np.any(times <= 0) or np.any(amounts < 0):
+            raise ValueError(f'Cash dividends need future dates and non-negative amounts.')
+
+        order = np.argsort(times, kind='stable')
+        times, amounts = times[order], amounts[order]
+        times.flags.writeable = amounts.flags.writeable = False
+
+        object.__setattr__(self, 'cash_times', times)
+        object.__setattr__(self, 'cash_amounts', amounts)
+
+    def yield_rates(self, taus) -> np.ndarray:
+
+        if self.yields is None:
+            return np.zeros(np.shape(taus))
+
+        return self.yields.zero_rates(taus)
+
+    def cash_pv(self, taus, discount) -> np.ndarray:
+
+        """
+        Present value of the cash dividends going ex in (0, tau], discounted with
+        the callable discount(times) -> discount factors.
+        """
+
+        taus = np.asarray(taus, dtype=float)
+        if self.cash_times.size == 0:
+            return np.zeros(taus.shape)
+
+        cumulative = np.append(0.0, np.cumsum(self.cash_amounts * discount(self.cash_times)))
+        return cumulative[np.searchsorted(self.cash_times, taus, side='right')]
@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+
+from src.book import OptionBook
+from src.option import Option
+from src.pricers.base import Pricer
+from src.pricers.types import Market
+from src.pricers.factory import PricerFactory, PricerType
+
+# importing the pricer modules registers them with the factory
+import src.pricers.black_scholes
+import src.pricers.binary_tree
+import src.pricers.finite_difference
+import src.pricers.monte_carlo
+
+
+# cheapest first: closed form, then lattice / grid, then simulation
+DEFAULT_PRICER_ORDER = (PricerType.BLACK_SCHOLES, PricerType.BINARY_TREE,
+                        PricerType.FINITE_DIFFERENCE, PricerType.MONTE_CARLO)
+
+
+@dataclass(frozen = True, slots = True)
+class DispatchGroup:
+    # (payoff type, exercise type, direction, zero dividend) codes shared by the rows
+    key: tuple[int, int, int, bool]
+    # positions in the book as passed to the dispatcher
+    rows: np.ndarray
+    pricer: Pricer
+
+
+class BookDispatcher:
+
+    """
+    Prices a mixed book by splitting it into groups of identical (payoff type, exercise
+    type, direction, dividend condition) and sending each group as one price_batch
+    call to the first pricer of the list supporting it. Groups are independent and run
+    on a thread pool; prices come back in book order.
+    """
+
+    def __init__(self, pricers: Sequence[Pricer] | None = None,
+                 max_workers: int | None = None):
+
+        if pricers is None:
+            pricers = [PricerFactory.create(kind) for kind in DEFAULT_PRICER_ORDER]
+
+        if not pricers:
+            raise ValueError('BookDispatcher needs at least one pricer.')
+
+        self.pricers = tuple(pricers)
+        self.max_workers = max_workers
+
+    def plan(self, book: OptionBook | Sequence[Option], market: Market) -> list[DispatchGroup]:
+
+        if not isinstance(book, OptionBook):
+            book = OptionBook.from_options(book)
+
+        sorted_book, order, groups = book.grouped('payoff_types', 'exercise_types',
+                                                  'directions')
+        no_div = not market.has_dividends
+
+        plan = []
+        for (payoff_type, exercise_type, direction), rows in groups:
+
+            group = sorted_book[rows]
+            pending = np.ones(len(group), dtype=bool)
+
+            # payoff parameters (barriers, cash amounts) may still differ inside a
+            # group: rows the first pricer rejects fall through to the next one
+            for pricer in self.pricers:
+
+                accepted = pending & group.supported_mask(pricer, market)
+
+                if accepted.any():
+                    plan.append(DispatchGroup((payoff_type, exercise_type, direction, no_div),
+                                              order[rows][accepted], pricer))
+                    pending &= ~accepted
+
+                if not pending.any():
+                    break
+
+            if pending.any():
+                raise NotImplementedError(
+                    f'No pricer supports book row {int(order[rows][pending][0])}: '
+                    f'{group.option(int(np.argmax(pending)))}.')
+
+        return plan
+
+    def price(self, book: OptionBook | Sequence[Option], market: Market) -> np.ndarray:
+
+        if not isinstance(book, OptionBook):
+            book = OptionBook.from_options(book)
+
+        plan = self.plan(book, market)
+        prices = np.empty(len(book))
+
+        # pricers overriding price_batch read the book columns, the generic one
+        # iterates over the group's options
+        def run(group: DispatchGroup) -> np.ndarray:
+            return group.pricer.price_batch(book[group.rows], market)
+
+        if len(plan) <= 1 or self.max_workers == 1:
+            results = [run(group) for group in plan]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(run, plan))
+
+        for group, values in zip(plan, results):
+            prices[group.rows] = values
+
+        return prices
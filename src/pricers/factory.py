@@ -12,6 +12,10 @@ class PricerType(enum.Enum):
       BLACK_SCHOLES = enum.auto()
       BINARY_TREE = enum.auto()
       MONTE_CARLO = enum.auto()
+      LONGSTAFF_SCHWARTZ = enum.auto()
+      FINITE_DIFFERENCE = enum.auto()
+      FFT = enum.auto()
+      HESTON = enum.auto()
 
 @dataclass(frozen=True)
 class _PricesCtor(Protocol):
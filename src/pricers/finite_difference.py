@@ -0,0 +1,288 @@
+from dataclasses import dataclass
+import numpy as np
+from scipy.linalg import solve_banded
+
+from src.exercise import Exercise, EuropeanExercise, AmericanExercise, BermudanExercise
+from src.option import Option
+from src.payoff import Payoff, PayoffContext
+from src.pricers.base import Pricer
+from src.pricers.types import Market, Greeks
+from src.pricers.factory import PricerFactory, PricerType
+from src.pricers.time_utils import year_fraction, year_fractions, basis_mapping
+
+
+@dataclass(frozen = True, slots = True)
+class PDEParameters:
+    S: float
+    K: float
+    r: float
+    q: float
+    tau: float
+    sigma: float
+    # year fractions from today at which early exercise is allowed
+    exercise_times: np.ndarray
+    # for american rules: exercise allowed on the whole [exercise_start, tau] window
+    exercise_start: float | None = None
+
+
+@dataclass(frozen = True, slots = True)
+class _PDESolution:
+    grid: np.ndarray
+    values: np.ndarray
+    # values one time step before expiry-to-today completes, for theta
+    previous: np.ndarray
+    dt: float
+    # index of the spot node
+    spot: int
+
+
+def _sinh_grid(S: float, K: float, s_max: float, n: int, concentration: float) -> np.ndarray:
+
+    # nodes cluster around the strike, spacing ~ concentration * K there
+    c = concentration * K
+    xi = np.linspace(np.arcsinh(-K / c), np.arcsinh((s_max - K) / c), n + 1)
+    grid = K + c * np.sinh(xi)
+    grid[0] = 0.0
+
+    # move the closest interior node onto the spot so values and greeks need no
+    # interpolation
+    i = int(np.clip(np.argmin(np.abs(grid - S)), 1, n - 1))
+    grid[i] = S
+
+    return grid
+
+
+def _operator(grid: np.ndarray, r: float, q: float,
+              sigma: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    """
+    Tridiagonal Black-Scholes operator L V = 0.5 sigma^2 S^2 V_SS + (r - q) S V_S - r V
+    on a non-uniform grid, as (lower, diagonal, upper) coefficient vectors.
+    S = 0 reduces to V_tau = -r V, the top node uses linearity (V_SS = 0).
+    """
+
+    n = grid.size - 1
+    lower, diag, upper = np.zeros(n + 1), np.zeros(n + 1), np.zeros(n + 1)
+
+    s = grid[1:-1]
+    h_m, h_p = s - grid[:-2], grid[2:] - s
+    var, drift = 0.5 * sigma**2 * s**2, (r - q) * s
+
+    lower[1:-1] = (2 * var - drift * h_p) / (h_m * (h_m + h_p))
+    diag[1:-1] = (-2 * var + drift * (h_p - h_m)) / (h_m * h_p) - r
+    upper[1:-1] = (2 * var + drift * h_m) / (h_p * (h_m + h_p))
+
+    diag[0] = -r
+
+    h_top = grid[-1] - grid[-2]
+    lower[-1] = -(r - q) * grid[-1] / h_top
+    diag[-1] = (r - q) * grid[-1] / h_top - r
+
+    return lower, diag, upper
+
+
+class FiniteDifferencePricer(Pricer):
+
+    """
+    Crank-Nicolson solver of the Black-Scholes PDE on a sinh-stretched spot grid
+    concentrated around the strike, with Rannacher start-up (a few fully implicit
+    steps) to damp payoff kinks. Each time step is one banded tridiagonal solve.
+
+    Early exercise uses the penalty method: the linear system is re-solved with a large
+    penalty on nodes below the exercise value until the active set settles.
+    Delta, gamma and theta are read off the final grid.
+    """
+
+    def __init__(self, n_space: int = 400, n_time: int = 400, rannacher_steps: int = 4,
+                 concentration: float = .1, penalty: float = 1e8, max_penalty_iter: int = 50):
+
+        if n_space < 4 or n_time < 1:
+            raise ValueError(f'Invalid grid size: n_space={n_space}, n_time={n_time}.')
+
+        self.n_space = n_space
+        self.n_time = n_time
+        self.rannacher_steps = rannacher_steps
+        self.concentration = concentration
+        self.penalty = penalty
+        self.max_penalty_iter = max_penalty_iter
+
+    def is_supported(self, option: Option, market: Market) -> bool:
+
+        # grid nodes only carry the spot: payoffs must not depend on the path
+        return ( not option.payoff.path_dependent
+                and isinstance(option.exercise, (EuropeanExercise, AmericanExercise,
+                                                 BermudanExercise))
+                )
+
+    def is_valid_market_data(self, market: Market) -> bool:
+
+        if not market.has_vol:
+            raise ValueError(f'Must provide a volatility value for PDE pricing.')
+
+        return True
+
+    def get_pde_inputs(self, option: Option, market: Market) -> PDEParameters:
+
+        self.is_valid_market_data(market)
+
+        tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+        exercise_times, exercise_start = self._exercise_schedule(option.exercise, market)
+
+        S, r, q = market.carry(tau)
+
+        return PDEParameters(S = S,
+                             K = float(option.strike),
+                             r = r,
+                             q = q,
+                             tau = tau,
+                             sigma = float(market.vols(option.strike, tau)),
+                             exercise_times = exercise_times,
+                             exercise_start = exercise_start)
+
+    def _exercise_schedule(self, exercise: Exercise,
+                           market: Market) -> tuple[np.ndarray, float | None]:
+
+        # american rules list every calendar day: treat them as a continuous window
+        if isinstance(exercise, AmericanExercise):
+            start = max(0.0, year_fraction(market.today, exercise.start, market.basis))
+            return np.empty(0), start
+
+        times = year_fractions(market.today, exercise.exercise_dates(), market.basis)
+
+        return times[times >= 0.0], None
+
+    def _exercise_mask(self, params: PDEParameters, dt: float) -> np.ndarray:
+
+        # indexed by calendar step i, time t_i = i dt from today
+        mask = np.zeros(self.n_time + 1, dtype=bool)
+
+        if params.exercise_start is not None:
+            mask[int(np.ceil(params.exercise_start / dt - 1e-9)):] = True
+        else:
+            steps = np.rint(params.exercise_times / dt).astype(int)
+            mask[steps[steps <= self.n_time]] = True
+
+        return mask
+
+    def _price_impl(self, option: Option, market: Market) -> float:
+
+        params = self.get_pde_inputs(option, market)
+
+        # "immediate" exercise
+        if params.tau == 0.0 or params.sigma == 0.0:
+            return option.payoff.value(params.K, PayoffContext(spot=params.S))
+
+        solution = self._solve(option.payoff, params)
+        return float(solution.values[solution.spot])
+
+    def greeks(self, option: Option, market: Market) -> Greeks:
+        return self.price_and_greeks(option, market)[1]
+
+    def price_and_greeks(self, option: Option, market: Market) -> tuple[float, Greeks]:
+        return self._memoize('price_and_greeks', option, market, 
+                             lambda: self._price_and_greeks_impl(option, market))
+
+    def _price_and_greeks_impl(self, option: Option, 
+                               market: Market) -> tuple[float, Greeks]:
+
+        # one grid gives both the price and its spot / time derivatives
+        self.validate_option_priceable(option, market)
+        params = self.get_pde_inputs(option, market)
+
+        if params.tau == 0.0 or params.sigma == 0.0:
+            value = option.payoff.value(params.K, PayoffContext(spot=params.S))
+            return value, Greeks(delta = None, gamma = None, vega = None, theta = None, 
+                                 rho = None)
+
+        solution = self._solve(option.payoff, params)
+        i, s, v = solution.spot, solution.grid, solution.values
+
+        h_m, h_p = s[i] - s[i - 1], s[i + 1] - s[i]
+
+        delta = ( -h_p / (h_m * (h_m + h_p)) * v[i - 1]
+                 + (h_p - h_m) / (h_m * h_p) * v[i]
+                 + h_m / (h_p * (h_m + h_p)) * v[i + 1] )
+
+        gamma = 2 * ( v[i - 1] / (h_m * (h_m + h_p))
+                     - v[i] / (h_m * h_p)
+                     + v[i + 1] / (h_p * (h_m + h_p)) )
+
+        # dV/dt = -dV/dtau, per day as in the Black-Scholes pricer
+        theta = -(v[i] - solution.previous[i]) / solution.dt / basis_mapping[market.basis]
+
+        # vol and rate sensitivities are not available from a single grid
+        return float(v[i]), Greeks(float(delta), float(gamma), None, float(theta), None)
+
+    def _solve(self, payoff: Payoff, params: PDEParameters) -> _PDESolution:
+
+        s_max = max(params.S, params.K) * np.exp(6 * params.sigma * np.sqrt(params.tau)
+                                                 + abs(params.r - params.q) * params.tau)
+        grid = _sinh_grid(params.S, params.K, max(s_max, 2 * max(params.S, params.K)),
+                          self.n_space, self.concentration)
+        spot = int(np.flatnonzero(grid == params.S)[0])
+
+        lower, diag, upper = _operator(grid, params.r, params.q, params.sigma)
+
+        dt = params.tau / self.n_time
+        exercise = self._exercise_mask(params, dt)
+        intrinsic = payoff.values(params.K, grid)
+
+        # (I - theta dt L) in solve_banded layout, for implicit and crank-nicolson steps
+        systems = {}
+        for theta in (1.0, 0.5):
+            banded = np.zeros((3, grid.size))
+            banded[0, 1:] = -theta * dt * upper[:-1]
+            banded[1] = 1.0 - theta * dt * diag
+            banded[2, :-1] = -theta * dt * lower[1:]
+            systems[theta] = banded
+
+        values = intrinsic.copy()
+        previous = values
+
+        # march from expiry (calendar step n_time) back to today (step 0)
+        for step in range(self.n_time - 1, -1, -1):
+
+            theta = 1.0 if self.n_time - 1 - step < self.rannacher_steps else 0.5
+            banded = systems[theta]
+            previous = values
+
+            # (I - theta dt L) V_new = (I + (1 - theta) dt L) V_old
+            explicit = (1 - theta) * dt
+            rhs = values + explicit * diag * values
+            rhs[1:] += explicit * lower[1:] * values[:-1]
+            rhs[:-1] += explicit * upper[:-1] * values[1:]
+
+            values = solve_banded((1, 1), banded, rhs)
+
+            if exercise[step]:
+                values = self._penalize(banded, rhs, values, intrinsic)
+
+        return _PDESolution(grid, values, previous, dt, spot)
+
+    def _penalize(self, banded: np.ndarray, rhs: np.ndarray, values: np.ndarray,
+                  intrinsic: np.ndarray) -> np.ndarray:
+
+        # penalty iteration: (A + P) V = rhs + P g with P = penalty on V < g nodes
+        active = values < intrinsic
+
+        for _ in range(self.max_penalty_iter):
+
+            if not active.any():
+                break
+
+            penalized = banded.copy()
+            penalized[1] += self.penalty * active
+            values = solve_banded((1, 1), penalized, rhs + self.penalty * active * intrinsic)
+
+            next_active = values < intrinsic
+            if np.array_equal(next_active, active):
+                break
+
+            active = next_active
+
+        return np.maximum(values, intrinsic)
+
+
+@PricerFactory.register(PricerType.FINITE_DIFFERENCE)
+def _make_finite_difference(**kw) -> Pricer:
+    return FiniteDifferencePricer(**kw)
@@ -0,0 +1,229 @@
+"""
+Opt-in pricing metrics. One process-wide registry, METRICS, collects per-pricer call
+counters, per-stage timers, solver iteration histograms, and the hit rates of the
+pricers' result caches. It exports them as a dict snapshot or in the Prometheus text
+exposition format.
+
+Disabled by default. While it is off, instrumented code pays one attribute check per
+call, and stage() hands back a shared no-op context manager.
+"""
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import threading
+import time
+import weakref
+
+import numpy as np
+
+# upper bounds of the solver iteration buckets, +inf bucket implied
+ITERATION_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+_NULL = nullcontext()
+
+
+@dataclass(slots = True)
+class _Timer:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclass(slots = True)
+class _Histogram:
+    # non-cumulative counts per bucket, last one is +inf
+    counts: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(ITERATION_BUCKETS) + 1, dtype=np.int64))
+    count: int = 0
+    total: float = 0.0
+
+    def add(self, values) -> None:
+        values = np.ravel(np.asarray(values, dtype=float))
+        self.counts += np.bincount(np.searchsorted(ITERATION_BUCKETS, values),
+                                   minlength=self.counts.size)
+        self.count += values.size
+        self.total += float(values.sum())
+
+
+class _Stage:
+
+    # plain class rather than a generator based context manager, cheaper to enter
+    __slots__ = ('registry', 'pricer', 'name', 'start')
+
+    def __init__(self, registry: 'MetricsRegistry', pricer, name: str):
+        self.registry, self.pricer, self.name = registry, pricer, name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.registry.record_time(self.pricer, self.name, time.perf_counter() - self.start)
+
+
+def _owner(pricer) -> str:
+    return pricer if isinstance(pricer, str) else pricer.__class__.__name__
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        # caches are read at snapshot time, never touched on the hot path. counts
+        # are reported relative to their value at the last reset
+        self._caches = weakref.WeakKeyDictionary()
+        self._cache_baselines = weakref.WeakKeyDictionary()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls: dict[tuple[str, str], int] = {}
+            self._timers: dict[tuple[str, str], _Timer] = {}
+            self._histograms: dict[tuple[str, str], _Histogram] = {}
+
+            for cache in list(self._caches.values()):
+                stats = cache.stats()
+                self._cache_baselines[cache] = (stats.hits, stats.misses, stats.evictions)
+
+    def count(self, pricer, method: str, n: int = 1) -> None:
+        key = (_owner(pricer), method)
+        with self._lock:
+            self._calls[key] = self._calls.get(key, 0) + n
+
+    def record_time(self, pricer, stage: str, seconds: float) -> None:
+        key = (_owner(pricer), stage)
+        with self._lock:
+            self._timers.setdefault(key, _Timer()).add(seconds)
+
+    def record_iterations(self, pricer, solver: str, iterations) -> None:
+        key = (_owner(pricer), solver)
+        with self._lock:
+            self._histograms.setdefault(key, _Histogram()).add(iterations)
+
+    def stage(self, pricer, name: str):
+
+        # `with METRICS.stage(self, 'inputs'): ...` times the block when enabled
+        if not self.enabled:
+            return _NULL
+
+        return _Stage(self, pricer, name)
+
+    def track_cache(self, pricer, cache) -> None:
+        # None stops tracking, e.g. when the pricer drops its cache
+        if cache is None:
+            self._caches.pop(pricer, None)
+        else:
+            self._caches[pricer] = cache
+
+    def snapshot(self) -> dict:
+
+        with self._lock:
+            calls = dict(self._calls)
+            timers = {k: (t.count, t.total, t.max) for k, t in self._timers.items()}
+            histograms = {k: (h.counts.copy(), h.count, h.total)
+                          for k, h in self._histograms.items()}
+
+        caches: dict[str, dict] = {}
+        for pricer, cache in list(self._caches.items()):
+            stats = cache.stats()
+            hits, misses, evictions = self._cache_baselines.get(cache, (0, 0, 0))
+            hits, misses = stats.hits - hits, stats.misses - misses
+
+            # caches idle since the last reset are left out
+            if hits + misses == 0:
+                continue
+
+            entry = caches.setdefault(_owner(pricer), {'hits': 0, 'misses': 0,
+                                                       'evictions': 0, 'size': 0})
+            entry['hits'] += hits
+            entry['misses'] += misses
+            entry['evictions'] += stats.evictions - evictions
+            entry['size'] += stats.size
+
+        for entry in caches.values():
+            lookups = entry['hits'] + entry['misses']
+            entry['hit_rate'] = entry['hits'] / lookups if lookups else 0.0
+
+        out: dict[str, dict] = {}
+
+        def section(owner: str) -> dict:
+            return out.setdefault(owner, {'calls': {}, 'stages': {}, 'solvers': {},
+                                          'cache': None})
+
+        for (owner, method), n in calls.items():
+            section(owner)['calls'][method] = n
+
+        for (owner, stage), (n, total, longest) in timers.items():
+            section(owner)['stages'][stage] = {'count': n, 'total_seconds': total,
+                                               'mean_seconds': total / n,
+                                               'max_seconds': longest}
+
+        for (owner, solver), (counts, n, total) in histograms.items():
+            section(owner)['solvers'][solver] = {
+                'buckets': dict(zip([*map(str, ITERATION_BUCKETS), '+Inf'],
+                                    counts.tolist())),
+                'count': n, 'sum': total}
+
+        for owner, entry in caches.items():
+            section(owner)['cache'] = entry
+
+        return out
+
+    def to_prometheus(self, prefix: str = 'pricer') -> str:
+
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        def family(name: str, kind: str, samples: list[tuple[str, dict, float]]):
+            if samples:
+                lines.append(f'# TYPE {prefix}_{name} {kind}')
+                for suffix, labels, value in samples:
+                    rendered = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                    lines.append(f'{prefix}_{name}{suffix}{{{rendered}}} {value:.17g}')
+
+        family('calls_total', 'counter',
+               [('', {'pricer': owner, 'method': method}, n)
+                for owner, s in snapshot.items() for method, n in s['calls'].items()])
+
+        family('stage_seconds', 'summary',
+               [sample for owner, s in snapshot.items()
+                for stage, t in s['stages'].items()
+                for sample in (('_sum', {'pricer': owner, 'stage': stage},
+                                t['total_seconds']),
+                               ('_count', {'pricer': owner, 'stage': stage}, t['count']))])
+
+        histogram = []
+        for owner, s in snapshot.items():
+            for solver, h in s['solvers'].items():
+                labels = {'pricer': owner, 'solver': solver}
+                cumulative = 0
+                for bound, n in h['buckets'].items():
+                    cumulative += n
+                    histogram.append(('_bucket', {**labels, 'le': bound}, cumulative))
+                histogram.append(('_sum', labels, h['sum']))
+                histogram.append(('_count', labels, h['count']))
+        family('solver_iterations', 'histogram', histogram)
+
+        cached = [(owner, s['cache']) for owner, s in snapshot.items() if s['cache']]
+        family('cache_hits_total', 'counter',
+               [('', {'pricer': owner}, c['hits']) for owner, c in cached])
+        family('cache_misses_total', 'counter',
+               [('', {'pricer': owner}, c['misses']) for owner, c in cached])
+        family('cache_hit_ratio', 'gauge',
+               [('', {'pricer': owner}, c['hit_rate']) for owner, c in cached])
+
+        return '\n'.join(lines) + '\n'
+
+
+METRICS = MetricsRegistry()
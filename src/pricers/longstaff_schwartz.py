@@ -0,0 +1,341 @@
+import copy
+from dataclasses import dataclass
+import numpy as np
+from numpy.polynomial import laguerre
+
+from src.exercise import Exercise, EuropeanExercise, AmericanExercise, BermudanExercise
+from src.option import Option
+from src.payoff import (Payoff, AsianArithmeticPayoff, AsianGeometricPayoff,
+                        LookbackPayoff, BarrierPayoff, BarrierType)
+from src.pricers.base import Pricer
+from src.pricers.types import Market, MCResult
+from src.pricers.factory import PricerFactory, PricerType
+from src.pricers.time_utils import year_fraction, year_fractions
+
+
+@dataclass(frozen = True, slots = True)
+class LSMParameters:
+    S: float
+    K: float
+    r: float
+    q: float
+    tau: float
+    sigma: float
+    # increasing year fractions of the exercise dates, the last one being tau
+    exercise_times: np.ndarray
+    # exercise allowed today, compared against the continuation estimate at t = 0
+    exercise_today: bool
+
+
+@dataclass(frozen = True, slots = True)
+class _PathState:
+
+    # per-path summary of the fixings seen so far, enough to value every payoff with a
+    # running state: the count and sums for asians, the extremes for lookbacks and
+    # barriers (touched the barrier <=> the running max / min crossed it)
+    count: int
+    total: np.ndarray
+    log_total: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+
+    @classmethod
+    def start(cls, spot: float, n_paths: int, fixed_today: bool) -> '_PathState':
+
+        if not fixed_today:
+            empty = np.zeros(n_paths)
+            return cls(0, empty, empty, np.full(n_paths, -np.inf),
+                       np.full(n_paths, np.inf))
+
+        today = np.full(n_paths, spot)
+        return cls(1, today, np.log(today), today, today)
+
+    def advanced(self, s: np.ndarray) -> '_PathState':
+        return _PathState(self.count + 1, self.total + s, self.log_total + np.log(s),
+                          np.maximum(self.high, s), np.minimum(self.low, s))
+
+
+def _has_running_state(payoff: Payoff) -> bool:
+
+    if isinstance(payoff, BarrierPayoff):
+        return _has_running_state(payoff.underlying)
+
+    return (not payoff.path_dependent
+            or isinstance(payoff, (AsianArithmeticPayoff, AsianGeometricPayoff,
+                                   LookbackPayoff)))
+
+
+def _state_values(payoff: Payoff, K: float, state: _PathState,
+                  s: np.ndarray) -> np.ndarray:
+
+    # payoff on the fixings seen so far, rebuilt from the running state
+    if not payoff.path_dependent:
+        return payoff.values(K, s)
+
+    if isinstance(payoff, AsianArithmeticPayoff):
+        return payoff.values(K, state.total / state.count)
+
+    if isinstance(payoff, AsianGeometricPayoff):
+        return payoff.values(K, np.exp(state.log_total / state.count))
+
+    if isinstance(payoff, LookbackPayoff):
+        return payoff.values(K, np.column_stack((state.low, state.high)))
+
+    if payoff.barrier_type in (BarrierType.UP_AND_OUT, BarrierType.UP_AND_IN):
+        touched = state.high >= payoff.barrier
+    else:
+        touched = state.low <= payoff.barrier
+
+    knock_in = payoff.barrier_type in (BarrierType.UP_AND_IN, BarrierType.DOWN_AND_IN)
+    alive = touched if knock_in else ~touched
+
+    return np.where(alive, _state_values(payoff.underlying, K, state, s), 0.0)
+
+
+def _state_regressors(payoff: Payoff, state: _PathState) -> list[np.ndarray]:
+
+    # the state the continuation value depends on besides the spot. a barrier adds
+    # none of its own: the knocked flag already decides which paths are in the money,
+    # so the regression only ever sees paths sharing the same flag
+    if isinstance(payoff, AsianArithmeticPayoff):
+        return [state.total / state.count]
+
+    if isinstance(payoff, AsianGeometricPayoff):
+        return [np.exp(state.log_total / state.count)]
+
+    if isinstance(payoff, LookbackPayoff):
+        return [state.high if payoff.direction.value > 0 else state.low]
+
+    if isinstance(payoff, BarrierPayoff):
+        return _state_regressors(payoff.underlying, state)
+
+    return []
+
+
+class LongstaffSchwartzPricer(Pricer):
+
+    """
+    Least-squares Monte Carlo (Longstaff-Schwartz) under GBM for early-exercise rules.
+
+    Paths are built backwards from expiry with a Brownian bridge, one exercise date at a
+    time, so only the current slice of spots and the cash-flow vector are ever held in
+    memory, never the (n_paths, n_dates) path tensor. Continuation values are regressed
+    on Laguerre polynomials of the moneyness, over in-the-money paths only.
+
+    Path-dependent payoffs (asians, lookbacks, barriers) are fixed on the exercise dates,
+    today's included when it is one. They need the past of each path, which the bridge
+    cannot give: paths are simulated forward instead, carrying a running state (sums,
+    extremes) rather than the fixings. The forward pass keeps a checkpoint every
+    ~sqrt(n_dates) dates and the backward pass replays one segment at a time from them,
+    so memory stays at O(sqrt(n_dates)) slices. The regression adds the state to the
+    spot: the running average for asians, the running extreme for lookbacks.
+    """
+
+    def __init__(self, n_paths: int = 100_000, degree: int = 3, seed: int | None = None):
+
+        if n_paths < 2 or degree < 1:
+            raise ValueError(f'Invalid LSM settings: n_paths={n_paths}, degree={degree}.')
+
+        self.n_paths = n_paths
+        self.degree = degree
+        self.seed = seed
+
+    def is_supported(self, option: Option, market: Market) -> bool:
+
+        if not option.payoff.path_dependent:
+            return isinstance(option.exercise, (EuropeanExercise, AmericanExercise,
+                                                BermudanExercise))
+
+        # path-dependent payoffs are fixed on the exercise dates: a european would be
+        # fixed once, at expiry, which is not what its payoff means
+        return ( _has_running_state(option.payoff)
+                and isinstance(option.exercise, (AmericanExercise, BermudanExercise))
+                )
+
+    def is_valid_market_data(self, market: Market) -> bool:
+
+        if not market.has_vol:
+            raise ValueError(f'Must provide a volatility value for Monte Carlo pricing.')
+
+        return True
+
+    def get_lsm_inputs(self, option: Option, market: Market) -> LSMParameters:
+
+        self.is_valid_market_data(market)
+
+        tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+        times, exercise_today = self._exercise_schedule(option.exercise, market, tau)
+
+        S, r, q = market.carry(tau)
+
+        return LSMParameters(S = S,
+                             K = float(option.strike),
+                             r = r,
+                             q = q,
+                             tau = tau,
+                             sigma = float(market.vols(option.strike, tau)),
+                             exercise_times = times,
+                             exercise_today = exercise_today)
+
+    def _exercise_schedule(self, exercise: Exercise, market: Market,
+                           tau: float) -> tuple[np.ndarray, bool]:
+
+        times = year_fractions(market.today, exercise.exercise_dates(), market.basis)
+
+        exercise_today = bool((times == 0.0).any())
+        times = np.unique(np.append(times[(times > 0.0) & (times < tau)], tau))
+
+        return times, exercise_today
+
+    def _price_impl(self, option: Option, market: Market) -> float:
+        return self.simulate(option, market).estimate
+
+    def _common_random_numbers(self) -> 'LongstaffSchwartzPricer':
+
+        # bumped markets must see the same draws: pin the seed of an unseeded pricer
+        if self.seed is not None:
+            return self
+
+        pinned = copy.copy(self)
+        pinned.seed, pinned.cache = np.random.SeedSequence().entropy, None
+        return pinned
+
+    def simulate(self, option: Option, market: Market) -> MCResult:
+
+        self.validate_option_priceable(option, market)
+        params = self.get_lsm_inputs(option, market)
+
+        # "immediate" exercise
+        if params.tau == 0.0:
+            return MCResult(float(option.payoff.values(params.K, [params.S])[0]), 0.0, 0)
+
+        if option.payoff.path_dependent:
+            cash = self._path_dependent_pass(option.payoff, params)
+        else:
+            cash = self._backward_pass(option.payoff, params)
+
+        estimate = float(cash.mean())
+        std_error = float(cash.std(ddof=1) / np.sqrt(cash.size))
+
+        if params.exercise_today:
+            estimate = max(estimate, float(option.payoff.values(params.K, [params.S])[0]))
+
+        return MCResult(estimate, std_error, cash.size)
+
+    def _backward_pass(self, payoff: Payoff, params: LSMParameters) -> np.ndarray:
+
+        rng = np.random.default_rng(self.seed)
+        times = params.exercise_times
+
+        drift = params.r - params.q - 0.5 * params.sigma**2
+        log_s0 = np.log(params.S)
+
+        def spots(t: float, w: np.ndarray) -> np.ndarray:
+            return np.exp(log_s0 + drift * t + params.sigma * w)
+
+        # brownian motion at expiry, then bridged back one exercise date at a time
+        w = np.sqrt(times[-1]) * rng.standard_normal(self.n_paths)
+        cash = payoff.values(params.K, spots(times[-1], w))
+
+        for k in range(len(times) - 2, -1, -1):
+
+            t, t_next = times[k], times[k + 1]
+
+            # W(t) | W(t_next) ~ N(W(t_next) t / t_next, t (t_next - t) / t_next)
+            w *= t / t_next
+            w += np.sqrt(t * (t_next - t) / t_next) * rng.standard_normal(self.n_paths)
+
+            # cash flows are carried discounted to the current slice
+            cash *= np.exp(-params.r * (t_next - t))
+
+            s = spots(t, w)
+            self._exercise(cash, payoff.values(params.K, s), [s / params.K])
+
+        cash *= np.exp(-params.r * times[0])
+        return cash
+
+    def _path_dependent_pass(self, payoff: Payoff, params: LSMParameters) -> np.ndarray:
+
+        times = params.exercise_times
+        n_dates, K = len(times), params.K
+
+        # one stream per date, so any segment of the forward path can be replayed
+        streams = np.random.SeedSequence(self.seed).spawn(n_dates)
+        steps = np.sqrt(np.diff(times, prepend=0.0))
+        span = int(np.ceil(np.sqrt(n_dates)))
+
+        drift = params.r - params.q - 0.5 * params.sigma**2
+        log_s0 = np.log(params.S)
+
+        def advance(k: int, w: np.ndarray, state: _PathState):
+            z = np.random.default_rng(streams[k]).standard_normal(self.n_paths)
+            w = w + steps[k] * z
+            s = np.exp(log_s0 + drift * times[k] + params.sigma * w)
+            return w, s, state.advanced(s)
+
+        # forward: brownian motion and state at the start of every segment
+        w = np.zeros(self.n_paths)
+        state = _PathState.start(params.S, self.n_paths, params.exercise_today)
+        checkpoints = []
+
+        for k in range(n_dates):
+            if k % span == 0:
+                checkpoints.append((w, state))
+            w, _, state = advance(k, w, state)
+
+        # backward: replay each segment from its checkpoint, latest first
+        cash = None
+
+        for first in range(len(checkpoints) - 1, -1, -1):
+
+            w, state = checkpoints[first]
+            segment = []
+
+            for k in range(first * span, min((first + 1) * span, n_dates)):
+                w, s, state = advance(k, w, state)
+                segment.append((s, state))
+
+            for k in range(min((first + 1) * span, n_dates) - 1, first * span - 1, -1):
+
+                s, state = segment[k - first * span]
+                exercise_value = _state_values(payoff, K, state, s)
+
+                if cash is None:
+                    cash = exercise_value
+                    continue
+
+                cash *= np.exp(-params.r * (times[k + 1] - times[k]))
+
+                regressors = [s / K] + [x / K for x in _state_regressors(payoff, state)]
+                self._exercise(cash, exercise_value, regressors)
+
+        cash *= np.exp(-params.r * times[0])
+        return cash
+
+    def _exercise(self, cash: np.ndarray, exercise_value: np.ndarray,
+                  regressors: list[np.ndarray]) -> None:
+
+        # regress discounted cash flows on the in-the-money paths, exercise in place
+        # where the payoff beats the continuation estimate. state regressors enter
+        # through their own polynomials and a cross term with the spot
+        itm = np.flatnonzero(exercise_value > 0)
+
+        x, *states = (r[itm] for r in regressors)
+        columns = [laguerre.lagvander(x, self.degree)]
+        for y in states:
+            columns += [laguerre.lagvander(y, self.degree)[:, 1:], (x * y)[:, None]]
+
+        basis = np.hstack(columns)
+        if itm.size <= basis.shape[1]:
+            return
+
+        coef, *_ = np.linalg.lstsq(basis, cash[itm], rcond=None)
+        continuation = basis @ coef
+
+        exercise = itm[exercise_value[itm] > continuation]
+        cash[exercise] = exercise_value[exercise]
+
+
+@PricerFactory.register(PricerType.LONGSTAFF_SCHWARTZ)
+def _make_longstaff_schwartz(**kw) -> Pricer:
+    return LongstaffSchwartzPricer(**kw)
@@ -0,0 +1,40 @@
+"""
+Normal distribution kernels used by the pricers, bypassing scipy.stats.norm: its
+generic rv_continuous machinery (argument checks, broadcasting of loc / scale, output
+placement) costs several microseconds per call on top of the actual evaluation.
+
+Accuracy
+    norm_cdf is scipy.special.ndtr, the routine scipy.stats.norm.cdf ends up calling,
+    so results are identical: Cephes erf / erfc based, relative error of order 1e-16
+    over the whole real line (no cancellation in the lower tail).
+    norm_cdf_scalar is 0.5 * erfc(-x / sqrt(2)) with the C library erfc. Rounding of
+    the scaled argument dominates in the tails: relative difference to ndtr below
+    (1 + x^2) * 4e-16 down to x = -37 (1e-14 at x = -5), below which N(x) is
+    subnormal and both lose relative precision.
+    norm_pdf(_scalar) is exp(-x^2 / 2) / sqrt(2 pi), relative error about
+    (1 + x^2) * 1.1e-16 from the rounding of x^2, i.e. below 1e-14 for |x| < 10.
+"""
+
+import math
+import numpy as np
+from scipy.special import ndtr
+
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+def norm_cdf(x) -> np.ndarray:
+    return ndtr(x)
+
+
+def norm_pdf(x) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    return INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def norm_cdf_scalar(x: float) -> float:
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+
+def norm_pdf_scalar(x: float) -> float:
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
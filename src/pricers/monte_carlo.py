@@ -0,0 +1,593 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+import enum
+import warnings
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from src.exercise import EuropeanExercise
+from src.option import Option
+from src.payoff import (Payoff, PayoffContext, VanillaPayoff, AsianArithmeticPayoff,
+                        AsianGeometricPayoff)
+from src.pricers.base import Pricer
+from src.pricers.black_scholes import BSBatchParameters, bs_price_arrays
+from src.pricers.types import Market, MCResult, Greeks
+from src.pricers.factory import PricerFactory, PricerType
+from src.pricers.time_utils import year_fraction, basis_mapping
+from src.pricers.math_kernels import norm_cdf_scalar
+
+
+class ControlVariate(enum.Enum):
+    NONE = enum.auto()
+    # discounted vanilla payoff on the terminal spot, mean given by Black-Scholes
+    BLACK_SCHOLES = enum.auto()
+    # discounted geometric average payoff on the same fixings, closed-form mean
+    GEOMETRIC_ASIAN = enum.auto()
+
+
+class Sampler(enum.Enum):
+    PSEUDO_RANDOM = enum.auto()
+    # scrambled Sobol points, paths built with a Brownian bridge
+    SOBOL = enum.auto()
+
+
+@dataclass(frozen = True, slots = True)
+class MCParameters:
+    S: float
+    K: float
+    r: float
+    q: float
+    tau: float
+    sigma: float
+    n_steps: int
+
+
+@dataclass(frozen = True, slots = True)
+class _SimulationConfig:
+    antithetic: bool
+    control_variate: ControlVariate
+    sampler: Sampler
+    # pathwise / likelihood ratio greeks estimated on the same paths as the price
+    greeks: bool = False
+
+
+@dataclass(slots = True)
+class _Moments:
+
+    """
+    Running count / mean / sum of squared deviations of the discounted payoffs, plus
+    the same quantities for an optional control and its co-moment with the payoffs.
+    Chunks are folded in with Chan's pairwise update so the standard error stays exact
+    without keeping the samples.
+    """
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    mean_x: float = 0.0
+    m2_x: float = 0.0
+    c_xy: float = 0.0
+
+    def add(self, samples: np.ndarray, controls: np.ndarray | None = None) -> None:
+
+        if samples.size == 0:
+            return
+
+        mean = float(samples.mean())
+        dev = samples - mean
+        other = _Moments(samples.size, mean, float(dev @ dev))
+
+        if controls is not None:
+            other.mean_x = float(controls.mean())
+            dev_x = controls - other.mean_x
+            other.m2_x, other.c_xy = float(dev_x @ dev_x), float(dev_x @ dev)
+
+        self.merge(other)
+
+    def merge(self, other: '_Moments') -> None:
+
+        n = self.n + other.n
+        if n == 0:
+            return
+
+        weight = self.n * other.n / n
+        delta, delta_x = other.mean - self.mean, other.mean_x - self.mean_x
+
+        self.mean += delta * other.n / n
+        self.mean_x += delta_x * other.n / n
+        self.m2 += other.m2 + delta**2 * weight
+        self.m2_x += other.m2_x + delta_x**2 * weight
+        self.c_xy += other.c_xy + delta * delta_x * weight
+        self.n = n
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float('nan')
+
+    @property
+    def std_error(self) -> float:
+        if self.n < 2:
+            return float('nan')
+        return float(np.sqrt(self.m2 / (self.n - 1) / self.n))
+
+    def beta(self) -> float:
+        # optimal control coefficient cov(Y, X) / var(X)
+        return self.c_xy / self.m2_x if self.m2_x > 0 else 0.0
+
+    def controlled(self, control_mean: float, beta: float) -> tuple[float, float]:
+
+        # estimate and per-sample variance of Y - beta (X - E[X])
+        estimate = self.mean - beta * (self.mean_x - control_mean)
+        m2 = self.m2 - 2 * beta * self.c_xy + beta**2 * self.m2_x
+
+        return estimate, (m2 / (self.n - 1) if self.n > 1 else float('nan'))
+
+
+@dataclass(slots = True)
+class _ChunkResult:
+    replication: int
+    # one sample per path, or per antithetic pair, with the control alongside
+    units: _Moments = field(default_factory=_Moments)
+    # one sample per path, no variance reduction: the baseline for the reported ratio
+    raw: _Moments = field(default_factory=_Moments)
+    # one per greek, in Greeks field order, sampled like units
+    greeks: tuple[_Moments, ...] = ()
+
+
+def _bridge_schedule(n_steps: int) -> list[tuple[int, int, int, float, float, float]]:
+
+    """
+    Brownian bridge construction order on the grid t_i = (i + 1) dt, i < n_steps:
+    the first normal sets W(T), each next one fills the midpoint of a gap left by the
+    previous level. Entries are (index, left, right, left weight, right weight, std in
+    units of sqrt(dt)), left = -1 standing for W(0) = 0.
+    """
+
+    schedule = [(n_steps - 1, -1, -1, 0.0, 0.0, np.sqrt(n_steps))]
+    gaps = [(-1, n_steps - 1)]
+
+    while gaps:
+        next_gaps = []
+        for left, right in gaps:
+            if right - left < 2:
+                continue
+
+            mid = (left + right + 1) // 2
+            t_l, t_m, t_r = left + 1, mid + 1, right + 1
+
+            schedule.append((mid, left, right, (t_r - t_m) / (t_r - t_l),
+                             (t_m - t_l) / (t_r - t_l),
+                             np.sqrt((t_m - t_l) * (t_r - t_m) / (t_r - t_l))))
+            next_gaps += [(left, mid), (mid, right)]
+
+        gaps = next_gaps
+
+    return schedule
+
+
+def _bridge_increments(z: np.ndarray) -> np.ndarray:
+
+    # maps normals in bridge order to standard normal increments in time order, so the
+    # leading (best distributed) sobol dimensions drive the coarse shape of the path
+    w = np.empty_like(z)
+
+    for k, (i, left, right, w_left, w_right, std) in enumerate(_bridge_schedule(z.shape[1])):
+
+        if right == -1:
+            w[:, i] = std * z[:, k]
+            continue
+
+        w_l = w[:, left] if left >= 0 else 0.0
+        w[:, i] = w_left * w_l + w_right * w[:, right] + std * z[:, k]
+
+    return np.diff(w, axis=1, prepend=0.0)
+
+
+def _normals(config: _SimulationConfig, seed: np.random.SeedSequence, start: int,
+             size: int, n_steps: int) -> np.ndarray:
+
+    if config.sampler is Sampler.PSEUDO_RANDOM:
+        return np.random.default_rng(seed).standard_normal((size, n_steps))
+
+    # the replication seed fixes the scrambling, chunks read consecutive sobol points.
+    # scipy spawns from the generator's seed sequence, so hand it a fresh one each time
+    rng = np.random.default_rng(seed.generate_state(4))
+    engine = qmc.Sobol(d=n_steps, scramble=True, seed=rng)
+    if start > 0:
+        engine.fast_forward(start)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        u = engine.random(size)
+
+    z = ndtri(np.clip(u, 1e-16, 1 - 1e-16))
+    return _bridge_increments(z) if n_steps > 1 else z
+
+
+def _simulate_paths(params: MCParameters, z: np.ndarray) -> np.ndarray:
+
+    dt = params.tau / params.n_steps
+    drift = (params.r - params.q - 0.5 * params.sigma**2) * dt
+    diffusion = params.sigma * np.sqrt(dt)
+
+    # log-increments built and accumulated in place over the normals block
+    paths = z
+    paths *= diffusion
+    paths += drift
+    np.cumsum(paths, axis=1, out=paths)
+    paths += np.log(params.S)
+    np.exp(paths, out=paths)
+
+    return paths
+
+
+def _control_payoff(payoff: Payoff, kind: ControlVariate) -> Payoff | None:
+
+    if kind is ControlVariate.BLACK_SCHOLES:
+        return VanillaPayoff(direction=payoff.direction)
+
+    if kind is ControlVariate.GEOMETRIC_ASIAN:
+        return AsianGeometricPayoff(direction=payoff.direction)
+
+    return None
+
+
+def _control_mean(params: MCParameters, payoff: Payoff, kind: ControlVariate) -> float:
+
+    sign = payoff.direction.value
+
+    if kind is ControlVariate.BLACK_SCHOLES:
+        bs = BSBatchParameters(params.S, params.K, params.r, params.q, params.tau,
+                               sign > 0, params.sigma)
+        return float(bs_price_arrays(bs))
+
+    # discrete geometric average over t_i = i dt, i = 1..n: log G is gaussian
+    n, dt = params.n_steps, params.tau / params.n_steps
+    mu = np.log(params.S) + (params.r - params.q - 0.5 * params.sigma**2) * dt * (n + 1) / 2
+    sig = params.sigma * np.sqrt(dt * (n + 1) * (2 * n + 1) / (6 * n))
+
+    d1 = (mu - np.log(params.K) + sig**2) / sig
+    d2 = d1 - sig
+
+    value = sign * (np.exp(mu + 0.5 * sig**2) * norm_cdf_scalar(sign * d1)
+                    - params.K * norm_cdf_scalar(sign * d2))
+
+    return float(np.exp(-params.r * params.tau) * value)
+
+
+def _pathwise_average(payoff: Payoff,
+                      paths: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+
+    """
+    Average A of the fixings a payoff max(0, +-(A - K)) is written on, with its
+    derivatives dA / d log S_i. None for payoffs that are not Lipschitz functions of
+    such an average (digitals, barriers, lookbacks), left to the likelihood ratio.
+    """
+
+    if isinstance(payoff, VanillaPayoff):
+        average = paths[:, -1]
+        weights = np.zeros_like(paths)
+        weights[:, -1] = average
+        return average, weights
+
+    if isinstance(payoff, AsianArithmeticPayoff):
+        return paths.mean(axis=1), paths / paths.shape[1]
+
+    if isinstance(payoff, AsianGeometricPayoff):
+        average = np.exp(np.log(paths).mean(axis=1))
+        return average, np.broadcast_to((average / paths.shape[1])[:, None], paths.shape)
+
+    return None
+
+
+def _greek_samples(payoff: Payoff, params: MCParameters, paths: np.ndarray,
+                   y: np.ndarray, z_first: np.ndarray, brownian: np.ndarray,
+                   z_squares: np.ndarray) -> np.ndarray:
+
+    """
+    Per path estimators of (delta, gamma, vega, theta, rho), per unit move and theta
+    per year, from the discounted payoffs y, the first step normals, the running sums
+    of the normals (brownian, in units of sqrt(dt)) and their sums of squares.
+
+    Payoffs of an average get pathwise derivatives, with gamma mixing the pathwise
+    delta and the likelihood ratio of the first step. Any other payoff is weighted by
+    the score of the normals' density, which needs no smoothness of the payoff. Theta
+    stretches the time grid with tau, as repricing with fewer days to expiry does.
+    """
+
+    S, r, tau, sigma, n = params.S, params.r, params.tau, params.sigma, params.n_steps
+    dt = tau / n
+    sqrt_dt = np.sqrt(dt)
+    mu = params.r - params.q - 0.5 * sigma**2
+    z_sum = brownian[:, -1]
+
+    samples = np.empty((5, y.size))
+    average = _pathwise_average(payoff, paths)
+
+    if average is not None:
+        average, weights = average
+        sign = payoff.direction.value
+        disc = np.exp(-r * tau)
+
+        # derivative of the discounted payoff in A, then chain rule through log S_i
+        slope = disc * sign * (sign * (average - params.K) > 0)
+        w_t = weights @ (dt * np.arange(1, n + 1))
+        w_w = np.einsum('ij,ij->i', weights, brownian) * sqrt_dt
+
+        samples[0] = slope * average / S
+        samples[1] = samples[0] * (z_first / (sigma * sqrt_dt) - 1.0) / S
+        samples[2] = slope * (w_w - sigma * w_t)
+        samples[3] = r * y - slope * (mu * w_t + 0.5 * sigma * w_w) / tau
+        samples[4] = slope * w_t - tau * y
+        return samples
+
+    samples[0] = y * z_first / (S * sigma * sqrt_dt)
+    samples[1] = y * ((z_first**2 - 1.0) / (sigma**2 * dt)
+                      - z_first / (sigma * sqrt_dt)) / S**2
+    samples[2] = y * ((z_squares - n) / sigma - sqrt_dt * z_sum)
+    samples[3] = y * (r - (0.5 * (z_squares - n) + mu * sqrt_dt * z_sum / sigma) / tau)
+    samples[4] = y * (sqrt_dt * z_sum / sigma - tau)
+    return samples
+
+
+def _run_chunk(payoff: Payoff, params: MCParameters, config: _SimulationConfig,
+               replication: int, seed: np.random.SeedSequence, start: int,
+               size: int) -> _ChunkResult:
+
+    # module level so it can be shipped to worker processes
+    disc = np.exp(-params.r * params.tau)
+    control = _control_payoff(payoff, config.control_variate)
+
+    z = _normals(config, seed, start, size, params.n_steps)
+    if config.antithetic:
+        z = np.concatenate([z, -z])
+
+    if config.greeks:
+        # the path build overwrites z, keep what the estimators need
+        z_first, brownian = z[:, 0].copy(), np.cumsum(z, axis=1)
+        z_squares = np.einsum('ij,ij->i', z, z)
+
+    paths = _simulate_paths(params, z)
+    y = disc * payoff.values(params.K, paths)
+    x = disc * control.values(params.K, paths) if control is not None else None
+    greeks = (_greek_samples(payoff, params, paths, y, z_first, brownian, z_squares)
+              if config.greeks else None)
+
+    result = _ChunkResult(replication)
+    result.raw.add(y)
+
+    if config.antithetic:
+        # antithetic pairs are the independent samples
+        y = 0.5 * (y[:size] + y[size:])
+        x = 0.5 * (x[:size] + x[size:]) if x is not None else None
+        greeks = 0.5 * (greeks[:, :size] + greeks[:, size:]) if greeks is not None else None
+
+    result.units.add(y, x)
+
+    if greeks is not None:
+        result.greeks = tuple(_Moments() for _ in greeks)
+        for moments, samples in zip(result.greeks, greeks):
+            moments.add(samples)
+
+    return result
+
+
+class MonteCarloPricer(Pricer):
+
+    """
+    Monte Carlo pricer under GBM. Paths are generated and priced in blocks of at most
+    chunk_size paths so memory stays bounded by chunk_size x n_steps whatever n_paths.
+
+    Every chunk draws from its own stream, spawned from the seed with SeedSequence, and
+    chunk moments are merged in chunk order: for a given seed and chunk_size, results
+    are bit-identical whether chunks run in-process or across n_workers processes.
+
+    Variance reduction: antithetic pairs, a control variate with a closed-form mean,
+    and scrambled Sobol points (randomised QMC over qmc_replications independent
+    scramblings, which is where the standard error comes from). MCResult reports the
+    variance reduction against plain sampling at the same path count.
+
+    simulate(greeks=True) also estimates the greeks on the same paths: pathwise for
+    payoffs of an average (vanilla, asians), likelihood ratio for the discontinuous
+    ones (digitals, barriers). Each greek carries its own standard error.
+    """
+
+    def __init__(self, n_paths: int = 100_000, n_steps: int = 252,
+                 chunk_size: int = 10_000, seed: int | None = None,
+                 n_workers: int = 1, antithetic: bool = False,
+                 control_variate: ControlVariate = ControlVariate.NONE,
+                 sampler: Sampler = Sampler.PSEUDO_RANDOM, qmc_replications: int = 16):
+
+        if n_paths < 2 or n_steps < 1 or chunk_size < 1:
+            raise ValueError(f'Invalid simulation size: n_paths={n_paths}, '
+                             f'n_steps={n_steps}, chunk_size={chunk_size}.')
+
+        if n_workers < 1:
+            raise ValueError(f'n_workers must be at least 1, got {n_workers}.')
+
+        if sampler is Sampler.SOBOL and qmc_replications < 2:
+            raise ValueError(f'Sobol sampling needs at least 2 replications to estimate '
+                             f'its error, got {qmc_replications}.')
+
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.n_workers = n_workers
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.sampler = sampler
+        self.qmc_replications = qmc_replications
+
+    def is_supported(self, option: Option, market: Market) -> bool:
+
+        # any payoff works on path matrices through Payoff.values
+        return isinstance(option.exercise, EuropeanExercise)
+
+    def is_valid_market_data(self, market: Market) -> bool:
+
+        if not market.has_vol:
+            raise ValueError(f'Must provide a volatility value for Monte Carlo pricing.')
+
+        return True
+
+    def get_mc_inputs(self, option: Option, market: Market) -> MCParameters:
+
+        self.is_valid_market_data(market)
+
+        # path-independent payoffs only need the terminal spot, which GBM samples exactly,
+        # unless a path-dependent control needs the fixings
+        needs_path = (option.payoff.path_dependent
+                      or self.control_variate is ControlVariate.GEOMETRIC_ASIAN)
+        n_steps = self.n_steps if needs_path else 1
+        tau = max(0.0, year_fraction(market.today, option.exercise.expiry, market.basis))
+
+        S, r, q = market.carry(tau)
+
+        return MCParameters(S = S,
+                            K = float(option.strike),
+                            r = r,
+                            q = q,
+                            tau = tau,
+                            sigma = float(market.vols(option.strike, tau)),
+                            n_steps = n_steps)
+
+    def _price_impl(self, option: Option, market: Market) -> float:
+        return self.simulate(option, market).estimate
+
+    def greeks(self, option: Option, market: Market) -> Greeks:
+        # estimated alongside the price, bump_greeks stays available
+        return self.simulate(option, market, greeks=True).greeks
+
+    def _common_random_numbers(self) -> 'MonteCarloPricer':
+
+        # bumped markets must see the same draws: pin the seed of an unseeded pricer
+        if self.seed is not None:
+            return self
+
+        pinned = copy.copy(self)
+        pinned.seed, pinned.cache = np.random.SeedSequence().entropy, None
+        return pinned
+
+    def simulate(self, option: Option, market: Market, greeks: bool = False) -> MCResult:
+
+        self.validate_option_priceable(option, market)
+        params = self.get_mc_inputs(option, market)
+
+        # "immediate" exercise
+        if params.tau == 0.0:
+            value = option.payoff.value(params.K, PayoffContext(spot=params.S,
+                                                                 path=(params.S,)))
+            undefined = Greeks(delta = None, gamma = None, vega = None, theta = None,
+                               rho = None) if greeks else None
+            return MCResult(value, 0.0, 0, greeks=undefined, greeks_std_error=undefined)
+
+        if greeks and params.sigma == 0.0:
+            raise ValueError(f'Monte Carlo greeks need a positive volatility.')
+
+        config = _SimulationConfig(self.antithetic, self.control_variate, self.sampler,
+                                   greeks)
+        tasks = self._tasks(option.payoff, params, config)
+        year_days = basis_mapping[market.basis]
+
+        if self.n_workers == 1:
+            chunks = map(_run_chunk, *zip(*tasks))
+            return self._merge(chunks, option.payoff, params, year_days)
+
+        with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+            chunks = pool.map(_run_chunk, *zip(*tasks))
+            return self._merge(chunks, option.payoff, params, year_days)
+
+    def _tasks(self, payoff: Payoff, params: MCParameters,
+               config: _SimulationConfig) -> list[tuple]:
+
+        # antithetic chunks hold chunk_size paths made of chunk_size / 2 draws
+        per_draw = 2 if self.antithetic else 1
+        draw_chunk = max(1, self.chunk_size // per_draw)
+        draws = -(-self.n_paths // per_draw)
+
+        if self.sampler is Sampler.PSEUDO_RANDOM:
+            starts = range(0, draws, draw_chunk)
+            seeds = np.random.SeedSequence(self.seed).spawn(len(starts))
+
+            return [(payoff, params, config, 0, seed, start, min(draw_chunk, draws - start))
+                    for seed, start in zip(seeds, starts)]
+
+        # one scrambling per replication, each replication read in chunks
+        per_replication = -(-draws // self.qmc_replications)
+        seeds = np.random.SeedSequence(self.seed).spawn(self.qmc_replications)
+
+        return [(payoff, params, config, rep, seed, start,
+                 min(draw_chunk, per_replication - start))
+                for rep, seed in enumerate(seeds)
+                for start in range(0, per_replication, draw_chunk)]
+
+    def _merge(self, chunks, payoff: Payoff, params: MCParameters,
+               year_days: float) -> MCResult:
+
+        # fixed chunk order keeps the floating point merge independent of scheduling
+        replications: dict[int, _Moments] = {}
+        pooled, raw = _Moments(), _Moments()
+        greek_replications: dict[int, list[_Moments]] = {}
+        greeks: list[_Moments] = []
+
+        for chunk in chunks:
+            replications.setdefault(chunk.replication, _Moments()).merge(chunk.units)
+            pooled.merge(chunk.units)
+            raw.merge(chunk.raw)
+
+            if chunk.greeks:
+                per_replication = greek_replications.setdefault(
+                    chunk.replication, [_Moments() for _ in chunk.greeks])
+                if not greeks:
+                    greeks = [_Moments() for _ in chunk.greeks]
+
+                for total, replication, moments in zip(greeks, per_replication,
+                                                       chunk.greeks):
+                    total.merge(moments)
+                    replication.merge(moments)
+
+        if self.control_variate is ControlVariate.NONE:
+            control_mean, beta = 0.0, 0.0
+        else:
+            control_mean = _control_mean(params, payoff, self.control_variate)
+            beta = pooled.beta()
+
+        if self.sampler is Sampler.PSEUDO_RANDOM:
+            estimate, variance = pooled.controlled(control_mean, beta)
+            error_var = variance / pooled.n
+        else:
+            estimates = np.array([m.controlled(control_mean, beta)[0]
+                                  for m in replications.values()])
+            estimate = float(estimates.mean())
+            error_var = float(estimates.var(ddof=1) / estimates.size)
+
+        # plain sampling error at the same number of paths, over the achieved one
+        baseline = raw.variance / raw.n
+        ratio = baseline / error_var if error_var > 0 else float('inf')
+
+        result = MCResult(float(estimate), float(np.sqrt(error_var)), raw.n, float(ratio))
+        if not greeks:
+            return result
+
+        # no control on the greeks: plain means, errors as for the price
+        if self.sampler is Sampler.PSEUDO_RANDOM:
+            values = np.array([m.mean for m in greeks])
+            errors = np.array([m.std_error for m in greeks])
+        else:
+            means = np.array([[m.mean for m in rep] for rep in greek_replications.values()])
+            values = means.mean(axis=0)
+            errors = means.std(axis=0, ddof=1) / np.sqrt(len(means))
+
+        # units of the analytic greeks: vega and rho per 1% move, theta per day
+        units = np.array([1.0, 1.0, 100.0, year_days, 100.0])
+        return replace(result,
+                       greeks=Greeks(*(float(v) for v in values / units)),
+                       greeks_std_error=Greeks(*(float(e) for e in errors / units)))
+
+
+@PricerFactory.register(PricerType.MONTE_CARLO)
+def _make_monte_carlo(**kw) -> Pricer:
+    return MonteCarloPricer(**kw)
@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+
+from src.option import Option
+from src.pricers.black_scholes import (BlackScholesPricer, BSBatchParameters,
+                                       bs_price_arrays, bs_greeks_arrays)
+from src.pricers.types import Market, GreeksBatch
+
+
+@dataclass(frozen = True, slots = True)
+class _BSRows:
+
+    # already-derived counterpart of BSBatchParameters, read by bs_price_arrays and
+    # bs_greeks_arrays without re-running its __post_init__
+    S: np.ndarray
+    K: np.ndarray
+    r: np.ndarray
+    q: np.ndarray
+    tau: np.ndarray
+    is_call: np.ndarray
+    sigma: np.ndarray
+    year_days: np.ndarray
+    sig_sqrt_t: np.ndarray
+    d1: np.ndarray
+    d2: np.ndarray
+    disc_q: np.ndarray
+    disc_r: np.ndarray
+
+
+class BSRepricingSession:
+
+    """
+    Black-Scholes revaluation of a fixed book under market ticks. Everything that does
+    not move with spot or vol (tau, discount factors, log K, carry) is computed once;
+    update() only refreshes d1 / d2, prices and greeks on the rows it touches.
+    Rates, dividends and today are frozen at construction: start a new session when
+    they move. Spot ticks are quoted spots; the present value of the escrowed cash
+    dividends of each row is kept and taken off them.
+    """
+
+    def __init__(self, options: Sequence[Option] | BSBatchParameters,
+                 markets: Market | Sequence[Market] | None = None, *,
+                 greeks: bool = True):
+
+        if isinstance(options, BSBatchParameters):
+            params, spots = options, options.S
+        else:
+            if markets is None:
+                raise ValueError('markets must be provided for a sequence of options.')
+            params = BlackScholesPricer().get_bs_batch_inputs(options, markets)
+            spots = (markets.spot if isinstance(markets, Market)
+                     else np.array([market.spot for market in markets]))
+
+        # own copies, the session overwrites them in place
+        self.S, self.K, self.r, self.q, self.tau, self.sigma, self.year_days = (
+            np.array(np.ravel(getattr(params, name)), dtype=float)
+            for name in ('S', 'K', 'r', 'q', 'tau', 'sigma', 'year_days'))
+        self.is_call = np.array(np.ravel(params.is_call), dtype=bool)
+
+        # quoted spot minus the carry-adjusted one: cash dividends paid before expiry
+        self.dividend_pv = np.broadcast_to(spots, self.S.shape) - self.S
+
+        # spot / vol independent terms
+        self.sqrt_tau = np.sqrt(self.tau)
+        self.disc_q, self.disc_r = np.exp(-self.q * self.tau), np.exp(-self.r * self.tau)
+        self.carry = (self.r - self.q) * self.tau
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.log_K = np.log(self.K)
+            self.log_S = np.log(self.S)
+
+        self.sig_sqrt_t = self.sigma * self.sqrt_tau
+        self.d1, self.d2 = np.zeros_like(self.S), np.zeros_like(self.S)
+
+        n = self.S.size
+        self.with_greeks = greeks
+        self.prices = np.empty(n)
+        self.greeks = (GreeksBatch(*(np.empty(n) for _ in range(5)))
+                       if greeks else None)
+
+        self._revalue(slice(None))
+
+    def __len__(self) -> int:
+        return self.S.size
+
+    def update(self, spot = None, vol = None, rows = None) -> np.ndarray:
+
+        """
+        Applies new spot and / or vol values (scalars or one value per selected row)
+        to rows (indices or boolean mask, default the whole book) and revalues those
+        rows only. Returns the full price vector.
+        """
+
+        # whole-book ticks work on views, subsets on gathered copies
+        idx = slice(None) if rows is None else np.asarray(rows)
+        if rows is not None and idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+
+        if vol is not None:
+            vol = np.asarray(vol, dtype=float)
+            if not np.all(np.isfinite(vol) & (vol >= 0)):
+                raise ValueError(f'Invalid vol value: {vol}.')
+
+            self.sigma[idx] = vol
+            self.sig_sqrt_t[idx] = self.sigma[idx] * self.sqrt_tau[idx]
+
+        if spot is not None:
+            spot = np.asarray(spot, dtype=float)
+            if not np.all(np.isfinite(spot) & (spot > 0)):
+                raise ValueError(f'Invalid spot value: {spot}.')
+
+            S = spot - self.dividend_pv[idx]
+            if not np.all(S > 0):
+                raise ValueError(f'Spot {spot} does not cover the cash dividends.')
+
+            self.S[idx] = S
+            self.log_S[idx] = np.log(S)
+
+        if spot is not None or vol is not None:
+            self._revalue(idx)
+
+        return self.prices
+
+    def _revalue(self, idx: np.ndarray | slice) -> None:
+
+        sigma, sig_sqrt_t, tau = self.sigma[idx], self.sig_sqrt_t[idx], self.tau[idx]
+
+        # same guard as BSBatchParameters: rows failing it get d1 = d2 = 0
+        valid = (tau >= 0) & (sig_sqrt_t > 0) & (self.K[idx] > 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d1 = np.where(valid,
+                          (self.log_S[idx] - self.log_K[idx] + self.carry[idx]
+                           + 0.5 * sigma**2 * tau) / sig_sqrt_t,
+                          0.0)
+        d2 = np.where(valid, d1 - sig_sqrt_t, 0.0)
+
+        self.d1[idx], self.d2[idx] = d1, d2
+
+        rows = _BSRows(self.S[idx], self.K[idx], self.r[idx], self.q[idx], tau,
+                       self.is_call[idx], sigma, self.year_days[idx], sig_sqrt_t,
+                       d1, d2, self.disc_q[idx], self.disc_r[idx])
+
+        self.prices[idx] = bs_price_arrays(rows)
+
+        if self.with_greeks:
+            fresh = bs_greeks_arrays(rows)
+            for name in GreeksBatch.__slots__:
+                getattr(self.greeks, name)[idx] = getattr(fresh, name)
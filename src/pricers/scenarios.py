@@ -0,0 +1,204 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+
+from src.book import OptionBook
+from src.option import Option
+from src.pricers.base import Pricer
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters, bs_price_arrays
+from src.pricers.dispatch import BookDispatcher
+from src.pricers.types import Market
+
+
+@dataclass(frozen = True, slots = True)
+class ScenarioGrid:
+
+    """
+    Cartesian grid of market shocks: relative spot moves (S -> S (1 + shock)),
+    absolute vol moves and absolute parallel rate moves. Scenarios are numbered in
+    C order over (spot, vol, rate).
+    """
+
+    spot_shocks: np.ndarray
+    vol_shocks: np.ndarray = (0.0,)
+    rate_shocks: np.ndarray = (0.0,)
+
+    def __post_init__(self):
+
+        for name in ('spot_shocks', 'vol_shocks', 'rate_shocks'):
+            values = np.array(getattr(self, name), dtype=float).reshape(-1)
+
+            if values.size == 0 or not np.all(np.isfinite(values)):
+                raise ValueError(f'{name} must hold at least one finite value.')
+
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+
+        if np.any(self.spot_shocks <= -1.0):
+            raise ValueError(f'Spot shocks must stay above -100%: {self.spot_shocks}.')
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.spot_shocks.size, self.vol_shocks.size, self.rate_shocks.size
+
+    def __len__(self) -> int:
+        return int(np.prod(self.shape))
+
+    def indices(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # (spot, vol, rate) position of every scenario
+        return np.unravel_index(np.arange(len(self)), self.shape)
+
+    def scenario(self, k: int) -> tuple[float, float, float]:
+        i, j, l = np.unravel_index(k, self.shape)
+        return (float(self.spot_shocks[i]), float(self.vol_shocks[j]),
+                float(self.rate_shocks[l]))
+
+
+@dataclass(frozen = True, slots = True)
+class ScenarioResult:
+    base: np.ndarray        # (positions,) unshocked values, quantities applied
+    pnl: np.ndarray         # (positions, scenarios)
+    grid: ScenarioGrid
+
+    def cube(self) -> np.ndarray:
+        # (positions, spot shocks, vol shocks, rate shocks) view on pnl
+        return self.pnl.reshape(len(self.base), *self.grid.shape)
+
+    def total(self) -> np.ndarray:
+        # book P&L per scenario
+        return self.pnl.sum(axis=0)
+
+
+class ScenarioEngine:
+
+    """
+    Revalues a book under every scenario of a ScenarioGrid.
+
+    Rows the pricing would send to Black-Scholes are revalued in closed form on a
+    (rows x scenarios) broadcast of the shocked inputs, max_cells entries at a time.
+    The shocked curves are only evaluated once per rate shock. Other rows are
+    repriced with one price_batch call per scenario on a shocked Market. With
+    processes > 1, the book is split into that many parts, each one valued in a
+    worker process; the pricer and market must then be picklable (no result cache).
+    """
+
+    def __init__(self, pricer: Pricer | BookDispatcher | None = None,
+                 max_cells: int = 2_000_000, processes: int | None = None):
+
+        if max_cells < 1:
+            raise ValueError(f'max_cells must be positive, got {max_cells}.')
+
+        self.pricer = pricer if pricer is not None else BookDispatcher()
+        self.max_cells = max_cells
+        self.processes = processes
+
+    def run(self, book: OptionBook | Sequence[Option], market: Market,
+            grid: ScenarioGrid, quantities = None) -> ScenarioResult:
+
+        if not isinstance(book, OptionBook):
+            book = OptionBook.from_options(book)
+
+        quantities = np.broadcast_to(np.asarray(1.0 if quantities is None else quantities,
+                                                dtype=float), (len(book),))
+
+        if self.processes is not None and self.processes > 1 and len(book) > 1:
+            parts = np.array_split(np.arange(len(book)), min(self.processes, len(book)))
+            serial = ScenarioEngine(self.pricer, self.max_cells)
+
+            with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+                values = list(pool.map(_values, [serial] * len(parts),
+                                       [book[rows] for rows in parts],
+                                       [market] * len(parts), [grid] * len(parts)))
+
+            base = np.concatenate([v[0] for v in values])
+            shocked = np.concatenate([v[1] for v in values])
+        else:
+            base, shocked = self.values(book, market, grid)
+
+        return ScenarioResult(base=quantities * base,
+                              pnl=quantities[:, None] * (shocked - base[:, None]),
+                              grid=grid)
+
+    def values(self, book: OptionBook, market: Market,
+               grid: ScenarioGrid) -> tuple[np.ndarray, np.ndarray]:
+
+        # unit values: (positions,) base and (positions, scenarios) shocked
+        base, shocked = np.empty(len(book)), np.empty((len(book), len(grid)))
+
+        closed_form = self._closed_form_rows(book, market)
+        rows = np.flatnonzero(closed_form)
+        chunk = max(1, self.max_cells // len(grid))
+
+        for start in range(0, rows.size, chunk):
+            block = rows[start:start + chunk]
+            base[block], shocked[block] = self._closed_form(book[block], market, grid)
+
+        rows = np.flatnonzero(~closed_form)
+        if rows.size:
+            others = book[rows]
+            base[rows] = self._price(others, market)
+
+            for k in range(len(grid)):
+                spot, vol, rate = grid.scenario(k)
+                shocked[rows, k] = self._price(others,
+                                               market.shocked(spot=spot, vol=vol, rate=rate))
+
+        return base, shocked
+
+    def _price(self, book: OptionBook, market: Market) -> np.ndarray:
+
+        if isinstance(self.pricer, BookDispatcher):
+            return self.pricer.price(book, market)
+
+        return self.pricer.price_batch(book, market)
+
+    def _closed_form_rows(self, book: OptionBook, market: Market) -> np.ndarray:
+
+        # unsupported rows go through the pricer, which rejects them as usual
+        if isinstance(self.pricer, BlackScholesPricer):
+            return book.supported_mask(self.pricer, market)
+
+        if not isinstance(self.pricer, BookDispatcher):
+            return np.zeros(len(book), dtype=bool)
+
+        mask = np.zeros(len(book), dtype=bool)
+        for group in self.pricer.plan(book, market):
+            if isinstance(group.pricer, BlackScholesPricer):
+                mask[group.rows] = True
+
+        return mask
+
+    def _closed_form(self, book: OptionBook, market: Market,
+                     grid: ScenarioGrid) -> tuple[np.ndarray, np.ndarray]:
+
+        BlackScholesPricer().is_valid_market_data(market)
+
+        tau = book.taus(market)
+        strikes, is_call = book.strikes, book.is_call
+        vols = market.vols(strikes, tau)
+
+        # carry under each rate shock: (rows, rate shocks)
+        carries = [market.shocked(rate=shock).carry(tau) for shock in grid.rate_shocks]
+        spots, rates, divs = (np.stack([c[n] for c in carries], axis=1) for n in range(3))
+
+        s, v, l = grid.indices()
+
+        # spot shocks move the quoted spot, escrowed dividends stay put
+        params = BSBatchParameters(
+            S = spots[:, l] + market.spot * grid.spot_shocks[s],
+            K = strikes[:, None], r = rates[:, l], q = divs[:, l], tau = tau[:, None],
+            is_call = is_call[:, None],
+            sigma = np.maximum(vols[:, None] + grid.vol_shocks[v], 0.0))
+
+        spot, rate, div = market.carry(tau)
+        base = bs_price_arrays(BSBatchParameters(S = spot, K = strikes, r = rate, q = div,
+                                                 tau = tau, is_call = is_call, sigma = vols))
+
+        return base, bs_price_arrays(params)
+
+
+def _values(engine: ScenarioEngine, book: OptionBook, market: Market,
+            grid: ScenarioGrid) -> tuple[np.ndarray, np.ndarray]:
+    # module level so worker processes can unpickle it
+    return engine.values(book, market, grid)
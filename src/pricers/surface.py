@@ -0,0 +1,208 @@
+"""
+Implied volatility surfaces. A surface is a set of expiry slices, each giving the
+total implied variance w = vol^2 * tau as a function of log-strike. Slice
+coefficients are computed once at construction; lookups interpolate w linearly in
+tau at fixed strike between slices, and keep the vol flat outside the quoted range.
+
+Surfaces are frozen and their arrays read-only, so one instance can be shared by
+threads, attached to many Markets, and pickled to worker processes.
+"""
+
+from dataclasses import dataclass
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+
+def _read_only(*arrays: np.ndarray) -> None:
+    for a in arrays:
+        a.flags.writeable = False
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class SplineSlice:
+
+    # natural cubic spline of total variance in log-strike, scipy PPoly layout:
+    # coefficients[:, i] are the powers 3..0 of (x - knots[i]) on [knots[i], knots[i+1]]
+    knots: np.ndarray
+    coefficients: np.ndarray
+
+    @classmethod
+    def fit(cls, log_strikes: np.ndarray, total_variances: np.ndarray) -> 'SplineSlice':
+
+        if log_strikes.size == 1:
+            knots = np.repeat(log_strikes, 2)
+            coefficients = np.array([[0.0], [0.0], [0.0], [total_variances[0]]])
+        else:
+            spline = CubicSpline(log_strikes, total_variances, bc_type='natural')
+            knots, coefficients = spline.x.copy(), spline.c.copy()
+
+        _read_only(knots, coefficients)
+        return cls(knots, coefficients)
+
+    def total_variance(self, log_strikes: np.ndarray) -> np.ndarray:
+
+        knots, c = self.knots, self.coefficients
+
+        # flat extrapolation beyond the wings
+        x = np.clip(log_strikes, knots[0], knots[-1])
+        i = np.clip(np.searchsorted(knots, x, side='right') - 1, 0, knots.size - 2)
+        dx = x - knots[i]
+
+        return np.maximum(((c[0, i] * dx + c[1, i]) * dx + c[2, i]) * dx + c[3, i], 0.0)
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class SVISlice:
+
+    # raw SVI: w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2)), k = ln(K / F)
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+    log_forward: float
+
+    def __post_init__(self):
+
+        if self.b < 0 or abs(self.rho) >= 1 or self.sigma <= 0:
+            raise ValueError(f'Invalid SVI parameters: {self}.')
+
+        if self.a + self.b * self.sigma * np.sqrt(1.0 - self.rho**2) < 0:
+            raise ValueError(f'SVI slice has negative total variance: {self}.')
+
+    def total_variance(self, log_strikes: np.ndarray) -> np.ndarray:
+        k = log_strikes - self.log_forward - self.m
+        return self.a + self.b * (self.rho * k + np.sqrt(k * k + self.sigma**2))
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class VolSurface:
+
+    """
+    Expiry slices at increasing year fractions taus. Build with from_quotes (spline
+    slices through quoted vols) or from_svi (fitted SVI parameters per expiry).
+    eq=False: surfaces hash by identity, which keeps Markets carrying one hashable.
+    """
+
+    taus: np.ndarray
+    slices: tuple[SplineSlice | SVISlice, ...]
+    # parallel vol move added on lookup, see shifted
+    shift: float = 0.0
+
+    def __post_init__(self):
+
+        taus = np.array(self.taus, dtype=float)
+
+        if taus.ndim != 1 or taus.size == 0 or taus.size != len(self.slices):
+            raise ValueError(f'Need one slice per expiry, got {taus.size} expiries and '
+                             f'{len(self.slices)} slices.')
+
+        if taus[0] <= 0 or np.any(np.diff(taus) <= 0):
+            raise ValueError(f'Slice expiries must be positive and increasing: {taus}.')
+
+        _read_only(taus)
+        object.__setattr__(self, 'taus', taus)
+
+    @classmethod
+    def from_quotes(cls, strikes, taus, vols) -> 'VolSurface':
+
+        """
+        One spline slice per distinct tau, through the quotes (strikes[i], vols[i])
+        of that expiry. Arguments broadcast against each other.
+        """
+
+        strikes, taus, vols = (np.ravel(a) for a in np.broadcast_arrays(
+            np.asarray(strikes, dtype=float), np.asarray(taus, dtype=float),
+            np.asarray(vols, dtype=float)))
+
+        if not (np.all(np.isfinite(vols)) and np.all(vols >= 0) and np.all(strikes > 0)):
+            raise ValueError(f'Quotes need positive strikes and finite, non-negative vols.')
+
+        unique, inverse = np.unique(taus, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        slices = []
+        for i, tau in enumerate(unique):
+            rows = np.flatnonzero(inverse == i)
+            rows = rows[np.argsort(strikes[rows])]
+
+            log_strikes = np.log(strikes[rows])
+            if np.any(np.diff(log_strikes) == 0):
+                raise ValueError(f'Duplicate strikes quoted at tau={tau}.')
+
+            slices.append(SplineSlice.fit(log_strikes, vols[rows]**2 * tau))
+
+        return cls(unique, tuple(slices))
+
+    @classmethod
+    def from_svi(cls, taus, params, forwards) -> 'VolSurface':
+
+        """
+        params holds one raw SVI row (a, b, rho, m, sigma) per expiry, fitted in
+        log-moneyness against the matching forward.
+        """
+
+        params = np.atleast_2d(np.asarray(params, dtype=float))
+        forwards = np.broadcast_to(np.asarray(forwards, dtype=float), params.shape[:1])
+
+        slices = tuple(SVISlice(*map(float, p), log_forward=float(np.log(f)))
+                       for p, f in zip(params, forwards))
+
+        return cls(np.asarray(taus, dtype=float), slices)
+
+    def shifted(self, shift: float) -> 'VolSurface':
+        # same slices, vols moved by shift (floored at zero)
+        return VolSurface(self.taus, self.slices, self.shift + shift)
+
+    def total_variance(self, strikes, taus) -> np.ndarray:
+
+        if self.shift == 0.0:
+            return self._slice_variance(strikes, taus)
+
+        taus = np.asarray(taus, dtype=float)
+        return self.vol(strikes, taus)**2 * np.maximum(taus, 0.0)
+
+    def _slice_variance(self, strikes, taus) -> np.ndarray:
+
+        log_strikes, taus = np.broadcast_arrays(np.log(np.asarray(strikes, dtype=float)),
+                                                np.asarray(taus, dtype=float))
+        shape = log_strikes.shape
+        log_strikes, taus = log_strikes.ravel(), taus.ravel()
+
+        # bracketing slices, both ends pinned to the first / last slice outside the range
+        last = self.taus.size - 1
+        upper = np.searchsorted(self.taus, taus)
+        lo, hi = np.clip(upper - 1, 0, last), np.clip(upper, 0, last)
+
+        w_lo, w_hi = np.empty(taus.size), np.empty(taus.size)
+        for j in np.unique(np.concatenate([lo, hi])):
+            rows = lo == j
+            w_lo[rows] = self.slices[j].total_variance(log_strikes[rows])
+            rows = hi == j
+            w_hi[rows] = self.slices[j].total_variance(log_strikes[rows])
+
+        t_lo, t_hi = self.taus[lo], self.taus[hi]
+        inside = lo != hi
+        weight = np.where(inside, (taus - t_lo) / np.where(inside, t_hi - t_lo, 1.0), 0.0)
+        w = w_lo + weight * (w_hi - w_lo)
+
+        # flat vol outside the slices: rescale the nearest slice's variance to tau
+        w = np.where(inside, w, w_lo * np.maximum(taus, 0.0) / t_lo)
+
+        return w.reshape(shape)
+
+    def vol(self, strikes, taus) -> np.ndarray:
+
+        """
+        Implied vols for arrays of strikes and year fractions, broadcast against each
+        other. Expired rows (tau <= 0) get the vol of the first slice.
+        """
+
+        strikes, taus = np.broadcast_arrays(np.asarray(strikes, dtype=float),
+                                            np.asarray(taus, dtype=float))
+        positive = taus > 0
+        lookup = np.where(positive, taus, self.taus[0])
+
+        vols = np.sqrt(self._slice_variance(strikes, lookup) / lookup)
+
+        return vols if self.shift == 0.0 else np.maximum(vols + self.shift, 0.0)
@@ -1,15 +1,54 @@
 from datetime import datetime
+import numpy as np
 
+from src.calendars import BusinessCalendar, WEEKDAYS, as_ordinals, ymd
+
+# year length in days per basis, also used to express theta per (business) day
 basis_mapping = {
     'ACT/365': 365,
-    'ACT/360': 360
+    'ACT/360': 360,
+    '30/360': 360,
+    'BUS/252': 252,
 }
 
+
+def year_fractions(start, end, basis: str,
+                   calendar: BusinessCalendar | None = None) -> np.ndarray:
+
+    """
+    Year fractions between arrays (or scalars) of dates or date ordinals, broadcast
+    against each other. 30/360 follows the US bond basis rule, BUS/252 counts
+    business days of calendar (weekends only by default) in [start, end).
+    """
+
+    if basis not in basis_mapping:
+        raise ValueError(f"Unsupported day-cout basis: {basis}")
+
+    t0, t1 = as_ordinals(start), as_ordinals(end)
+    b = float(basis_mapping[basis])
+
+    if basis == '30/360':
+        y0, m0, d0 = ymd(t0)
+        y1, m1, d1 = ymd(t1)
+
+        d0 = np.minimum(d0, 30)
+        d1 = np.where(d0 == 30, np.minimum(d1, 30), d1)
+
+        return (360 * (y1 - y0) + 30 * (m1 - m0) + (d1 - d0)) / b
+
+    if basis == 'BUS/252':
+        return (calendar or WEEKDAYS).business_days(t0, t1) / b
+
+    return (t1 - t0) / b
+
+
 def year_fraction(t0: datetime, t1: datetime, basis: str):
-    days = (t1 - t0).days
 
-    if basis not in basis_mapping: 
+    if basis not in basis_mapping:
         raise ValueError(f"Unsupported day-cout basis: {basis}")
-    
-    b = basis_mapping[basis]
-    return days / float(b)
\ No newline at end of file
+
+    # actual day counts stay on the cheap scalar path
+    if basis in ('ACT/365', 'ACT/360'):
+        return (t1 - t0).days / float(basis_mapping[basis])
+
+    return float(year_fractions(t0, t1, basis))
@@ -1,7 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import datetime as dt
+import enum
 import numpy as np
 
+from src.pricers.surface import VolSurface
+from src.pricers.curves import YieldCurve, DividendCurve
+
+# plain numbers take the scalar fast paths of Market.vols / Market.carry
+_SCALARS = (int, float, np.number)
+
 
 @dataclass(frozen = True, slots = True)
 class Market:
@@ -11,6 +18,11 @@ class Market:
     div: float = 0.0
     vol: float | None = None
     basis: str = 'ACT/365'
+    # per strike / expiry vols, used instead of the flat vol when set
+    surface: VolSurface | None = None
+    # term structures, used instead of the flat rate / div when set
+    rate_curve: YieldCurve | None = None
+    div_curve: DividendCurve | None = None
 
     def __post_init__(self) -> None:
 
@@ -23,6 +35,81 @@ class Market:
         if self.today is None:
             raise ValueError(f"today value must be provided.")
 
+    @property
+    def has_vol(self) -> bool:
+        return self.vol is not None or self.surface is not None
+
+    def vols(self, strikes, taus) -> np.ndarray:
+
+        # whole batch in one lookup: surface when attached, flat vol otherwise
+        if self.surface is not None:
+            return self.surface.vol(strikes, taus)
+
+        if self.vol is None:
+            raise ValueError(f"Market has neither a vol nor a vol surface.")
+
+        if isinstance(strikes, _SCALARS) and isinstance(taus, _SCALARS):
+            return float(self.vol)
+
+        return np.full(np.broadcast(np.asarray(strikes), np.asarray(taus)).shape,
+                       float(self.vol))
+
+    def shocked(self, spot: float = 0.0, vol: float = 0.0, rate: float = 0.0) -> 'Market':
+
+        # relative spot move, absolute vol and rate moves applied to curves / surface too
+        return replace(
+            self, spot = self.spot * (1.0 + spot),
+            vol = None if self.vol is None else max(self.vol + vol, 0.0),
+            surface = self.surface if self.surface is None or vol == 0.0 
+                else self.surface.shifted(vol),
+            rate = self.rate + rate,
+            rate_curve = self.rate_curve if self.rate_curve is None or rate == 0.0 
+                else self.rate_curve.shifted(rate))
+
+    @property
+    def has_dividends(self) -> bool:
+        return self.div != 0.0 or self.div_curve is not None
+
+    def carry(self, taus) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        """
+        (spot, rate, div) per year fraction: the spot net of cash dividends paid
+        before tau, and the flat rate and dividend yield reproducing the curves'
+        discount factors at tau. Curves are evaluated once per unique tau. A scalar
+        tau gives floats, the per-option pricers' hot path.
+        """
+
+        if self.rate_curve is None and self.div_curve is None:
+            if isinstance(taus, _SCALARS):
+                return float(self.spot), float(self.rate), float(self.div)
+
+            shape = np.shape(taus)
+            return tuple(np.full(shape, float(x)) for x in (self.spot, self.rate, self.div))
+
+        if isinstance(taus, _SCALARS) or np.ndim(taus) == 0:
+            return tuple(float(x[0]) for x in self.carry(np.array([taus], dtype=float)))
+
+        taus = np.asarray(taus, dtype=float)
+
+        unique, inverse = np.unique(taus, return_inverse=True)
+        flat = lambda x: np.full(unique.shape, float(x))
+
+        if self.rate_curve is None:
+            rates, discount = flat(self.rate), lambda t: np.exp(-self.rate * t)
+        else:
+            rates, discount = self.rate_curve.zero_rates(unique), self.rate_curve.discount
+
+        if self.div_curve is None:
+            spots, divs = flat(self.spot), flat(self.div)
+        else:
+            spots = self.spot - self.div_curve.cash_pv(unique, discount)
+            divs = self.div_curve.yield_rates(unique)
+
+            if np.any(spots <= 0):
+                raise ValueError(f"Cash dividends exceed the spot value {self.spot}.")
+
+        return tuple(x[inverse].reshape(taus.shape) for x in (spots, rates, divs))
+
 
 @dataclass(frozen=True, slots = True)
 class Greeks:
@@ -30,4 +117,95 @@ class Greeks:
     gamma: float
     vega: float
     theta: float
-    rho: float
\ No newline at end of file
+    rho: float
+    # second order vol greeks, only filled by bump-and-revalue (see Pricer.bump_greeks)
+    vanna: float | None = None
+    volga: float | None = None
+
+
+class BumpScheme(enum.Enum):
+    CENTRAL = enum.auto()
+    FORWARD = enum.auto()
+
+
+@dataclass(frozen=True, slots = True)
+class Bumps:
+
+    """
+    Finite difference settings for Pricer.bump_greeks: relative spot bump, absolute
+    vol and rate bumps, and the number of calendar days theta rolls today forward.
+    """
+
+    spot: float = 1e-2
+    vol: float = 1e-2
+    rate: float = 1e-4
+    days: int = 1
+    scheme: BumpScheme = BumpScheme.CENTRAL
+    # vanna / volga need 4 to 5 more valuations
+    second_order: bool = True
+
+    def __post_init__(self) -> None:
+
+        if min(self.spot, self.vol, self.rate) <= 0 or self.days < 1:
+            raise ValueError(f"Bump sizes must be positive: {self}.")
+
+
+@dataclass(frozen=True, slots = True)
+class GreeksBatch:
+
+    """
+    Columnar greeks: one array per greek, row i belonging to the i-th option of the 
+    batch. Rows with no defined greeks (expired or zero vol) hold NaN.
+    """
+
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    rho: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.delta)
+    
+    def row(self, i: int) -> Greeks:
+        return Greeks(*(float(getattr(self, name)[i]) for name in self.__slots__))
+    
+    def to_records(self) -> np.ndarray:
+        out = np.empty(len(self), dtype=[(name, float) for name in self.__slots__])
+        for name in self.__slots__:
+            out[name] = getattr(self, name)
+        return out
+
+
+class IVStatus(enum.IntEnum):
+    CONVERGED = 0       # newton / bisection iterations met the tolerance
+    FALLBACK = 1        # solved by the per-quote bracketing fallback
+    OUT_OF_BOUNDS = 2   # quote outside no-arbitrage bounds, or price insensitive to vol
+    FAILED = 3
+
+
+@dataclass(frozen=True, slots = True)
+class ImpliedVolResult:
+    vols: np.ndarray
+    status: np.ndarray      # IVStatus codes
+    iterations: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.vols)
+    
+    @property
+    def converged(self) -> np.ndarray:
+        return (self.status == IVStatus.CONVERGED) | (self.status == IVStatus.FALLBACK)
+
+
+@dataclass(frozen=True, slots = True)
+class MCResult:
+    estimate: float
+    std_error: float
+    n_paths: int
+    # plain-sampling error variance at the same path count over the achieved one
+    variance_reduction: float = 1.0
+    # estimated on the same paths when asked for, see MonteCarloPricer.simulate
+    greeks: Greeks | None = None
+    greeks_std_error: Greeks | None = None
+
@@ -0,0 +1,143 @@
+import unittest
+import sys
+from datetime import date
+
+sys.path.append('src')
+
+from src.pricers.binary_tree import BinaryTreePricer, TreeMethod
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.factory import PricerFactory, PricerType
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestTreeInputs(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+
+    def test_factory(self):
+
+        pricer = PricerFactory.create(PricerType.BINARY_TREE, steps=100, 
+                                      method=TreeMethod.LEISEN_REIMER)
+        
+        self.assertIsInstance(pricer, BinaryTreePricer)
+        self.assertEqual(pricer.steps, 100)
+
+    def test_invalid_payoff(self):
+
+        asian = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                              payoff.AsianArithmeticPayoff(direction=payoff.Direction.CALL))
+        
+        with self.assertRaises(NotImplementedError):
+            BinaryTreePricer().price(asian, self.market)
+
+    def test_invalid_steps(self):
+
+        with self.assertRaises(ValueError):
+            BinaryTreePricer(steps=1)
+
+    def test_expired_option_is_intrinsic(self):
+
+        put = option.Option(110.0, exercise.EuropeanExercise(expiry=date(2025, 1, 1)),
+                            payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        
+        self.assertEqual(BinaryTreePricer().price(put, self.market), 10.0)
+
+
+class TestTreeConvergence(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.expiry = date(2026, 1, 1)
+
+        cls.options = {
+            d: option.Option(100.0, exercise.EuropeanExercise(expiry=cls.expiry),
+                             payoff.VanillaPayoff(direction=d))
+            for d in payoff.Direction
+        }
+
+    def test_european_matches_black_scholes(self):
+
+        tolerances = {TreeMethod.CRR: 1e-2, TreeMethod.LEISEN_REIMER: 1e-5, 
+                      TreeMethod.TRINOMIAL: 1e-2}
+
+        for method, tol in tolerances.items():
+            pricer = BinaryTreePricer(steps=1001, method=method)
+
+            for opt in self.options.values():
+                with self.subTest(method=method, direction=opt.direction):
+                    expected = BlackScholesPricer().price(opt, self.market)
+                    self.assertAlmostEqual(pricer.price(opt, self.market), expected, 
+                                           delta=tol)
+
+    def test_richardson_improves_crr(self):
+
+        opt = self.options[payoff.Direction.PUT]
+        expected = BlackScholesPricer().price(opt, self.market)
+
+        plain = BinaryTreePricer(steps=200).price(opt, self.market)
+        extrapolated = BinaryTreePricer(steps=200, richardson=True).price(opt, self.market)
+
+        self.assertLess(abs(extrapolated - expected), abs(plain - expected))
+
+
+class TestTreeEarlyExercise(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .0, .25)
+        cls.pricer = BinaryTreePricer(steps=1000, method=TreeMethod.LEISEN_REIMER)
+        
+        put = payoff.VanillaPayoff(direction=payoff.Direction.PUT)
+        expiry = date(2026, 1, 1)
+
+        cls.european = option.Option(100.0, exercise.EuropeanExercise(expiry=expiry), put)
+        cls.american = option.Option(100.0, 
+                                     exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                               expiry=expiry), 
+                                     put)
+        cls.bermudan = option.Option(100.0, 
+                                     exercise.BermudanExercise(
+                                         dates=(date(2025, 4, 1), date(2025, 7, 1), 
+                                                date(2025, 10, 1), expiry)), 
+                                     put)
+
+    def test_american_put_reference(self):
+
+        # Hull's example: S = K = 50, r = 10%, vol = 40%, T = 5/12 (150 days ACT/360),
+        # american put ~ 4.284 on large trees
+        market = types.Market(50, .1, date(2025, 1, 1), .0, .4, basis='ACT/360')
+        put = option.Option(50.0, 
+                            exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                      expiry=date(2025, 5, 31)), 
+                            payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        
+        self.assertAlmostEqual(self.pricer.price(put, market), 4.284, places=3)
+
+    def test_exercise_ordering(self):
+
+        eu = self.pricer.price(self.european, self.market)
+        berm = self.pricer.price(self.bermudan, self.market)
+        amer = self.pricer.price(self.american, self.market)
+
+        self.assertLess(eu, berm)
+        self.assertLess(berm, amer)
+
+    def test_american_call_no_div_equals_european(self):
+
+        call = payoff.VanillaPayoff(direction=payoff.Direction.CALL)
+        eu = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)), call)
+        amer = option.Option(100.0, 
+                             exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                       expiry=date(2026, 1, 1)), 
+                             call)
+        
+        self.assertAlmostEqual(self.pricer.price(eu, self.market), 
+                               self.pricer.price(amer, self.market), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -5,9 +5,10 @@ import numpy as np
 
 sys.path.append('src')
 
-from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
 from src import option, exercise, payoff
 from src.pricers import types
+from src.pricers.types import IVStatus
 
 """"
 Control test order
@@ -16,7 +17,8 @@ def load_tests(loader, tests, pattern):
     suite = unittest.TestSuite()
     # Choose the class order explicitly:
     for cls in (TestPriceInputs, TestBSParams, TestAtmVanillaEUCall, TestAtmVanillaPut,
-                TestAtmVanillaAMERCall):
+                TestAtmVanillaAMERCall, TestPriceBatch, TestGreeksBatch,
+                TestImpliedVolBatch):
         suite.addTests(loader.loadTestsFromTestCase(cls))
     return suite
 
@@ -45,7 +47,6 @@ class TestPriceInputs(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.pricer.price(bermudan_vanilla_option, self.market)
 
-    @unittest.skip("need to implement more payoff schemes")        
     def test_invalid_payoff(self):
 
         eu_exercise = exercise.EuropeanExercise(expiry=date(2025, 11, 30))
@@ -360,5 +361,241 @@ class TestAtmVanillaAMERCall(unittest.TestCase):
 
     
 
+class TestPriceBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pricer = BlackScholesPricer()
+        cls.market = types.Market(spot=100, 
+                                  rate = .05, 
+                                  today = date(2025, 12, 1), 
+                                  div = .01, 
+                                  vol = .25)
+        
+        expiries = (date(2025, 12, 1), date(2025, 12, 31), date(2026, 6, 30))
+        strikes = (80.0, 100.0, 125.0)
+        directions = (payoff.Direction.CALL, payoff.Direction.PUT)
+
+        cls.options = [option.Option(k, exercise.EuropeanExercise(expiry=t), 
+                                     payoff.VanillaPayoff(direction=d)) 
+                       for k in strikes for t in expiries for d in directions]
+
+    def test_matches_scalar_path(self):
+
+        prices = self.pricer.price_batch(self.options, self.market)
+        
+        self.assertIsInstance(prices, np.ndarray)
+        self.assertEqual(prices.shape, (len(self.options),))
+
+        for opt, value in zip(self.options, prices):
+            self.assertAlmostEqual(self.pricer.price(opt, self.market), value, places=12)
+
+    def test_one_market_per_option(self):
+
+        markets = [types.Market(spot=s, rate=.03, today=date(2025, 12, 1), vol=v) 
+                   for s, v in zip(np.linspace(80, 120, len(self.options)), 
+                                   np.linspace(.05, .6, len(self.options)))]
+        
+        prices = self.pricer.price_batch(self.options, markets)
+
+        for opt, mkt, value in zip(self.options, markets, prices):
+            self.assertAlmostEqual(self.pricer.price(opt, mkt), value, places=12)
+
+    def test_zero_vol_is_intrinsic(self):
+
+        market = types.Market(spot=100, rate=.05, today=date(2025, 12, 1), vol=0.0)
+        prices = self.pricer.price_batch(self.options, market)
+
+        for opt, value in zip(self.options, prices):
+            self.assertEqual(self.pricer.price(opt, market), value)
+
+    def test_from_arrays(self):
+
+        params = BSBatchParameters.from_arrays(strikes = [90.0, 100.0, 110.0], 
+                                               taus = [30/365, 30/365, -1.0],
+                                               directions = [1, -1, 1],
+                                               spots = 100.0,
+                                               rates = .05,
+                                               divs = .0,
+                                               vols = .25)
+        
+        prices = self.pricer.price_batch(params)
+
+        self.assertAlmostEqual(prices[1], 2.652, places=3)
+        self.assertEqual(prices[2], 0.0)
+
+    def test_nan_vols_stay_nan(self):
+
+        # unsolved implied vols come back as NaN, repricing them must not look valid
+        params = BSBatchParameters.from_arrays(strikes = [90.0, 110.0], taus = [.5, .5],
+                                               directions = [1, -1], spots = 100.0,
+                                               vols = [np.nan, .25])
+        prices = self.pricer.price_batch(params)
+
+        self.assertTrue(np.isnan(prices[0]))
+        self.assertTrue(np.isfinite(prices[1]))
+
+    def test_unsupported_option_in_batch(self):
+
+        bermudan = option.Option(100.0, 
+                                 exercise.BermudanExercise(dates=(date(2025, 12, 31),)),
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+
+        with self.assertRaises(NotImplementedError):
+            self.pricer.price_batch(self.options + [bermudan], self.market)
+
+    def test_market_count_mismatch(self):
+
+        with self.assertRaises(ValueError):
+            self.pricer.price_batch(self.options, [self.market])
+
+
+class TestGreeksBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pricer = BlackScholesPricer()
+        cls.market = types.Market(spot=100, 
+                                  rate = .05, 
+                                  today = date(2025, 12, 1), 
+                                  div = .02, 
+                                  vol = .25)
+        
+        expiries = (date(2025, 12, 1), date(2025, 12, 31), date(2026, 6, 30))
+        strikes = (80.0, 100.0, 125.0)
+        directions = (payoff.Direction.CALL, payoff.Direction.PUT)
+
+        cls.options = [option.Option(k, exercise.EuropeanExercise(expiry=t), 
+                                     payoff.VanillaPayoff(direction=d)) 
+                       for k in strikes for t in expiries for d in directions]
+
+    def test_matches_scalar_path(self):
+
+        batch = self.pricer.greeks_batch(self.options, self.market)
+
+        self.assertEqual(len(batch), len(self.options))
+
+        for i, opt in enumerate(self.options):
+            greeks = self.pricer.greeks(opt, self.market)
+
+            for name in ('delta', 'gamma', 'vega', 'theta', 'rho'):
+                expected = getattr(greeks, name)
+                
+                if expected is None:
+                    self.assertTrue(np.isnan(getattr(batch, name)[i]))
+                else:
+                    self.assertAlmostEqual(expected, getattr(batch, name)[i], places=12)
+
+    def test_put_greeks_match_finite_differences(self):
+
+        put = option.Option(95.0, exercise.EuropeanExercise(expiry=date(2026, 6, 30)), 
+                            payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        
+        greeks = self.pricer.greeks_batch([put], self.market).row(0)
+
+        def bumped(**kw):
+            m = types.Market(**{**dict(spot=100, rate=.05, today=date(2025, 12, 1), 
+                                       div=.02, vol=.25), **kw})
+            return self.pricer.price(put, m)
+
+        h = 1e-4
+        delta_fd = (bumped(spot=100 + h) - bumped(spot=100 - h)) / (2 * h)
+        rho_fd = (bumped(rate=.05 + h) - bumped(rate=.05 - h)) / (2 * h) / 100
+        
+        self.assertAlmostEqual(greeks.delta, delta_fd, places=6)
+        self.assertAlmostEqual(greeks.rho, rho_fd, places=6)
+
+    def test_records(self):
+
+        records = self.pricer.greeks_batch(self.options, self.market).to_records()
+        
+        self.assertEqual(records.dtype.names, ('delta', 'gamma', 'vega', 'theta', 'rho'))
+        self.assertEqual(len(records), len(self.options))
+
+
+class TestImpliedVolBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pricer = BlackScholesPricer()
+
+        rng = np.random.default_rng(42)
+        n = 2000
+        cls.params = BSBatchParameters.from_arrays(strikes = rng.uniform(70, 130, n),
+                                                   taus = rng.uniform(.05, 2, n),
+                                                   directions = rng.choice([1, -1], n),
+                                                   spots = 100.0,
+                                                   rates = .03,
+                                                   divs = .01,
+                                                   vols = rng.uniform(.1, .8, n))
+        cls.prices = cls.pricer.price_batch(cls.params)
+
+    def test_recovers_vols(self):
+
+        result = self.pricer.implied_vol_batch(self.params, target_prices=self.prices, 
+                                               tol=1e-10)
+
+        self.assertTrue(result.converged.all())
+        np.testing.assert_allclose(result.vols, self.params.sigma, atol=1e-4)
+
+        repriced = self.pricer.price_batch(BSBatchParameters.from_arrays(
+            strikes = self.params.K, taus = self.params.tau, 
+            directions = np.where(self.params.is_call, 1, -1), spots = 100.0, 
+            rates = .03, divs = .01, vols = result.vols))
+        
+        np.testing.assert_allclose(repriced, self.prices, atol=1e-8)
+        self.assertTrue((result.iterations > 0).all())
+
+    def test_matches_scalar_solver(self):
+
+        market = types.Market(spot=100, rate=.05, today=date(2025, 12, 1), vol=.25)
+        opts = [option.Option(k, exercise.EuropeanExercise(expiry=date(2025, 12, 31)), 
+                              payoff.VanillaPayoff(direction=d))
+                for k in (99.0, 100.0, 101.0) for d in payoff.Direction]
+        
+        result = self.pricer.implied_vol_batch(opts, market, target_prices=3.0)
+
+        for opt, vol in zip(opts, result.vols):
+            self.assertAlmostEqual(self.pricer.implied_vol(opt, market, 3.0), vol, places=6)
+
+    def test_out_of_bounds_quotes(self):
+
+        params = BSBatchParameters.from_arrays(strikes = [100.0, 100.0, 100.0], 
+                                               taus = [1.0, 1.0, 0.0],
+                                               directions = [1, 1, 1],
+                                               spots = 100.0,
+                                               vols = .2)
+        
+        # above the spot, below intrinsic and expired
+        result = self.pricer.implied_vol_batch(params, target_prices=[101.0, -1.0, 5.0])
+
+        self.assertTrue((result.status == IVStatus.OUT_OF_BOUNDS).all())
+        self.assertTrue(np.isnan(result.vols).all())
+
+    def test_quotes_insensitive_to_vol(self):
+
+        # deep out-of-the-money, a week to expiry: zero prices, as at the vol floor
+        params = BSBatchParameters.from_arrays(strikes = [200.0, 50.0], taus = [.02, .02],
+                                               directions = [1, -1], spots = 100.0,
+                                               vols = .2)
+        result = self.pricer.implied_vol_batch(params, target_prices=0.0)
+
+        self.assertTrue((result.status == IVStatus.OUT_OF_BOUNDS).all())
+        np.testing.assert_array_equal(result.iterations, 0)
+
+    def test_iteration_counts_at_the_vol_bounds(self):
+
+        params = BSBatchParameters.from_arrays(strikes = [90.0, 100.0, 110.0], 
+                                               taus = [.5, 1.0, 2.0], directions = [1, -1, 1],
+                                               spots = 100.0, vols = 10.0)
+        
+        # quotes priced at vol_max sit on the bracket's end
+        result = self.pricer.implied_vol_batch(
+            params, target_prices=self.pricer.price_batch(params), max_iter=20)
+
+        self.assertTrue(((result.iterations >= 0) & (result.iterations <= 40)).all())
+        self.assertTrue((result.status != IVStatus.FAILED).all())
+
+
 if __name__ == '__main__':
-    unittest.main(verbosity = 2)
\ No newline at end of file
+    unittest.main(verbosity = 2)
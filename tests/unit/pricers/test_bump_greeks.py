@@ -0,0 +1,124 @@
+import unittest
+from unittest import mock
+import sys
+import math
+from datetime import date
+
+sys.path.append('src')
+
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.binary_tree import BinaryTreePricer, TreeMethod
+from src.pricers.monte_carlo import MonteCarloPricer
+from src.pricers.types import Market, Bumps, BumpScheme
+from src import option, exercise, payoff
+
+
+class TestBumpGreeks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.call = option.Option(105.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)), 
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        analytic = BlackScholesPricer().greeks(cls.call, cls.market)
+
+        # closed-form vanna / volga, per vol point as bump_greeks reports them
+        S, K, r, q, s, T = 100.0, 105.0, .05, .02, .25, 1.0
+        d1 = (math.log(S / K) + (r - q + 0.5 * s * s) * T) / (s * math.sqrt(T))
+        d2 = d1 - s * math.sqrt(T)
+        pdf = math.exp(-0.5 * d1 * d1) / math.sqrt(2 * math.pi)
+        cls.expected = {
+            'delta': analytic.delta, 'gamma': analytic.gamma, 'vega': analytic.vega, 
+            'theta': analytic.theta, 'rho': analytic.rho,
+            'vanna': -math.exp(-q * T) * pdf * d2 / s / 100,
+            'volga': S * math.exp(-q * T) * pdf * math.sqrt(T) * d1 * d2 / s / 100**2}
+
+    def assertGreeks(self, greeks, tolerances: dict):
+        for name, tol in tolerances.items():
+            with self.subTest(greek=name):
+                self.assertAlmostEqual(getattr(greeks, name), self.expected[name], 
+                                       delta=tol)
+
+    def test_central(self):
+
+        greeks = BlackScholesPricer().bump_greeks(self.call, self.market)
+        self.assertGreeks(greeks, {'delta': 1e-4, 'gamma': 1e-5, 'vega': 1e-4, 
+                                   'theta': 1e-4, 'rho': 1e-6, 'vanna': 1e-5, 
+                                   'volga': 1e-6})
+
+    def test_forward(self):
+
+        bumps = Bumps(spot=1e-4, vol=1e-4, rate=1e-5, scheme=BumpScheme.FORWARD)
+        greeks = BlackScholesPricer().bump_greeks(self.call, self.market, bumps)
+        self.assertGreeks(greeks, {'delta': 1e-4, 'gamma': 1e-4, 'vega': 1e-4, 
+                                   'theta': 1e-4, 'rho': 1e-5, 'vanna': 1e-5, 
+                                   'volga': 1e-6})
+
+    def test_single_batch(self):
+
+        pricer = BlackScholesPricer()
+        with mock.patch.object(pricer, 'price_batch', 
+                               wraps=pricer.price_batch) as batch:
+            pricer.bump_greeks(self.call, self.market)
+            pricer.bump_greeks(self.call, self.market, Bumps(second_order=False))
+
+        # base, 2 spot, 2 vol, 2 rate, theta and 4 cross markets, then 8 without cross
+        self.assertEqual([len(c.args[1]) for c in batch.call_args_list], [12, 8])
+
+        greeks = pricer.bump_greeks(self.call, self.market, Bumps(second_order=False))
+        self.assertIsNone(greeks.vanna)
+        self.assertIsNone(greeks.volga)
+
+    def test_vol_bumps_stay_above_zero(self):
+
+        pricer = BlackScholesPricer()
+        low = Market(100, .05, date(2025, 1, 1), .02, .006)
+
+        # a 1% down bump would be floored: the central difference shrinks to vol / 2
+        greeks = pricer.bump_greeks(self.call, low)
+        shrunk = pricer.bump_greeks(self.call, low, Bumps(vol=.003))
+        for name in ('vega', 'volga', 'vanna'):
+            with self.subTest(greek=name):
+                self.assertAlmostEqual(getattr(greeks, name), getattr(shrunk, name), 
+                                       places=12)
+
+        # no room for a down bump at all: forward in vol
+        flat = Market(100, .05, date(2025, 1, 1), .02, 0.0)
+        forward = pricer.bump_greeks(self.call, flat)
+        expected = pricer.bump_greeks(self.call, flat, Bumps(scheme=BumpScheme.FORWARD))
+        self.assertAlmostEqual(forward.vega, expected.vega, places=12)
+        self.assertAlmostEqual(forward.volga, expected.volga, places=12)
+
+    def test_tree_fallback(self):
+
+        # pricers without analytic greeks get them from bump_greeks, one tree per
+        # market and without the cross bumps
+        pricer = BinaryTreePricer(steps=400, method=TreeMethod.LEISEN_REIMER)
+        with mock.patch.object(pricer, 'price', wraps=pricer.price) as price:
+            greeks = pricer.greeks(self.call, self.market)
+
+        self.assertEqual(price.call_count, 8)
+        self.assertIsNone(greeks.vanna)
+        self.assertGreeks(greeks, {'delta': 1e-3, 'gamma': 1e-3, 'vega': 1e-3, 
+                                   'rho': 1e-3})
+
+    def test_monte_carlo_common_random_numbers(self):
+
+        pricer = MonteCarloPricer(n_paths=100_000, n_steps=1)
+        greeks = pricer.bump_greeks(self.call, self.market)
+
+        # independent draws per bumped market would swamp gamma with noise
+        self.assertIsNone(pricer.seed)
+        self.assertGreeks(greeks, {'delta': 1e-2, 'gamma': 1e-3, 'vega': 1e-2})
+
+    def test_invalid_bumps(self):
+
+        with self.assertRaises(ValueError):
+            Bumps(spot=0.0)
+
+        with self.assertRaises(ValueError):
+            Bumps(days=0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
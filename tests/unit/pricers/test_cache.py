@@ -0,0 +1,140 @@
+import unittest
+import sys
+from datetime import date
+from unittest import mock
+
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.cache import LRUCache
+from src.pricers.black_scholes import BlackScholesPricer
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # touching 'a' makes 'b' the eviction candidate
+        self.assertEqual(cache.get_or_compute('a', lambda: -1), 1)
+        cache.put('c', 3)
+
+        self.assertEqual(cache.get_or_compute('b', lambda: -2), -2)
+        self.assertEqual(cache.get_or_compute('a', lambda: -1), -1)
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.size), 
+                         (1, 2, 3, 2))
+
+    def test_ttl_expiry(self):
+
+        now = [0.0]
+        cache = LRUCache(maxsize=4, ttl=10.0, clock=lambda: now[0])
+        cache.put('a', 1)
+
+        now[0] = 9.0
+        self.assertEqual(cache.get_or_compute('a', lambda: 2), 1)
+
+        now[0] = 10.0
+        self.assertEqual(cache.get_or_compute('a', lambda: 2), 2)
+        self.assertAlmostEqual(cache.stats().hit_rate, 0.5)
+
+    def test_invalid_settings(self):
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
+
+        with self.assertRaises(ValueError):
+            LRUCache(ttl=0.0)
+
+
+class TestPricerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        self.call = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                                  payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        self.pricer = BlackScholesPricer()
+
+    def test_option_identity(self):
+
+        twin = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                             payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        put = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                            payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+
+        self.assertEqual(hash(twin), hash(self.call))
+        self.assertEqual(twin.uid, self.call.uid)
+        self.assertNotEqual(put.uid, self.call.uid)
+
+    def test_equal_options_share_uid(self):
+
+        expiry = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+        call = payoff.VanillaPayoff(direction=payoff.Direction.CALL)
+
+        # same terms spelled differently compare equal, and must share a uid
+        for strike in (100, np.float64(100.0)):
+            with self.subTest(strike=repr(strike)):
+                twin = option.Option(strike, expiry, call)
+                self.assertEqual(twin, self.call)
+                self.assertEqual(twin.uid, self.call.uid)
+
+        barrier = payoff.BarrierPayoff(direction=payoff.Direction.CALL, barrier=120,
+                                       barrier_type=payoff.BarrierType.UP_AND_OUT)
+        twin = payoff.BarrierPayoff(direction=payoff.Direction.CALL, barrier=120.0,
+                                    barrier_type=payoff.BarrierType.UP_AND_OUT)
+        self.assertEqual(option.Option(100.0, expiry, barrier).uid,
+                         option.Option(100.0, expiry, twin).uid)
+        self.assertNotEqual(option.Option(100.0, expiry, barrier).uid, self.call.uid)
+
+    def test_repeated_prices_hit_cache(self):
+
+        uncached = self.pricer.price(self.call, self.market)
+        cache = self.pricer.enable_cache(maxsize=16)
+
+        with mock.patch.object(BlackScholesPricer, '_price_impl', 
+                               wraps=self.pricer._price_impl) as impl:
+            for _ in range(3):
+                self.assertEqual(self.pricer.price(self.call, self.market), uncached)
+
+            impl.assert_called_once()
+
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (2, 1))
+
+    def test_market_snapshot_is_part_of_key(self):
+
+        self.pricer.enable_cache()
+        bumped = types.Market(101, .05, date(2025, 1, 1), .02, .25)
+
+        self.assertNotEqual(self.pricer.price(self.call, self.market), 
+                            self.pricer.price(self.call, bumped))
+        self.assertEqual(self.pricer.cache.stats().misses, 2)
+
+    def test_greeks_cached_separately(self):
+
+        self.pricer.enable_cache()
+        price, greeks = self.pricer.price_and_greeks(self.call, self.market)
+
+        self.assertEqual(self.pricer.greeks(self.call, self.market), greeks)
+        self.assertEqual(self.pricer.price(self.call, self.market), price)
+        self.assertEqual(self.pricer.cache.stats().hits, 2)
+
+    def test_implied_vol_bypasses_cache(self):
+
+        self.pricer.enable_cache()
+        target = self.pricer.price(self.call, self.market)
+
+        vol = self.pricer.implied_vol(self.call, self.market, target)
+
+        self.assertAlmostEqual(vol, .25, places=6)
+        self.assertEqual(len(self.pricer.cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+import sys
+import dataclasses
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.curves import YieldCurve, DividendCurve
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.binary_tree import BinaryTreePricer
+from src.pricers.time_utils import year_fraction
+from src.book import OptionBook
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestYieldCurve(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.curve = YieldCurve.from_zero_rates([.5, 1.0, 2.0], [.03, .04, .045])
+
+    def test_pillars(self):
+        np.testing.assert_allclose(self.curve.discount([.5, 1.0, 2.0]), 
+                                   np.exp(-np.array([.015, .04, .09])), rtol=1e-15)
+        np.testing.assert_allclose(self.curve.zero_rates([.5, 1.0, 2.0]), 
+                                   [.03, .04, .045], rtol=1e-14)
+
+    def test_flat_forwards(self):
+
+        # log discount factors are linear between pillars and after the last one
+        forward = (.09 - .04) / 1.0
+        self.assertAlmostEqual(float(self.curve.discount(1.5)), np.exp(-.04 - .5 * forward), 
+                               places=15)
+        self.assertAlmostEqual(float(self.curve.discount(3.0)), np.exp(-.09 - forward), 
+                               places=15)
+        self.assertAlmostEqual(float(self.curve.zero_rates(0.0)), .03, places=15)
+
+    def test_memoized_per_expiry(self):
+
+        taus = np.repeat(np.linspace(.1, 3.0, 40), 5000)
+        np.random.default_rng(0).shuffle(taus)
+
+        with mock.patch.object(YieldCurve, '_log_discount', autospec=True, 
+                               side_effect=YieldCurve._log_discount) as evaluate:
+            discount = self.curve.discount(taus)
+
+        self.assertEqual(evaluate.call_args.args[1].size, 40)
+        np.testing.assert_allclose(discount, np.exp(-self.curve.zero_rates(taus) * taus), 
+                                   rtol=1e-14)
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            YieldCurve.from_zero_rates([1.0, .5], [.03, .04])
+
+        with self.assertRaises(ValueError):
+            YieldCurve.from_discount_factors([1.0], [0.0])
+
+        with self.assertRaises(ValueError):
+            DividendCurve(cash_times=[.5, 1.0], cash_amounts=[1.0])
+
+
+class TestCurveMarket(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rates = YieldCurve.from_zero_rates([.5, 1.0, 2.0], [.03, .04, .045])
+        cls.dividends = DividendCurve(
+            yields=YieldCurve.from_zero_rates([1.0], [.01]), 
+            cash_times=[.75, .25], cash_amounts=[2.0, 1.5])
+        cls.market = types.Market(100, today=date(2025, 1, 1), vol=.25, 
+                                  rate_curve=cls.rates, div_curve=cls.dividends)
+        
+        cls.options = [option.Option(k, exercise.EuropeanExercise(expiry=e), 
+                                     payoff.VanillaPayoff(direction=d))
+                       for e in (date(2025, 2, 1), date(2025, 7, 1), date(2026, 6, 1)) 
+                       for k in (90.0, 110.0) for d in payoff.Direction]
+
+    def test_carry(self):
+
+        spots, rates, divs = self.market.carry(np.array([.1, .5, 1.0]))
+
+        pv = np.array([0.0, 1.5 * float(self.rates.discount(.25)), 
+                       1.5 * float(self.rates.discount(.25)) 
+                       + 2.0 * float(self.rates.discount(.75))])
+        
+        np.testing.assert_allclose(spots, 100.0 - pv, rtol=1e-15)
+        np.testing.assert_allclose(rates, self.rates.zero_rates([.1, .5, 1.0]), rtol=1e-15)
+        np.testing.assert_allclose(divs, .01, rtol=1e-14)
+
+        self.assertEqual(self.market.carry(.5), tuple(float(x[1]) for x in 
+                                                      (spots, rates, divs)))
+
+    def test_flat_market_unchanged(self):
+        market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        self.assertEqual(market.carry(1.0), (100.0, .05, .02))
+        np.testing.assert_array_equal(market.carry(np.ones(3))[1], np.full(3, .05))
+
+    def test_cash_dividends_exceeding_spot(self):
+
+        market = dataclasses.replace(self.market, spot=3.0)
+        with self.assertRaises(ValueError):
+            market.carry(1.0)
+
+    def test_black_scholes(self):
+
+        pricer = BlackScholesPricer()
+
+        # each option against the flat market with the same forward and discounting
+        expected = []
+        for o in self.options:
+            tau = year_fraction(self.market.today, o.exercise.expiry, self.market.basis)
+            spot, rate, div = self.market.carry(tau)
+            flat = types.Market(spot, rate, self.market.today, div, .25)
+            expected.append(pricer.price(o, flat))
+
+        np.testing.assert_allclose([pricer.price(o, self.market) for o in self.options], 
+                                   expected, rtol=1e-14)
+        np.testing.assert_allclose(pricer.price_batch(self.options, self.market), 
+                                   expected, rtol=1e-12)
+        np.testing.assert_allclose(
+            pricer.price_batch(OptionBook.from_options(self.options), self.market), 
+            expected, rtol=1e-12)
+
+    def test_dividends_block_american_call_closed_form(self):
+
+        call = option.Option(100.0, exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                              expiry=date(2026, 1, 1)),
+                             payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        
+        self.assertFalse(BlackScholesPricer().is_supported(call, self.market))
+        self.assertGreater(BinaryTreePricer(steps=200).price(call, self.market), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,87 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.dispatch import BookDispatcher
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.binary_tree import BinaryTreePricer
+from src.pricers.monte_carlo import MonteCarloPricer
+from src.book import OptionBook
+from src import option, exercise, payoff
+from src.payoff import Direction
+from src.pricers import types
+
+
+class TestBookDispatcher(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+
+        euro = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+        amer = exercise.AmericanExercise(start=date(2025, 1, 1), expiry=date(2026, 1, 1))
+
+        cls.options = [
+            option.Option(90.0, euro, payoff.VanillaPayoff(direction=Direction.CALL)),
+            option.Option(100.0, amer, payoff.VanillaPayoff(direction=Direction.PUT)),
+            option.Option(100.0, euro, payoff.AsianArithmeticPayoff(direction=Direction.CALL)),
+            option.Option(110.0, euro, payoff.VanillaPayoff(direction=Direction.PUT)),
+            option.Option(95.0, amer, payoff.VanillaPayoff(direction=Direction.PUT)),
+            option.Option(105.0, euro, payoff.VanillaPayoff(direction=Direction.CALL)),
+        ]
+
+        cls.bs = BlackScholesPricer()
+        cls.tree = BinaryTreePricer(steps=200)
+        cls.mc = MonteCarloPricer(n_paths=4000, n_steps=12, seed=3)
+        cls.dispatcher = BookDispatcher([cls.bs, cls.tree, cls.mc])
+
+    def test_plan_picks_cheapest_pricer(self):
+
+        plan = self.dispatcher.plan(self.options, self.market)
+        assigned = {int(row): group.pricer for group in plan for row in group.rows}
+
+        self.assertEqual(sorted(assigned), list(range(len(self.options))))
+        self.assertIs(assigned[0], self.bs)
+        self.assertIs(assigned[3], self.bs)
+        self.assertIs(assigned[1], self.tree)
+        self.assertIs(assigned[2], self.mc)
+
+        # (payoff, exercise, direction, dividend) groups
+        self.assertEqual(len(plan), 4)
+        self.assertTrue(all(group.key[3] is False for group in plan))
+
+    def test_prices_in_book_order(self):
+
+        expected = [self.bs.price(o, self.market) if self.bs.is_supported(o, self.market)
+                    else self.tree.price(o, self.market) 
+                    if self.tree.is_supported(o, self.market)
+                    else self.mc.price(o, self.market) for o in self.options]
+
+        for workers in (1, 4):
+            dispatcher = BookDispatcher([self.bs, self.tree, self.mc], max_workers=workers)
+
+            with self.subTest(workers=workers):
+                np.testing.assert_allclose(
+                    dispatcher.price(OptionBook.from_options(self.options), self.market), 
+                    expected, rtol=1e-12)
+
+    def test_unsupported_row(self):
+
+        with self.assertRaises(NotImplementedError):
+            BookDispatcher([self.bs]).price(self.options, self.market)
+
+    def test_default_pricers(self):
+
+        dispatcher = BookDispatcher()
+        prices = dispatcher.price(self.options[:2], self.market)
+
+        self.assertAlmostEqual(prices[0], self.bs.price(self.options[0], self.market))
+        self.assertGreater(prices[1], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,97 @@
+import unittest
+import sys
+from datetime import date
+
+sys.path.append('src')
+
+from src.pricers.finite_difference import FiniteDifferencePricer
+from src.pricers.binary_tree import BinaryTreePricer, TreeMethod
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.factory import PricerFactory, PricerType
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestFiniteDifference(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.pricer = FiniteDifferencePricer()
+        cls.bs = BlackScholesPricer()
+
+    def _option(self, strike, direction, rule=None):
+        rule = rule or exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+        return option.Option(strike, rule, payoff.VanillaPayoff(direction=direction))
+
+    def test_factory(self):
+
+        pricer = PricerFactory.create(PricerType.FINITE_DIFFERENCE, n_space=200)
+        self.assertIsInstance(pricer, FiniteDifferencePricer)
+
+    def test_path_dependent_payoff_unsupported(self):
+
+        asian = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                              payoff.AsianArithmeticPayoff(direction=payoff.Direction.PUT))
+        
+        with self.assertRaises(NotImplementedError):
+            self.pricer.price(asian, self.market)
+
+    def test_european_matches_black_scholes(self):
+
+        for direction in payoff.Direction:
+            for strike in (80.0, 100.0, 120.0):
+                opt = self._option(strike, direction)
+
+                with self.subTest(direction=direction, strike=strike):
+                    price, greeks = self.pricer.price_and_greeks(opt, self.market)
+                    expected = self.bs.greeks(opt, self.market)
+
+                    self.assertAlmostEqual(price, self.bs.price(opt, self.market), places=2)
+                    self.assertAlmostEqual(greeks.delta, expected.delta, places=4)
+                    self.assertAlmostEqual(greeks.gamma, expected.gamma, places=5)
+                    self.assertAlmostEqual(greeks.theta, expected.theta, places=4)
+                    self.assertIsNone(greeks.vega)
+
+    def test_american_put_matches_tree(self):
+
+        tree = BinaryTreePricer(steps=2000, method=TreeMethod.LEISEN_REIMER)
+
+        for strike in (80.0, 100.0, 120.0):
+            amer = self._option(strike, payoff.Direction.PUT, 
+                                exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                          expiry=date(2026, 1, 1)))
+            
+            with self.subTest(strike=strike):
+                self.assertAlmostEqual(self.pricer.price(amer, self.market), 
+                                       tree.price(amer, self.market), places=2)
+
+    def test_bermudan_between_european_and_american(self):
+
+        expiry = date(2026, 1, 1)
+        bermudan = self._option(100.0, payoff.Direction.PUT, 
+                                exercise.BermudanExercise(dates=(date(2025, 7, 1), expiry)))
+        american = self._option(100.0, payoff.Direction.PUT, 
+                                exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                          expiry=expiry))
+        european = self._option(100.0, payoff.Direction.PUT)
+
+        eu, berm, amer = (self.pricer.price(o, self.market) 
+                          for o in (european, bermudan, american))
+
+        self.assertLess(eu, berm)
+        self.assertLess(berm, amer)
+
+    def test_expired_option(self):
+
+        expired = self._option(110.0, payoff.Direction.PUT, 
+                               exercise.EuropeanExercise(expiry=date(2025, 1, 1)))
+        
+        price, greeks = self.pricer.price_and_greeks(expired, self.market)
+
+        self.assertEqual(price, 10.0)
+        self.assertIsNone(greeks.delta)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
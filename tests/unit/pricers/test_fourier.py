@@ -0,0 +1,161 @@
+import unittest
+import sys
+import dataclasses
+from datetime import date
+from math import factorial
+import numpy as np
+from scipy.integrate import quad
+
+sys.path.append('src')
+
+from src.pricers.fourier import FFTPricer
+from src.pricers.characteristic import HestonCF, MertonCF, VarianceGammaCF
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
+from src.pricers.factory import PricerFactory, PricerType
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+def lewis_call(model, strike: float, tau: float, market) -> float:
+
+    # independent single-strike reference: Lewis (2001) formula by adaptive quadrature
+    forward = market.spot * np.exp((market.rate - market.div) * tau)
+    x = np.log(strike / forward)
+
+    integral = quad(lambda u: (np.exp(-1j * u * x) * model.cf(u - 0.5j, tau)).real 
+                    / (u * u + .25), 0, np.inf, limit=500)[0]
+    
+    return np.exp(-market.rate * tau) * (forward - np.sqrt(forward * strike) / np.pi * integral)
+
+
+# user payoff types, not known to OptionBook
+@dataclasses.dataclass(frozen=True, slots=True)
+class _VanillaSubclass(payoff.VanillaPayoff):
+    pass
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _SquaredPayoff(payoff.Payoff):
+
+    def value(self, strike, ctx):
+        return max(0.0, self.direction.value * (ctx.spot - strike)) ** 2
+
+    def _values(self, strikes, fixings):
+        return np.maximum(0.0, self.direction.value * (fixings[:, -1] - strikes)) ** 2
+
+
+class TestFFTPricer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.strikes = np.linspace(60.0, 160.0, 21)
+
+    def _bs(self, strikes, tau, direction, vol=.25):
+        return BlackScholesPricer().price_batch(BSBatchParameters.from_arrays(
+            strikes=strikes, taus=tau, directions=direction, spots=100.0, vols=vol, 
+            rates=.05, divs=.02))
+
+    def test_factory(self):
+        self.assertIsInstance(PricerFactory.create(PricerType.FFT, n=1024), FFTPricer)
+
+    def test_invalid_settings(self):
+
+        with self.assertRaises(ValueError):
+            FFTPricer(n=1000)
+
+        with self.assertRaises(ValueError):
+            FFTPricer(alpha=0.0)
+
+    def test_black_scholes_grid(self):
+
+        for direction in (1, -1):
+            with self.subTest(direction=direction):
+                np.testing.assert_allclose(
+                    FFTPricer().price_strikes(self.strikes, 1.0, self.market, direction), 
+                    self._bs(self.strikes, 1.0, direction), atol=1e-6)
+
+    def test_merton_matches_series(self):
+
+        model = MertonCF(sigma=.2, lam=.5, mu_j=-.1, sigma_j=.15)
+        tau = 1.0
+
+        # poisson mixture of black-scholes prices with adjusted rate and vol
+        k = np.exp(model.mu_j + 0.5 * model.sigma_j**2) - 1.0
+        lam = model.lam * (1.0 + k)
+        expected = np.zeros_like(self.strikes)
+
+        for n in range(60):
+            vol = np.sqrt(model.sigma**2 + n * model.sigma_j**2 / tau)
+            rate = .05 - model.lam * k + n * np.log(1.0 + k) / tau
+            weight = np.exp(-lam * tau) * (lam * tau)**n / factorial(n)
+
+            params = BSBatchParameters.from_arrays(strikes=self.strikes, taus=tau, 
+                                                   directions=1, spots=100.0, vols=vol, 
+                                                   rates=rate, divs=.02)
+            expected += weight * BlackScholesPricer().price_batch(params)
+
+        np.testing.assert_allclose(FFTPricer(model).price_strikes(self.strikes, tau, 
+                                                                  self.market), 
+                                   expected, atol=1e-6)
+
+    def test_heston_and_variance_gamma_match_quadrature(self):
+
+        models = (HestonCF(v0=.04, kappa=2.0, theta=.04, xi=.5, rho=-.7), 
+                  VarianceGammaCF(sigma=.2, nu=.2, theta=-.14))
+        
+        for model in models:
+            for tau in (.5, 5.0):
+                with self.subTest(model=model, tau=tau):
+                    prices = FFTPricer(model).price_strikes(self.strikes, tau, self.market)
+                    expected = [lewis_call(model, k, tau, self.market) 
+                                for k in self.strikes]
+                    
+                    np.testing.assert_allclose(prices, expected, atol=1e-5)
+
+    def test_batch_groups_expiries(self):
+
+        model = HestonCF(v0=.04, kappa=2.0, theta=.04, xi=.5, rho=-.7)
+        pricer = FFTPricer(model)
+        expiries = (date(2025, 1, 1), date(2025, 6, 1), date(2026, 1, 1))
+
+        options = [option.Option(k, exercise.EuropeanExercise(expiry=e), 
+                                 payoff.VanillaPayoff(direction=d))
+                   for e in expiries for k in (80.0, 100.0, 120.0) 
+                   for d in payoff.Direction]
+        
+        np.testing.assert_allclose(pricer.price_batch(options, self.market), 
+                                   [pricer.price(o, self.market) for o in options], 
+                                   atol=1e-7)
+        
+        amer = option.Option(100.0, exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                              expiry=date(2026, 1, 1)),
+                             payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        
+        with self.assertRaises(NotImplementedError):
+            pricer.price_batch(options + [amer], self.market)
+
+    def test_batch_with_payoffs_outside_book(self):
+
+        pricer = FFTPricer()
+        expiry = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+        options = [option.Option(k, expiry, 
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+                   for k in (90.0, 110.0)]
+
+        # payoff types an OptionBook cannot hold: unsupported ones raise as price()
+        # does, supported subclasses are priced one by one
+        squared = option.Option(100.0, expiry, 
+                                _SquaredPayoff(direction=payoff.Direction.CALL))
+        with self.assertRaises(NotImplementedError):
+            pricer.price_batch(options + [squared], self.market)
+
+        vanilla = option.Option(100.0, expiry, 
+                                _VanillaSubclass(direction=payoff.Direction.PUT))
+        options.append(vanilla)
+        np.testing.assert_allclose(pricer.price_batch(options, self.market),
+                                   [pricer.price(o, self.market) for o in options])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
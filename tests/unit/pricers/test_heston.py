@@ -0,0 +1,179 @@
+import unittest
+import sys
+import dataclasses
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.heston import HestonPricer, legendre_nodes
+from src.pricers.characteristic import HestonCF
+from src.pricers.fourier import FFTPricer
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
+from src.pricers.factory import PricerFactory, PricerType
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+FIELDS = ('v0', 'kappa', 'theta', 'xi', 'rho')
+
+
+class TestHestonPricer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.model = HestonCF(v0=.04, kappa=1.5, theta=.06, xi=.6, rho=-.65)
+        cls.strikes = np.linspace(70.0, 140.0, 15)
+
+    def test_factory(self):
+        pricer = PricerFactory.create(PricerType.HESTON, model=self.model)
+        self.assertIsInstance(pricer, HestonPricer)
+
+        with self.assertRaises(ValueError):
+            PricerFactory.create(PricerType.HESTON)
+
+    def test_nodes_are_cached(self):
+        self.assertIs(legendre_nodes(64), legendre_nodes(64))
+        self.assertAlmostEqual(legendre_nodes(64)[1].sum(), 1.0, places=14)
+
+    def test_cf_gradient(self):
+
+        u = np.linspace(0.0, 40.0, 9) - 0.5j
+        taus = np.array([[.1], [2.0]])
+        phi, gradient = self.model.cf_gradient(u, taus)
+
+        np.testing.assert_allclose(phi, self.model.cf(u, taus), atol=1e-15)
+
+        for i, name in enumerate(FIELDS):
+            with self.subTest(parameter=name):
+                h = 1e-6
+                value = getattr(self.model, name)
+                up = dataclasses.replace(self.model, **{name: value + h}).cf(u, taus)
+                down = dataclasses.replace(self.model, **{name: value - h}).cf(u, taus)
+                np.testing.assert_allclose(gradient[i], (up - down) / (2 * h), atol=1e-7)
+
+    def test_black_scholes_limit(self):
+
+        # no vol of vol and v0 = theta: constant variance
+        flat = HestonCF(v0=.0625, kappa=1.0, theta=.0625, xi=1e-4, rho=0.0)
+        params = BSBatchParameters.from_arrays(strikes=self.strikes, taus=1.0, 
+                                               directions=-1, spots=100.0, vols=.25, 
+                                               rates=.05, divs=.02)
+        
+        np.testing.assert_allclose(
+            HestonPricer(flat).price_strikes(self.strikes, 1.0, self.market, -1), 
+            BlackScholesPricer().price_batch(params), atol=1e-6)
+
+    def test_matches_fft(self):
+
+        pricer, fft = HestonPricer(self.model), FFTPricer(self.model)
+
+        for tau in (.1, 1.0, 5.0):
+            for direction in (1, -1):
+                with self.subTest(tau=tau, direction=direction):
+                    np.testing.assert_allclose(
+                        pricer.price_strikes(self.strikes, tau, self.market, direction), 
+                        fft.price_strikes(self.strikes, tau, self.market, direction), 
+                        atol=2e-6)
+
+    def test_price_batch(self):
+
+        pricer = HestonPricer(self.model)
+        options = [option.Option(k, exercise.EuropeanExercise(expiry=e), 
+                                 payoff.VanillaPayoff(direction=d))
+                   for e in (date(2025, 4, 1), date(2026, 1, 1)) for k in (90.0, 110.0) 
+                   for d in payoff.Direction]
+        
+        np.testing.assert_allclose(pricer.price_batch(options, self.market), 
+                                   [pricer.price(o, self.market) for o in options], 
+                                   atol=1e-12)
+
+
+class TestHestonCalibration(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.model = HestonCF(v0=.04, kappa=1.5, theta=.06, xi=.6, rho=-.65)
+
+        strikes, taus = np.meshgrid(np.linspace(70.0, 140.0, 15), 
+                                    [.1, .25, .5, 1.0, 2.0, 3.0])
+        cls.strikes, cls.taus = strikes.ravel(), taus.ravel()
+        cls.directions = np.where(cls.strikes < 100.0, -1, 1)
+
+        pricer = HestonPricer(cls.model)
+        cls.prices = np.concatenate([
+            pricer.price_strikes(cls.strikes[cls.taus == t], t, cls.market, 
+                                 cls.directions[cls.taus == t]) 
+            for t in np.unique(cls.taus)])
+
+    def test_call_values_gradient(self):
+
+        pricer = HestonPricer(self.model)
+        x = np.linspace(-.4, .3, 8)
+        _, gradient = pricer.call_values(self.model, x, .75, gradient=True)
+
+        for i, name in enumerate(FIELDS):
+            with self.subTest(parameter=name):
+                h = 1e-6
+                value = getattr(self.model, name)
+                up = pricer.call_values(dataclasses.replace(self.model, **{name: value + h}), 
+                                        x, .75)
+                down = pricer.call_values(dataclasses.replace(self.model, 
+                                                              **{name: value - h}), x, .75)
+                np.testing.assert_allclose(gradient[:, i], (up - down) / (2 * h), atol=1e-6)
+
+    def test_recovers_parameters(self):
+
+        guess = HestonPricer(HestonCF(v0=.09, kappa=3.0, theta=.03, xi=.3, rho=-.2))
+        result = guess.calibrate(self.strikes, self.taus, self.prices, self.market, 
+                                 self.directions)
+
+        self.assertTrue(result.success)
+        self.assertLess(result.rmse, 1e-8)
+        
+        for name in FIELDS:
+            self.assertAlmostEqual(getattr(result.model, name), getattr(self.model, name), 
+                                   places=5)
+
+    def test_weighted_rmse(self):
+
+        # a deliberately misspecified model, so the fit leaves residuals
+        wrong = np.array([.05, 1.0, .05, .3, -.3])
+        pricer = HestonPricer(HestonCF(*wrong))
+        bounds = (wrong, wrong + 1e-12)
+        weights = np.linspace(.5, 2.0, self.prices.size)
+
+        fits = [pricer.calibrate(self.strikes, self.taus, self.prices, self.market,
+                                 self.directions, scale * weights, bounds)
+                for scale in (1.0, 100.0)]
+
+        self.assertGreater(fits[0].rmse, 1e-3)
+        self.assertAlmostEqual(fits[0].rmse, fits[1].rmse, places=10)
+
+        # residuals weighted as in the objective, quotes with zero weight left out
+        weights[::3] = 0.0
+        fit = pricer.calibrate(self.strikes, self.taus, self.prices, self.market,
+                               self.directions, weights, bounds)
+        fitted = HestonPricer(fit.model)
+        residuals = np.concatenate([
+            fitted.price_strikes(self.strikes[self.taus == t], t, self.market,
+                                 self.directions[self.taus == t])
+            for t in np.unique(self.taus)]) - self.prices
+
+        self.assertAlmostEqual(fit.rmse, np.sqrt(np.sum((weights * residuals)**2)
+                                                 / np.sum(weights**2)), places=10)
+
+        with self.assertRaises(ValueError):
+            pricer.calibrate(self.strikes, self.taus, self.prices, self.market,
+                             self.directions, 0.0)
+
+    def test_rejects_expired_quotes(self):
+
+        with self.assertRaises(ValueError):
+            HestonPricer(self.model).calibrate(100.0, 0.0, 5.0, self.market)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
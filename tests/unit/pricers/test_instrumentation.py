@@ -0,0 +1,106 @@
+import unittest
+import sys
+from datetime import date
+
+sys.path.append('src')
+
+from src.pricers.instrumentation import METRICS, ITERATION_BUCKETS
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+
+        METRICS.reset()
+        METRICS.enable()
+
+        self.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        self.call = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                                  payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        self.pricer = BlackScholesPricer()
+
+    def tearDown(self):
+
+        METRICS.disable()
+        METRICS.reset()
+
+    def test_disabled_records_nothing(self):
+
+        METRICS.disable()
+        self.pricer.price(self.call, self.market)
+        self.pricer.greeks(self.call, self.market)
+
+        self.assertEqual(METRICS.snapshot(), {})
+
+    def test_calls_and_stages(self):
+
+        for _ in range(3):
+            self.pricer.price(self.call, self.market)
+        self.pricer.greeks(self.call, self.market)
+
+        stats = METRICS.snapshot()['BlackScholesPricer']
+
+        self.assertEqual(stats['calls'], {'price': 3, 'greeks': 1})
+        for stage in ('price', 'validate', 'evaluate', 'inputs'):
+            self.assertEqual(stats['stages'][stage]['count'], 3)
+            self.assertGreater(stats['stages'][stage]['total_seconds'], 0.0)
+
+        self.assertLessEqual(stats['stages']['inputs']['total_seconds'], 
+                             stats['stages']['evaluate']['total_seconds'])
+
+    def test_solver_histograms(self):
+
+        target = self.pricer.price(self.call, self.market)
+        self.pricer.implied_vol(self.call, self.market, target)
+
+        params = BSBatchParameters.from_arrays(strikes=[90.0, 100.0, 110.0], taus=1.0, 
+                                               directions=1, spots=100.0, vols=.2)
+        quotes = self.pricer.price_batch(params)
+        result = self.pricer.implied_vol_batch(params, target_prices=quotes)
+
+        solvers = METRICS.snapshot()['BlackScholesPricer']['solvers']
+
+        self.assertEqual(solvers['implied_vol']['count'], 1)
+        self.assertEqual(solvers['implied_vol_batch']['count'], 3)
+        self.assertEqual(solvers['implied_vol_batch']['sum'], result.iterations.sum())
+        self.assertEqual(len(solvers['implied_vol_batch']['buckets']), 
+                         len(ITERATION_BUCKETS) + 1)
+
+    def test_cache_hit_rate(self):
+
+        self.pricer.enable_cache()
+        for _ in range(4):
+            self.pricer.price(self.call, self.market)
+
+        cache = METRICS.snapshot()['BlackScholesPricer']['cache']
+        self.assertEqual((cache['hits'], cache['misses']), (3, 1))
+        self.assertAlmostEqual(cache['hit_rate'], .75)
+
+        # only the miss reaches validation and evaluation
+        stages = METRICS.snapshot()['BlackScholesPricer']['stages']
+        self.assertEqual(stages['price']['count'], 4)
+        self.assertEqual(stages['evaluate']['count'], 1)
+
+    def test_prometheus_export(self):
+
+        self.pricer.enable_cache()
+        self.pricer.price(self.call, self.market)
+        self.pricer.implied_vol(self.call, self.market, 10.0)
+
+        text = METRICS.to_prometheus()
+
+        self.assertIn('# TYPE pricer_calls_total counter', text)
+        self.assertIn('pricer_calls_total{pricer="BlackScholesPricer",method="price"} 1', 
+                      text)
+        self.assertIn('pricer_stage_seconds_count{pricer="BlackScholesPricer",'
+                      'stage="evaluate"} 1', text)
+        self.assertIn('pricer_solver_iterations_bucket{pricer="BlackScholesPricer",'
+                      'solver="implied_vol",le="+Inf"} 1', text)
+        self.assertIn('pricer_cache_misses_total{pricer="BlackScholesPricer"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,174 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+from scipy.stats import norm
+
+sys.path.append('src')
+
+from src.pricers.longstaff_schwartz import LongstaffSchwartzPricer
+from src.pricers.binary_tree import BinaryTreePricer, TreeMethod
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.factory import PricerFactory, PricerType
+from src.pricers.time_utils import year_fractions
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+def _american_asian_put_tree(S, K, r, sigma, days, tau, per_day=2, n_averages=300):
+
+    # binomial tree with a grid of representative averages per node (hull-white),
+    # fixings on today and every day after, exercise on the fixings seen so far
+    n = days * per_day
+    u = np.exp(sigma * np.sqrt(tau / n))
+    p = (np.exp(r * tau / n) - 1 / u) / (u - 1 / u)
+    discount = np.exp(-r * tau / n)
+
+    width = 6 * sigma * np.sqrt(tau)
+    log_a = np.linspace(np.log(S) - width, np.log(S) + width, n_averages)
+    h, a = log_a[1] - log_a[0], np.exp(log_a)
+
+    def at(values, rows, averages):
+        pos = np.clip((np.log(averages) - log_a[0]) / h, 0, n_averages - 1 - 1e-9)
+        i = pos.astype(int)
+        return values[rows, i] * (i + 1 - pos) + values[rows, i + 1] * (pos - i)
+
+    values = np.tile(np.maximum(K - a, 0.0), (n + 1, 1))
+
+    for i in range(n - 1, -1, -1):
+
+        j, count = np.arange(i + 1)[:, None], 1 + i // per_day
+        up, down = a, a
+
+        if (i + 1) % per_day == 0:
+            up = (count * a + S * u**(2 * j + 1 - i)) / (count + 1)
+            down = (count * a + S * u**(2 * j - 1 - i)) / (count + 1)
+
+        values = discount * (p * at(values, j + 1, up) + (1 - p) * at(values, j, down))
+
+        if i % per_day == 0:
+            values = np.maximum(values, K - a)
+
+    return float(np.interp(np.log(S), log_a, values[0]))
+
+
+def _bermudan_up_and_out_call_grid(S, K, r, sigma, barrier, times, n=2000):
+
+    # exact gaussian transition between dates on a fine log-spot grid, knock-out and
+    # exercise checked on each date
+    width = 6 * sigma * np.sqrt(times[-1])
+    x = np.linspace(np.log(S) - width, np.log(S) + width, n)
+    h, s = x[1] - x[0], np.exp(x)
+
+    def expectation(values, start, dt):
+        mean = start + (r - .5 * sigma**2) * dt
+        sd = sigma * np.sqrt(dt)
+        cells = (norm.cdf((x + h / 2 - mean[:, None]) / sd)
+                 - norm.cdf((x - h / 2 - mean[:, None]) / sd))
+        return np.exp(-r * dt) * (cells @ values)
+
+    alive = s < barrier
+    values = np.where(alive, np.maximum(s - K, 0.0), 0.0)
+
+    for k in range(len(times) - 2, -1, -1):
+        continuation = expectation(values, x, times[k + 1] - times[k])
+        values = np.where(alive, np.maximum(continuation, s - K), 0.0)
+
+    return float(expectation(values, np.array([np.log(S)]), times[0])[0])
+
+
+class TestLongstaffSchwartz(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .0, .25)
+        cls.tree = BinaryTreePricer(steps=1000, method=TreeMethod.LEISEN_REIMER)
+        cls.put = payoff.VanillaPayoff(direction=payoff.Direction.PUT)
+
+    def test_factory(self):
+
+        pricer = PricerFactory.create(PricerType.LONGSTAFF_SCHWARTZ, n_paths=1000, seed=1)
+        self.assertIsInstance(pricer, LongstaffSchwartzPricer)
+
+    def test_european_path_dependent_payoff_unsupported(self):
+
+        # fixings are the exercise dates: a european asian would be fixed at expiry only
+        asian = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                              payoff.AsianArithmeticPayoff(direction=payoff.Direction.PUT))
+        
+        with self.assertRaises(NotImplementedError):
+            LongstaffSchwartzPricer(n_paths=100).price(asian, self.market)
+
+    def test_american_asian_put_matches_tree(self):
+
+        asian = option.Option(100.0, 
+                              exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                        expiry=date(2025, 4, 1)),
+                              payoff.AsianArithmeticPayoff(direction=payoff.Direction.PUT))
+        
+        result = LongstaffSchwartzPricer(n_paths=50_000, seed=5).simulate(asian, 
+                                                                         self.market)
+        expected = _american_asian_put_tree(100.0, 100.0, .05, .25, days=90, 
+                                            tau=90 / 365)
+
+        # regression bias on top of the sampling error
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error + .02)
+
+    def test_bermudan_barrier_call_matches_grid(self):
+
+        dates = (date(2025, 4, 1), date(2025, 7, 1), date(2025, 10, 1), date(2026, 1, 1))
+        barrier = payoff.BarrierPayoff(direction=payoff.Direction.CALL, barrier=130.0,
+                                       barrier_type=payoff.BarrierType.UP_AND_OUT)
+        bermudan = option.Option(100.0, exercise.BermudanExercise(dates=dates), barrier)
+        
+        result = LongstaffSchwartzPricer(n_paths=100_000, seed=6).simulate(bermudan, 
+                                                                          self.market)
+        times = year_fractions(self.market.today, dates, self.market.basis)
+        expected = _bermudan_up_and_out_call_grid(100.0, 100.0, .05, .25, 130.0, times)
+
+        # knock-out risk makes early exercise worth something
+        self.assertGreater(expected, _bermudan_up_and_out_call_grid(
+            100.0, 100.0, .05, .25, 130.0, times[-1:]) + 1.0)
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error + .02)
+
+    def test_european_matches_black_scholes(self):
+
+        eu = option.Option(100.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)), 
+                           self.put)
+        
+        result = LongstaffSchwartzPricer(n_paths=100_000, seed=2).simulate(eu, self.market)
+        expected = BlackScholesPricer().price(eu, self.market)
+
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error)
+
+    def test_bermudan_put_matches_tree(self):
+
+        bermudan = option.Option(100.0, 
+                                 exercise.BermudanExercise(
+                                     dates=(date(2025, 4, 1), date(2025, 7, 1), 
+                                            date(2025, 10, 1), date(2026, 1, 1))), 
+                                 self.put)
+        
+        result = LongstaffSchwartzPricer(n_paths=100_000, seed=3).simulate(bermudan, 
+                                                                          self.market)
+        expected = self.tree.price(bermudan, self.market)
+
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error)
+
+    def test_american_put_matches_tree(self):
+
+        american = option.Option(100.0, 
+                                 exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                           expiry=date(2025, 4, 1)), 
+                                 self.put)
+        
+        result = LongstaffSchwartzPricer(n_paths=50_000, seed=4).simulate(american, 
+                                                                         self.market)
+        expected = self.tree.price(american, self.market)
+
+        # regression bias on top of the sampling error
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error + .02)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,38 @@
+import unittest
+import sys
+import numpy as np
+from scipy.stats import norm
+
+sys.path.append('src')
+
+from src.pricers.math_kernels import (norm_cdf, norm_pdf, norm_cdf_scalar, 
+                                      norm_pdf_scalar)
+
+
+class TestNormalKernels(unittest.TestCase):
+
+    x = np.concatenate((np.linspace(-37.0, 9.0, 2001), [0.0, -np.inf, np.inf]))
+
+    def test_arrays_match_scipy_stats(self):
+
+        np.testing.assert_array_equal(norm_cdf(self.x), norm.cdf(self.x))
+        np.testing.assert_allclose(norm_pdf(self.x), norm.pdf(self.x), 
+                                   rtol=1e-13, atol=0.0)
+
+    def test_scalars_within_documented_bound(self):
+
+        for x in self.x[::10]:
+            with self.subTest(x=x):
+                self.assertLessEqual(abs(norm_cdf_scalar(x) - norm.cdf(x)), 
+                                     (1 + x * x) * 4e-16 * norm.cdf(x))
+                self.assertLessEqual(abs(norm_pdf_scalar(x) - norm.pdf(x)), 
+                                     1e-13 * norm.pdf(x))
+
+    def test_symmetry(self):
+
+        x = self.x[np.isfinite(self.x) & (self.x > -9.0)]
+        np.testing.assert_allclose(norm_cdf(x) + norm_cdf(-x), 1.0, rtol=1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
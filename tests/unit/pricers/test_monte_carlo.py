@@ -0,0 +1,296 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+from scipy.stats import norm
+
+sys.path.append('src')
+
+from src.pricers.monte_carlo import (MonteCarloPricer, ControlVariate, Sampler,
+                                     _Moments, _control_mean)
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.factory import PricerFactory, PricerType
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestMoments(unittest.TestCase):
+
+    def test_chunked_moments_match_full_sample(self):
+
+        samples = np.random.default_rng(0).normal(3.0, 2.0, 10_001)
+
+        moments = _Moments()
+        for chunk in np.array_split(samples, 7):
+            moments.add(chunk)
+
+        self.assertEqual(moments.n, samples.size)
+        self.assertAlmostEqual(moments.mean, samples.mean(), places=12)
+        self.assertAlmostEqual(moments.std_error, 
+                               samples.std(ddof=1) / np.sqrt(samples.size), places=12)
+
+
+class TestMonteCarloPricer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.expiry = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+
+        cls.call = option.Option(100.0, cls.expiry, 
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        cls.put = option.Option(100.0, cls.expiry, 
+                                payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        cls.asian_call = option.Option(100.0, cls.expiry, 
+                                       payoff.AsianArithmeticPayoff(
+                                           direction=payoff.Direction.CALL))
+
+    def test_factory(self):
+
+        pricer = PricerFactory.create(PricerType.MONTE_CARLO, n_paths=1000, seed=1)
+        self.assertIsInstance(pricer, MonteCarloPricer)
+
+    def test_invalid_exercise(self):
+
+        amer = option.Option(100.0, 
+                             exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                       expiry=date(2026, 1, 1)),
+                             payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        
+        with self.assertRaises(NotImplementedError):
+            MonteCarloPricer(n_paths=100).price(amer, self.market)
+
+    def test_vanilla_matches_black_scholes(self):
+
+        pricer = MonteCarloPricer(n_paths=200_000, chunk_size=30_000, seed=7)
+
+        for opt in (self.call, self.put):
+            result = pricer.simulate(opt, self.market)
+            expected = BlackScholesPricer().price(opt, self.market)
+            
+            self.assertEqual(result.n_paths, 200_000)
+            self.assertLess(abs(result.estimate - expected), 4 * result.std_error)
+
+    def test_seed_is_reproducible(self):
+
+        a = MonteCarloPricer(n_paths=5_000, n_steps=12, chunk_size=700, seed=3)
+        b = MonteCarloPricer(n_paths=5_000, n_steps=12, chunk_size=700, seed=3)
+
+        self.assertEqual(a.simulate(self.asian_call, self.market), 
+                         b.simulate(self.asian_call, self.market))
+
+    def test_workers_do_not_change_result(self):
+
+        single = MonteCarloPricer(n_paths=20_000, n_steps=12, chunk_size=1_500, seed=3)
+        pooled = MonteCarloPricer(n_paths=20_000, n_steps=12, chunk_size=1_500, seed=3, 
+                                  n_workers=3)
+
+        a = single.simulate(self.asian_call, self.market)
+        b = pooled.simulate(self.asian_call, self.market)
+
+        # bit-identical, not just statistically close
+        self.assertEqual(a.estimate, b.estimate)
+        self.assertEqual(a.std_error, b.std_error)
+        self.assertEqual(a.n_paths, b.n_paths)
+
+    def test_digital_matches_closed_form(self):
+
+        digital = option.Option(100.0, self.expiry, 
+                                payoff.DigitalPayoff(direction=payoff.Direction.CALL))
+        
+        result = MonteCarloPricer(n_paths=100_000, seed=5).simulate(digital, self.market)
+        
+        bs = BlackScholesPricer().get_bs_inputs(self.call, self.market)
+        expected = bs.disc_r * norm.cdf(bs.d2)
+
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error)
+
+    def test_barrier_cheaper_than_vanilla(self):
+
+        up_out = option.Option(100.0, self.expiry, 
+                               payoff.BarrierPayoff(direction=payoff.Direction.CALL, 
+                                                    barrier=130.0, 
+                                                    barrier_type=payoff.BarrierType.UP_AND_OUT))
+        
+        pricer = MonteCarloPricer(n_paths=20_000, n_steps=52, seed=5)
+
+        self.assertLess(pricer.price(up_out, self.market), 
+                        BlackScholesPricer().price(self.call, self.market))
+
+    def test_asian_cheaper_than_vanilla(self):
+
+        pricer = MonteCarloPricer(n_paths=50_000, n_steps=52, seed=11)
+
+        asian = pricer.price(self.asian_call, self.market)
+        vanilla = BlackScholesPricer().price(self.call, self.market)
+
+        self.assertGreater(asian, 0.0)
+        self.assertLess(asian, vanilla)
+
+
+class TestVarianceReduction(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.expiry = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+
+        cls.call = option.Option(100.0, cls.expiry, 
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        cls.asian_put = option.Option(100.0, cls.expiry, 
+                                      payoff.AsianArithmeticPayoff(
+                                          direction=payoff.Direction.PUT))
+        cls.expected_call = BlackScholesPricer().price(cls.call, cls.market)
+
+    def test_control_variate_moments(self):
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=10_000)
+        y = 2.0 * x + rng.normal(scale=.1, size=x.size)
+
+        moments = _Moments()
+        for a, b in zip(np.array_split(y, 3), np.array_split(x, 3)):
+            moments.add(a, b)
+
+        self.assertAlmostEqual(moments.beta(), np.cov(y, x)[0, 1] / x.var(ddof=1), places=10)
+
+        estimate, variance = moments.controlled(0.0, moments.beta())
+        self.assertAlmostEqual(estimate, y.mean() - moments.beta() * x.mean(), places=10)
+        self.assertLess(variance, .011)
+
+    def test_geometric_asian_closed_form(self):
+
+        geometric = option.Option(100.0, self.expiry, 
+                                  payoff.AsianGeometricPayoff(direction=payoff.Direction.PUT))
+        pricer = MonteCarloPricer(n_paths=100_000, n_steps=12, seed=8)
+
+        result = pricer.simulate(geometric, self.market)
+        params = pricer.get_mc_inputs(geometric, self.market)
+        expected = _control_mean(params, geometric.payoff, ControlVariate.GEOMETRIC_ASIAN)
+
+        self.assertLess(abs(result.estimate - expected), 4 * result.std_error)
+
+    def test_antithetic(self):
+
+        result = MonteCarloPricer(n_paths=100_000, seed=1, 
+                                  antithetic=True).simulate(self.call, self.market)
+        
+        self.assertEqual(result.n_paths, 100_000)
+        self.assertGreater(result.variance_reduction, 1.2)
+        self.assertLess(abs(result.estimate - self.expected_call), 4 * result.std_error)
+
+    def test_geometric_control_on_asian(self):
+
+        plain = MonteCarloPricer(n_paths=20_000, n_steps=24, seed=2)
+        controlled = MonteCarloPricer(n_paths=20_000, n_steps=24, seed=2,
+                                      control_variate=ControlVariate.GEOMETRIC_ASIAN)
+        
+        a = plain.simulate(self.asian_put, self.market)
+        b = controlled.simulate(self.asian_put, self.market)
+
+        self.assertEqual(a.variance_reduction, 1.0)
+        self.assertGreater(b.variance_reduction, 50)
+        self.assertLess(abs(a.estimate - b.estimate), 4 * a.std_error)
+
+    def test_sobol(self):
+
+        pricer = MonteCarloPricer(n_paths=2**14, n_steps=16, seed=3, sampler=Sampler.SOBOL)
+        result = pricer.simulate(self.call, self.market)
+
+        self.assertGreater(result.variance_reduction, 10)
+        self.assertLess(abs(result.estimate - self.expected_call), 4 * result.std_error)
+
+    def test_sobol_brownian_bridge_independent_of_chunking(self):
+
+        kw = dict(n_paths=2**12, n_steps=16, seed=4, sampler=Sampler.SOBOL, antithetic=True)
+
+        a = MonteCarloPricer(chunk_size=2**12, **kw).simulate(self.asian_put, self.market)
+        b = MonteCarloPricer(chunk_size=100, **kw).simulate(self.asian_put, self.market)
+
+        self.assertAlmostEqual(a.estimate, b.estimate, places=10)
+
+    def test_sobol_needs_replications(self):
+
+        with self.assertRaises(ValueError):
+            MonteCarloPricer(sampler=Sampler.SOBOL, qmc_replications=1)
+
+
+class TestMonteCarloGreeks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.expiry = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+
+        cls.call = option.Option(105.0, cls.expiry,
+                                 payoff.VanillaPayoff(direction=payoff.Direction.CALL))
+        cls.digital = option.Option(105.0, cls.expiry,
+                                    payoff.DigitalPayoff(direction=payoff.Direction.CALL))
+
+    def assertWithinErrors(self, result, expected: dict, n_errors: float = 4.0):
+        for name, value in expected.items():
+            with self.subTest(greek=name):
+                error = getattr(result.greeks_std_error, name)
+                self.assertGreater(error, 0.0)
+                self.assertLess(abs(getattr(result.greeks, name) - value), n_errors * error)
+
+    def test_pathwise_vanilla_matches_black_scholes(self):
+
+        analytic = BlackScholesPricer().greeks(self.call, self.market)
+        expected = {name: getattr(analytic, name)
+                    for name in ('delta', 'gamma', 'vega', 'theta', 'rho')}
+
+        for kw in ({}, {'antithetic': True}):
+            with self.subTest(**kw):
+                pricer = MonteCarloPricer(n_paths=100_000, seed=7, **kw)
+                self.assertWithinErrors(pricer.simulate(self.call, self.market, greeks=True),
+                                        expected)
+
+    def test_likelihood_ratio_digital_matches_closed_form(self):
+
+        S, K, r, q, s, T = 100.0, 105.0, .05, .02, .25, 1.0
+        d1 = (np.log(S / K) + (r - q + 0.5 * s * s) * T) / (s * np.sqrt(T))
+        d2 = d1 - s * np.sqrt(T)
+        pdf = np.exp(-r * T) * norm.pdf(d2)
+
+        expected = {'delta': pdf / (S * s * np.sqrt(T)),
+                    'vega': -pdf * d1 / s / 100,
+                    'rho': (pdf * np.sqrt(T) / s - T * np.exp(-r * T) * norm.cdf(d2)) / 100}
+
+        result = MonteCarloPricer(n_paths=200_000, seed=3).simulate(self.digital, self.market,
+                                                                     greeks=True)
+        self.assertWithinErrors(result, expected)
+
+    def test_greeks_share_the_price_paths(self):
+
+        pricer = MonteCarloPricer(n_paths=20_000, n_steps=12, chunk_size=3_000, seed=5)
+        barrier = option.Option(105.0, self.expiry, payoff.BarrierPayoff(
+            direction=payoff.Direction.CALL, barrier=130.0,
+            barrier_type=payoff.BarrierType.UP_AND_OUT))
+
+        with_greeks = pricer.simulate(barrier, self.market, greeks=True)
+        price_only = pricer.simulate(barrier, self.market)
+
+        self.assertEqual(with_greeks.estimate, price_only.estimate)
+        self.assertIsNone(price_only.greeks)
+        self.assertEqual(pricer.greeks(barrier, self.market), with_greeks.greeks)
+
+    def test_sobol_greeks_error_from_replications(self):
+
+        analytic = BlackScholesPricer().greeks(self.call, self.market)
+        result = MonteCarloPricer(n_paths=2**14, seed=2, sampler=Sampler.SOBOL).simulate(
+            self.call, self.market, greeks=True)
+
+        self.assertWithinErrors(result, {'delta': analytic.delta, 'vega': analytic.vega}, 5.0)
+
+    def test_expired_option_has_no_greeks(self):
+
+        market = types.Market(100, .05, date(2026, 1, 1), .02, .25)
+        result = MonteCarloPricer(n_paths=100).simulate(self.call, market, greeks=True)
+
+        self.assertIsNone(result.greeks.delta)
+        self.assertIsNone(result.greeks_std_error.vega)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
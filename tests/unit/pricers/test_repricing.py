@@ -0,0 +1,123 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.repricing import BSRepricingSession
+from src.pricers.black_scholes import BlackScholesPricer, BSBatchParameters
+from src.pricers.curves import DividendCurve
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+class TestBSRepricingSession(unittest.TestCase):
+
+    def setUp(self):
+
+        self.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        self.pricer = BlackScholesPricer()
+
+        self.options = [option.Option(strike, exercise.EuropeanExercise(expiry=expiry),
+                                      payoff.VanillaPayoff(direction=direction))
+                        for strike in (80.0, 100.0, 120.0)
+                        for expiry in (date(2025, 1, 1), date(2025, 6, 1), date(2026, 1, 1))
+                        for direction in payoff.Direction]
+
+    def _expected(self, spots, vols):
+
+        markets = [types.Market(s, .05, date(2025, 1, 1), .02, v) 
+                   for s, v in zip(spots, vols)]
+        return (self.pricer.price_batch(self.options, markets), 
+                self.pricer.greeks_batch(self.options, markets))
+
+    def _assert_matches(self, session, spots, vols):
+
+        prices, greeks = self._expected(spots, vols)
+        np.testing.assert_allclose(session.prices, prices, rtol=1e-12, atol=1e-12)
+
+        for name in ('delta', 'gamma', 'vega', 'theta', 'rho'):
+            np.testing.assert_allclose(getattr(session.greeks, name), 
+                                       getattr(greeks, name), rtol=1e-12, atol=1e-12)
+
+    def test_initial_valuation(self):
+
+        session = BSRepricingSession(self.options, self.market)
+        n = len(self.options)
+
+        self.assertEqual(len(session), n)
+        self._assert_matches(session, [100.0] * n, [.25] * n)
+
+    def test_spot_and_vol_ticks(self):
+
+        session = BSRepricingSession(self.options, self.market)
+        n = len(self.options)
+
+        session.update(spot=103.5)
+        self._assert_matches(session, [103.5] * n, [.25] * n)
+
+        session.update(vol=.3)
+        self._assert_matches(session, [103.5] * n, [.3] * n)
+
+        session.update(spot=97.0, vol=.2)
+        self._assert_matches(session, [97.0] * n, [.2] * n)
+
+    def test_row_subset_update(self):
+
+        session = BSRepricingSession(self.options, self.market)
+        n = len(self.options)
+        rows = np.arange(n) % 3 == 0
+
+        before = session.prices.copy()
+        session.update(vol=.4, rows=rows)
+
+        vols = np.where(rows, .4, .25)
+        self._assert_matches(session, [100.0] * n, vols)
+        np.testing.assert_array_equal(session.prices[~rows], before[~rows])
+
+    def test_spot_ticks_with_cash_dividends(self):
+
+        dividends = DividendCurve(cash_times=[.5], cash_amounts=[5.0])
+        market = types.Market(100, .05, date(2025, 1, 1), vol=.25, div_curve=dividends)
+        session = BSRepricingSession(self.options, market)
+
+        for spot in (110.0, 92.0):
+            session.update(spot=spot)
+            moved = types.Market(spot, .05, date(2025, 1, 1), vol=.25, div_curve=dividends)
+            np.testing.assert_allclose(session.prices,
+                                       self.pricer.price_batch(self.options, moved),
+                                       rtol=1e-12, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            session.update(spot=3.0)
+
+    def test_from_params_without_greeks(self):
+
+        params = BSBatchParameters.from_arrays(strikes=[90.0, 110.0], taus=[.5, 1.0], 
+                                               directions=[1, -1], spots=100.0, 
+                                               vols=.2, rates=.01)
+        session = BSRepricingSession(params, greeks=False)
+        session.update(spot=[95.0, 105.0])
+
+        moved = BSBatchParameters.from_arrays(strikes=[90.0, 110.0], taus=[.5, 1.0], 
+                                              directions=[1, -1], spots=[95.0, 105.0], 
+                                              vols=.2, rates=.01)
+        
+        self.assertIsNone(session.greeks)
+        np.testing.assert_allclose(session.prices, self.pricer.price_batch(moved), 
+                                   rtol=1e-12)
+
+    def test_invalid_tick(self):
+
+        session = BSRepricingSession(self.options, self.market)
+
+        with self.assertRaises(ValueError):
+            session.update(spot=-1.0)
+
+        with self.assertRaises(ValueError):
+            session.update(vol=np.nan)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,141 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.scenarios import ScenarioEngine, ScenarioGrid
+from src.pricers.dispatch import BookDispatcher
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.binary_tree import BinaryTreePricer
+from src.pricers.curves import YieldCurve, DividendCurve
+from src.pricers.surface import VolSurface
+from src.book import OptionBook
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+def brute_force(pricer, book, market, grid):
+    # reference: one full repricing per scenario
+    base = pricer.price(book, market)
+    return np.stack([pricer.price(book, market.shocked(*grid.scenario(k))) - base 
+                     for k in range(len(grid))], axis=1)
+
+
+class TestScenarioGrid(unittest.TestCase):
+
+    def test_order(self):
+
+        grid = ScenarioGrid([-.1, 0.0, .1], [-.01, .01], [0.0, .005, .01, .02])
+        self.assertEqual(grid.shape, (3, 2, 4))
+        self.assertEqual(len(grid), 24)
+        self.assertEqual(grid.scenario(9), (0.0, -.01, .005))
+        
+        s, v, r = grid.indices()
+        self.assertEqual((s[9], v[9], r[9]), (1, 0, 1))
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            ScenarioGrid([-1.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            ScenarioGrid([0.0], [])
+
+
+class TestScenarioEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        expiries = (date(2025, 4, 1), date(2025, 9, 1), date(2026, 3, 1))
+        cls.europeans = OptionBook.from_options([
+            option.Option(k, exercise.EuropeanExercise(expiry=e), 
+                          payoff.VanillaPayoff(direction=d))
+            for e in expiries for k in (80.0, 100.0, 125.0) for d in payoff.Direction])
+        
+        american = option.Option(100.0, 
+                                 exercise.AmericanExercise(start=date(2025, 1, 1), 
+                                                           expiry=date(2026, 1, 1)),
+                                 payoff.VanillaPayoff(direction=payoff.Direction.PUT))
+        cls.mixed = OptionBook.from_options(cls.europeans.to_options()[:4] + [american])
+
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+        cls.grid = ScenarioGrid([-.2, 0.0, .15], [-.05, 0.0, .1], [-.01, 0.0, .02])
+        cls.dispatcher = BookDispatcher([BlackScholesPricer(), BinaryTreePricer(steps=50)])
+
+    def test_closed_form_matches_repricing(self):
+
+        result = ScenarioEngine(self.dispatcher).run(self.europeans, self.market, self.grid)
+
+        self.assertEqual(result.pnl.shape, (len(self.europeans), len(self.grid)))
+        np.testing.assert_allclose(result.pnl, brute_force(self.dispatcher, self.europeans, 
+                                                           self.market, self.grid), 
+                                   atol=1e-11)
+
+    def test_curves_and_surface(self):
+
+        strikes, taus = np.meshgrid([70.0, 100.0, 130.0], [.25, 1.0, 2.0])
+        market = types.Market(
+            100, today=date(2025, 1, 1),
+            surface=VolSurface.from_quotes(strikes, taus, .2 + .05 * (strikes < 100)),
+            rate_curve=YieldCurve.from_zero_rates([.5, 2.0], [.03, .045]), 
+            div_curve=DividendCurve(cash_times=[.3, .8], cash_amounts=[1.0, 1.5]))
+        
+        result = ScenarioEngine(self.dispatcher).run(self.europeans, market, self.grid)
+        np.testing.assert_allclose(result.pnl, brute_force(self.dispatcher, self.europeans, 
+                                                           market, self.grid), 
+                                   atol=1e-11)
+
+    def test_generic_rows(self):
+
+        result = ScenarioEngine(self.dispatcher).run(self.mixed, self.market, self.grid)
+        np.testing.assert_allclose(result.pnl, brute_force(self.dispatcher, self.mixed, 
+                                                           self.market, self.grid), 
+                                   atol=1e-11)
+
+    def test_black_scholes_rejects_unsupported_rows(self):
+
+        digital = option.Option(105.0, exercise.EuropeanExercise(expiry=date(2026, 1, 1)),
+                                payoff.DigitalPayoff(direction=payoff.Direction.CALL))
+        book = self.europeans.to_options()[:2] + [digital]
+
+        with self.assertRaises(NotImplementedError):
+            BlackScholesPricer().price(digital, self.market)
+
+        with self.assertRaises(NotImplementedError):
+            ScenarioEngine(BlackScholesPricer()).run(book, self.market, self.grid)
+
+        # the vanilla rows alone still take the closed form
+        result = ScenarioEngine(BlackScholesPricer()).run(book[:2], self.market, self.grid)
+        np.testing.assert_allclose(result.pnl, brute_force(self.dispatcher,
+                                                           OptionBook.from_options(book[:2]),
+                                                           self.market, self.grid),
+                                   atol=1e-11)
+
+    def test_chunks_and_quantities(self):
+
+        quantities = np.arange(len(self.europeans)) - 5.0
+        full = ScenarioEngine(self.dispatcher).run(self.europeans, self.market, self.grid)
+        chunked = ScenarioEngine(self.dispatcher, max_cells=50).run(
+            self.europeans, self.market, self.grid, quantities)
+
+        np.testing.assert_allclose(chunked.pnl, quantities[:, None] * full.pnl, atol=1e-12)
+        np.testing.assert_allclose(chunked.base, quantities * full.base, atol=1e-12)
+        np.testing.assert_allclose(chunked.total(), chunked.pnl.sum(axis=0))
+
+        # unshocked scenario is the middle of the cube
+        np.testing.assert_array_equal(chunked.cube()[:, 1, 1, 1], 0.0)
+
+    def test_processes(self):
+
+        serial = ScenarioEngine(self.dispatcher).run(self.mixed, self.market, self.grid)
+        split = ScenarioEngine(self.dispatcher, processes=2).run(self.mixed, self.market, 
+                                                                 self.grid)
+
+        np.testing.assert_array_equal(split.pnl, serial.pnl)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
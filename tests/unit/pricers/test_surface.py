@@ -0,0 +1,153 @@
+import unittest
+import sys
+import pickle
+import dataclasses
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.surface import VolSurface, SVISlice
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.binary_tree import BinaryTreePricer
+from src.pricers.time_utils import year_fraction
+from src.book import OptionBook
+from src import option, exercise, payoff
+from src.pricers import types
+
+
+def smile(strikes, taus):
+    k = np.log(np.asarray(strikes) / 100.0)
+    return .2 - .05 * k + .1 * k * k + .01 * np.asarray(taus)
+
+
+class TestVolSurface(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        strikes, taus = np.meshgrid(np.linspace(60.0, 140.0, 9), [.25, .5, 1.0, 2.0])
+        cls.strikes, cls.taus = strikes.ravel(), taus.ravel()
+        cls.surface = VolSurface.from_quotes(cls.strikes, cls.taus, 
+                                             smile(cls.strikes, cls.taus))
+
+    def test_reproduces_quotes(self):
+        np.testing.assert_allclose(self.surface.vol(self.strikes, self.taus), 
+                                   smile(self.strikes, self.taus), atol=1e-14)
+
+    def test_linear_in_total_variance(self):
+
+        w = self.surface.total_variance([80.0, 80.0, 80.0], [.5, .75, 1.0])
+        self.assertAlmostEqual(w[1], 0.5 * (w[0] + w[2]), places=14)
+
+    def test_flat_extrapolation(self):
+
+        vol = self.surface.vol
+        self.assertAlmostEqual(float(vol(100.0, .1)), float(vol(100.0, .25)), places=14)
+        self.assertAlmostEqual(float(vol(100.0, 0.0)), float(vol(100.0, .25)), places=14)
+        self.assertAlmostEqual(float(vol(100.0, 10.0)), float(vol(100.0, 2.0)), places=14)
+        self.assertAlmostEqual(float(vol(20.0, 1.0)), float(vol(60.0, 1.0)), places=14)
+
+    def test_broadcast_shape(self):
+        self.assertEqual(self.surface.vol(np.full((3, 1), 100.0), [.5, 1.0]).shape, (3, 2))
+
+    def test_svi(self):
+
+        params = [(.01, .1, -.4, 0.0, .2), (.03, .1, -.3, 0.0, .25)]
+        surface = VolSurface.from_svi([.5, 1.0], params, forwards=[101.0, 102.0])
+
+        k = np.log(90.0 / 101.0)
+        expected = np.sqrt((.01 + .1 * (-.4 * k + np.sqrt(k * k + .04))) / .5)
+        self.assertAlmostEqual(float(surface.vol(90.0, .5)), expected, places=14)
+
+        with self.assertRaises(ValueError):
+            SVISlice(a=-1.0, b=.1, rho=0.0, m=0.0, sigma=.1, log_forward=0.0)
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            VolSurface.from_quotes([90.0, 110.0], 1.0, [.2, -.1])
+
+        with self.assertRaises(ValueError):
+            VolSurface.from_quotes([90.0, 90.0], 1.0, [.2, .25])
+
+        with self.assertRaises(ValueError):
+            VolSurface(np.array([1.0, .5]), self.surface.slices[:2])
+
+    def test_immutable_and_shareable(self):
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.surface.taus = np.ones(4)
+
+        with self.assertRaises(ValueError):
+            self.surface.taus[0] = 1.0
+
+        with self.assertRaises(ValueError):
+            self.surface.slices[0].coefficients[0, 0] = 1.0
+
+        market = types.Market(100, .05, date(2025, 1, 1), surface=self.surface)
+        self.assertIsInstance(hash(market), int)
+
+        copy = pickle.loads(pickle.dumps(market))
+        np.testing.assert_array_equal(copy.vols(self.strikes, self.taus), 
+                                      market.vols(self.strikes, self.taus))
+
+
+class TestSurfacePricing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        strikes, taus = np.meshgrid(np.linspace(60.0, 140.0, 9), [.25, .5, 1.0, 2.0])
+        cls.surface = VolSurface.from_quotes(strikes, taus, smile(strikes, taus))
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, 
+                                  surface=cls.surface)
+        
+        cls.options = [option.Option(k, exercise.EuropeanExercise(expiry=e), 
+                                     payoff.VanillaPayoff(direction=d))
+                       for e in (date(2025, 7, 1), date(2026, 1, 1)) 
+                       for k in (80.0, 100.0, 120.0) for d in payoff.Direction]
+
+    def _flat(self, o: option.Option) -> types.Market:
+        tau = year_fraction(self.market.today, o.exercise.expiry, self.market.basis)
+        return dataclasses.replace(self.market, surface=None, 
+                                   vol=float(self.surface.vol(o.strike, tau)))
+
+    def test_black_scholes(self):
+
+        pricer = BlackScholesPricer()
+        expected = [pricer.price(o, self._flat(o)) for o in self.options]
+
+        np.testing.assert_allclose([pricer.price(o, self.market) for o in self.options], 
+                                   expected, rtol=1e-14)
+        np.testing.assert_allclose(pricer.price_batch(self.options, self.market), 
+                                   expected, rtol=1e-12)
+        np.testing.assert_allclose(
+            pricer.price_batch(OptionBook.from_options(self.options), self.market), 
+            expected, rtol=1e-12)
+        
+    def test_tree(self):
+
+        pricer = BinaryTreePricer(steps=100)
+        o = self.options[0]
+        self.assertAlmostEqual(pricer.price(o, self.market), pricer.price(o, self._flat(o)), 
+                               places=12)
+
+    def test_implied_vol_against_surface_market(self):
+
+        # the trial vol must replace the surface, not be shadowed by it
+        put = self.options[1]
+        for pricer in (BlackScholesPricer(), BinaryTreePricer(steps=100)):
+            with self.subTest(pricer=type(pricer).__name__):
+                price = pricer.price(put, self.market)
+                vol = pricer.implied_vol(put, self.market, price, tol=1e-10)
+
+                self.assertAlmostEqual(vol, float(self._flat(put).vol), places=6)
+                self.assertGreater(pricer.implied_vol(put, self.market, 1.1 * price), vol)
+
+    def test_requires_vol(self):
+
+        with self.assertRaises(ValueError):
+            types.Market(100, .05, date(2025, 1, 1)).vols(100.0, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,60 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.pricers.time_utils import year_fraction, year_fractions
+from src.calendars import BusinessCalendar, as_ordinals
+
+
+class TestYearFractions(unittest.TestCase):
+
+    def test_matches_scalar_actual(self):
+
+        rng = np.random.default_rng(0)
+        start = date(2020, 1, 1).toordinal() + rng.integers(0, 2000, 500)
+        end = start + rng.integers(-100, 1000, 500)
+
+        for basis in ('ACT/365', 'ACT/360', '30/360', 'BUS/252'):
+            expected = [year_fraction(date.fromordinal(int(a)), date.fromordinal(int(b)), 
+                                      basis) for a, b in zip(start, end)]
+            
+            with self.subTest(basis=basis):
+                np.testing.assert_allclose(year_fractions(start, end, basis), expected)
+
+    def test_thirty_360(self):
+
+        pairs = [((2025, 1, 31), (2025, 3, 31), 60), ((2025, 2, 28), (2025, 3, 31), 33),
+                 ((2024, 12, 15), (2025, 1, 15), 30), ((2025, 1, 1), (2026, 1, 1), 360)]
+        
+        for d0, d1, days in pairs:
+            with self.subTest(start=d0, end=d1):
+                self.assertAlmostEqual(year_fraction(date(*d0), date(*d1), '30/360'), 
+                                       days / 360)
+
+    def test_broadcast_dates_and_ordinals(self):
+
+        expiries = [date(2025, 7, 1), date(2026, 1, 1)]
+        
+        np.testing.assert_allclose(year_fractions(date(2025, 1, 1), expiries, 'ACT/365'),
+                                   [181 / 365, 1.0])
+        np.testing.assert_array_equal(as_ordinals(expiries), 
+                                      [d.toordinal() for d in expiries])
+
+    def test_unsupported_basis(self):
+
+        with self.assertRaises(ValueError):
+            year_fractions(date(2025, 1, 1), date(2026, 1, 1), 'ACT/ACT')
+
+    def test_bus_252_uses_calendar(self):
+
+        calendar = BusinessCalendar(holidays=[date(2025, 12, 25)])
+        self.assertAlmostEqual(
+            float(year_fractions(date(2025, 12, 22), date(2025, 12, 29), 'BUS/252', 
+                                 calendar)), 4 / 252)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.append('src')
+
+from benchmarks.harness import BenchmarkResult, measure, save, load, compare
+from benchmarks.suites import SUITES
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_measure(self):
+
+        result = measure('noop', lambda: None, items=10, min_time=.001, repeat=2, n=10)
+
+        self.assertGreater(result.seconds, 0.0)
+        self.assertLessEqual(result.seconds, result.median)
+        self.assertEqual(result.params, {'n': 10})
+        self.assertAlmostEqual(result.throughput, 10 / result.seconds)
+
+    def test_save_load_compare(self):
+
+        baseline = [BenchmarkResult('a', 1.0, 1.0), BenchmarkResult('b', 2.0, 2.0), 
+                    BenchmarkResult('gone', 1.0, 1.0)]
+        current = [BenchmarkResult('a', 1.05, 1.1), BenchmarkResult('b', 2.5, 2.5), 
+                   BenchmarkResult('new', 9.0, 9.0)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = os.path.join(tmp, 'base.json'), os.path.join(tmp, 'current.json')
+            save(baseline, paths[0])
+            save(current, paths[1])
+
+            regressions = compare(load(paths[0]), load(paths[1]), threshold=.10)
+
+        self.assertEqual([r.name for r in regressions], ['b'])
+        self.assertAlmostEqual(regressions[0].ratio, 1.25)
+
+
+    def test_kernel_suite_registered(self):
+
+        results = SUITES['kernels'](quick=True)
+
+        self.assertTrue(all(r.name.startswith('kernels.') for r in results))
+        self.assertTrue(all(r.params['speedup'] > 0 for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
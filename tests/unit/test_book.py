@@ -0,0 +1,122 @@
+import unittest
+import sys
+from datetime import date
+import numpy as np
+
+sys.path.append('src')
+
+from src.book import OptionBook
+from src.pricers.black_scholes import BlackScholesPricer
+from src.pricers.monte_carlo import MonteCarloPricer
+from src import option, exercise, payoff
+from src.exercise import ExerciseType
+from src.payoff import PayoffType, Direction
+from src.pricers import types
+
+
+class TestOptionBook(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.market = types.Market(100, .05, date(2025, 1, 1), .02, .25)
+
+        euro = exercise.EuropeanExercise(expiry=date(2026, 1, 1))
+        amer = exercise.AmericanExercise(start=date(2025, 1, 1), expiry=date(2025, 7, 1))
+        berm = exercise.BermudanExercise(dates=(date(2025, 4, 1), date(2025, 10, 1)))
+
+        call, put = (payoff.VanillaPayoff(direction=Direction.CALL), 
+                     payoff.VanillaPayoff(direction=Direction.PUT))
+        asian = payoff.AsianArithmeticPayoff(direction=Direction.CALL)
+
+        cls.options = [option.Option(90.0, euro, call), option.Option(100.0, amer, put),
+                       option.Option(110.0, euro, put), option.Option(95.0, euro, asian),
+                       option.Option(105.0, berm, put), option.Option(100.0, euro, call)]
+        
+        cls.book = OptionBook.from_options(cls.options)
+
+    def test_round_trip(self):
+
+        self.assertEqual(len(self.book), len(self.options))
+        self.assertEqual(self.book.to_options(), self.options)
+        self.assertEqual(list(self.book), self.options)
+
+    def test_columns(self):
+
+        np.testing.assert_array_equal(self.book.strikes, 
+                                      [90.0, 100.0, 110.0, 95.0, 105.0, 100.0])
+        np.testing.assert_array_equal(self.book.directions, [1, -1, -1, 1, -1, 1])
+        np.testing.assert_array_equal(
+            self.book.exercise_types, 
+            [ExerciseType.EUROPEAN.value, ExerciseType.AMERICAN.value,
+             ExerciseType.EUROPEAN.value, ExerciseType.EUROPEAN.value, 
+             ExerciseType.BERMUDAN.value, ExerciseType.EUROPEAN.value])
+        self.assertEqual(self.book.payoff_types[3], PayoffType.ASIAN_ARITHMETIC.value)
+        self.assertEqual(self.book.starts[4], date(2025, 4, 1).toordinal())
+        self.assertEqual(self.book.expiries[4], date(2025, 10, 1).toordinal())
+
+        # templates are interned
+        self.assertEqual(len(self.book.payoffs), 3)
+        self.assertEqual(len(self.book.exercises), 3)
+
+    def test_columns_read_only(self):
+
+        with self.assertRaises(ValueError):
+            self.book.strikes[0] = 1.0
+
+    def test_slices_are_views(self):
+
+        head = self.book[1:4]
+
+        self.assertTrue(np.shares_memory(head.strikes, self.book.strikes))
+        self.assertEqual(head.to_options(), self.options[1:4])
+
+    def test_grouped(self):
+
+        book, order, groups = self.book.grouped('exercise_types', 'directions')
+
+        self.assertEqual(book.to_options(), [self.options[i] for i in order])
+        self.assertEqual(sum(s.stop - s.start for _, s in groups), len(self.book))
+
+        for (ex_type, direction), rows in groups:
+            group = book[rows]
+            self.assertTrue(np.shares_memory(group.strikes, book.strikes))
+            self.assertTrue(np.all(group.exercise_types == ex_type))
+            self.assertTrue(np.all(group.directions == direction))
+
+        self.assertEqual(len(groups), 4)
+
+    def test_supported_mask(self):
+
+        np.testing.assert_array_equal(
+            self.book.supported_mask(BlackScholesPricer(), self.market), 
+            [True, False, True, False, False, True])
+        np.testing.assert_array_equal(
+            self.book.supported_mask(MonteCarloPricer(), self.market), 
+            [True, False, True, True, False, True])
+
+    def test_black_scholes_prices_book(self):
+
+        pricer = BlackScholesPricer()
+        mask = self.book.supported_mask(pricer, self.market)
+        subset = self.book[mask]
+
+        np.testing.assert_allclose(
+            pricer.price_batch(subset, self.market), 
+            pricer.price_batch(subset.to_options(), self.market), rtol=1e-14)
+        
+        with self.assertRaises(NotImplementedError):
+            pricer.price_batch(self.book, self.market)
+
+    def test_unsupported_payoff(self):
+
+        class OtherPayoff(payoff.VanillaPayoff):
+            pass
+
+        with self.assertRaises(ValueError):
+            OptionBook.from_options([option.Option(1.0, self.options[0].exercise, 
+                                                   OtherPayoff(direction=Direction.CALL))])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -0,0 +1,65 @@
+import unittest
+import sys
+from datetime import date, timedelta
+import numpy as np
+
+sys.path.append('src')
+
+from src.calendars import BusinessCalendar
+from src import exercise
+
+
+class TestBusinessCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(holidays=[date(2025, 12, 25), date(2026, 1, 1)])
+
+    def test_counts_match_brute_force(self):
+
+        start, end = date(2025, 12, 1), date(2026, 3, 1)
+        days = [start + timedelta(k) for k in range((end - start).days)]
+        expected = sum(d.weekday() < 5 and d not in (date(2025, 12, 25), date(2026, 1, 1)) 
+                       for d in days)
+
+        self.assertEqual(int(self.calendar.business_days(start, end)), expected)
+        self.assertEqual(int(self.calendar.business_days(end, start)), -expected)
+
+    def test_window_grows_on_demand(self):
+
+        far = [date(1990, 1, 1), date(2090, 1, 1)]
+        self.assertTrue(np.all(self.calendar.is_business_day(far) 
+                               == [d.weekday() < 5 for d in far]))
+
+    def test_adjust(self):
+
+        saturday, holiday = date(2025, 5, 31), date(2025, 12, 25)
+        dates = [saturday, holiday, date(2025, 6, 2)]
+
+        def as_dates(ordinals):
+            return [date.fromordinal(int(o)) for o in ordinals]
+        
+        self.assertEqual(as_dates(self.calendar.adjust(dates, 'following')), 
+                         [date(2025, 6, 2), date(2025, 12, 26), date(2025, 6, 2)])
+        self.assertEqual(as_dates(self.calendar.adjust(dates, 'preceding')), 
+                         [date(2025, 5, 30), date(2025, 12, 24), date(2025, 6, 2)])
+        self.assertEqual(as_dates(self.calendar.adjust(dates, 'modified_following')), 
+                         [date(2025, 5, 30), date(2025, 12, 26), date(2025, 6, 2)])
+        
+        with self.assertRaises(ValueError):
+            self.calendar.adjust(dates, 'nearest')
+
+    def test_exercise_adjustments(self):
+
+        bermudan = exercise.BermudanExercise(dates=(date(2025, 5, 31), date(2025, 6, 2)))
+        self.assertEqual(bermudan.adjusted_exercise_dates(self.calendar), 
+                         (date(2025, 6, 2),))
+
+        american = exercise.AmericanExercise(start=date(2025, 12, 22), 
+                                             expiry=date(2025, 12, 28))
+        self.assertEqual(american.adjusted_exercise_dates(self.calendar), 
+                         (date(2025, 12, 22), date(2025, 12, 23), date(2025, 12, 24), 
+                          date(2025, 12, 26)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity = 2)
@@ -1,8 +1,11 @@
 import unittest
 import sys
+import numpy as np
 
 sys.path.append('src')
-from src.payoff import PayoffFactory, Direction, PayoffType, VanillaPayoff, PayoffContext
+from src.payoff import (PayoffFactory, Direction, PayoffType, VanillaPayoff, PayoffContext,
+                        AsianArithmeticPayoff, AsianGeometricPayoff, LookbackPayoff, 
+                        DigitalPayoff, BarrierPayoff, BarrierType)
 
 class TestPayoffContext(unittest.TestCase):
 
@@ -61,5 +64,115 @@ class TestPayoffVanilla(unittest.TestCase):
         self.assertEqual(payoff.value(strike=99.0, ctx = self.payoff_context), 0)
 
 
+class TestPayoffAsianArithmetic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.factory = PayoffFactory()
+        cls.payoff_context = PayoffContext(100.0, (90.0, 100.0, 110.0, 104.0))
+
+    def test_make_asian(self):
+
+        payoff = self.factory.create(PayoffType.ASIAN_ARITHMETIC, Direction.CALL)
+        self.assertTrue(isinstance(payoff, AsianArithmeticPayoff))
+
+    def test_payoff_asian(self):
+
+        call = self.factory.create(PayoffType.ASIAN_ARITHMETIC, Direction.CALL)
+        put = self.factory.create(PayoffType.ASIAN_ARITHMETIC, Direction.PUT)
+
+        self.assertEqual(call.value(strike=100.0, ctx = self.payoff_context), 1.0)
+        self.assertEqual(put.value(strike=100.0, ctx = self.payoff_context), 0.0)
+        self.assertEqual(put.value(strike=110.0, ctx = self.payoff_context), 9.0)
+
+    def test_missing_path(self):
+
+        call = self.factory.create(PayoffType.ASIAN_ARITHMETIC, Direction.CALL)
+
+        with self.assertRaises(ValueError):
+            call.value(strike=100.0, ctx = PayoffContext(100.0, None))
+
+
+class TestPayoffValues(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.factory = PayoffFactory()
+        cls.paths = np.array([[100.0, 110.0, 125.0, 120.0],
+                              [100.0, 95.0, 85.0, 90.0],
+                              [100.0, 104.0, 98.0, 101.0]])
+
+    def test_invalid_arrays(self):
+
+        payoff = VanillaPayoff(direction=Direction.CALL)
+
+        with self.assertRaises(ValueError):
+            payoff.values(100.0, [100.0, -1.0])
+
+        with self.assertRaises(ValueError):
+            payoff.values(100.0, [100.0, np.nan])
+
+        with self.assertRaises(ValueError):
+            payoff.values(100.0, np.ones((2, 2, 2)))
+
+    def test_values_match_scalar_value(self):
+
+        payoffs = [VanillaPayoff(Direction.CALL), 
+                   AsianArithmeticPayoff(Direction.PUT),
+                   AsianGeometricPayoff(Direction.CALL),
+                   LookbackPayoff(Direction.CALL),
+                   LookbackPayoff(Direction.PUT),
+                   DigitalPayoff(Direction.PUT, cash=2.0),
+                   BarrierPayoff(Direction.CALL, 120.0, BarrierType.UP_AND_OUT),
+                   BarrierPayoff(Direction.PUT, 90.0, BarrierType.DOWN_AND_IN)]
+
+        for payoff in payoffs:
+            values = payoff.values(100.0, self.paths)
+            
+            for path, value in zip(self.paths, values):
+                ctx = PayoffContext(float(path[-1]), tuple(float(x) for x in path))
+                with self.subTest(payoff=payoff):
+                    self.assertAlmostEqual(payoff.value(100.0, ctx), value, places=12)
+
+    def test_terminal_spots(self):
+
+        call = VanillaPayoff(direction=Direction.CALL)
+        np.testing.assert_array_equal(call.values([90.0, 100.0, 110.0], [100.0] * 3), 
+                                      [10.0, 0.0, 0.0])
+
+    def test_barrier_values(self):
+
+        up_out = BarrierPayoff(Direction.CALL, 120.0, BarrierType.UP_AND_OUT)
+        up_in = BarrierPayoff(Direction.CALL, 120.0, BarrierType.UP_AND_IN)
+        vanilla = VanillaPayoff(Direction.CALL)
+
+        np.testing.assert_array_equal(up_out.values(100.0, self.paths), [0.0, 0.0, 1.0])
+        np.testing.assert_array_equal(up_out.values(100.0, self.paths) 
+                                      + up_in.values(100.0, self.paths),
+                                      vanilla.values(100.0, self.paths))
+        
+    def test_lookback_values(self):
+
+        np.testing.assert_array_equal(LookbackPayoff(Direction.CALL).values(100.0, self.paths), 
+                                      [25.0, 0.0, 4.0])
+        np.testing.assert_array_equal(LookbackPayoff(Direction.PUT).values(100.0, self.paths), 
+                                      [0.0, 15.0, 2.0])
+
+    def test_factory(self):
+
+        cases = {PayoffType.ASIAN_GEOMETRIC: ({}, AsianGeometricPayoff),
+                 PayoffType.LOOKBACK: ({}, LookbackPayoff),
+                 PayoffType.DIGITAL: ({'cash': 5.0}, DigitalPayoff),
+                 PayoffType.BARRIER: ({'barrier': 80.0, 
+                                       'barrier_type': BarrierType.DOWN_AND_OUT}, 
+                                      BarrierPayoff)}
+        
+        for kind, (kwargs, cls) in cases.items():
+            self.assertIsInstance(self.factory.create(kind, Direction.PUT, **kwargs), cls)
+
+        with self.assertRaises(ValueError):
+            self.factory.create(PayoffType.BARRIER, Direction.PUT)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file